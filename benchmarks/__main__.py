@@ -0,0 +1,79 @@
+"""
+Run the offline benchmark suite.
+
+Usage:
+    python -m benchmarks                 # compare against benchmarks/baselines/suite.json
+    python -m benchmarks --save          # record a new baseline
+    python -m benchmarks -k naver        # only cases whose name contains "naver"
+
+Exits with status 1 when a case is slower than the baseline by more
+than ``--tolerance`` (default 100%, i.e. twice as slow; loopback HTTP cases
+vary by ~50% between runs). Baselines are machine-specific; record one on the
+machine that runs the comparison.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+
+def _isolate_environment(cache_dir):
+    """Keep caches, quotas and rate limits of the benchmark away from real runs."""
+    os.environ["STOCKNEWS_CACHE_DIR"] = cache_dir
+    os.environ["NO_PROXY"] = "127.0.0.1,localhost"
+    os.environ["NAVER_RPS"] = "1000000"
+    os.environ["NAVER_DAILY_LIMIT"] = "100000000"
+    os.environ["NEWSAPI_DAILY_LIMIT"] = "100000000"
+    os.environ.setdefault("NEWSAPI_KEY", "bench")
+    os.environ.setdefault("NAVER_CLIENT_ID", "bench")
+    os.environ.setdefault("NAVER_CLIENT_SECRET", "bench")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark suite")
+    parser.add_argument("--save", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--baseline", help="baseline JSON path")
+    parser.add_argument("--repeat", type=int, default=9)
+    parser.add_argument("--tolerance", type=float, default=1.0)
+    parser.add_argument("-k", dest="pattern", default="", help="substring filter on case names")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="stocknews-bench-") as cache_dir:
+        _isolate_environment(cache_dir)
+        from .stub_server import StubServer
+        from .suite import BASELINE_PATH, build_cases, compare, load_baseline, run_cases, save_baseline
+
+        path = args.baseline or BASELINE_PATH
+        with StubServer() as server:
+            cases = [c for c in build_cases(server) if args.pattern in c.name]
+            results = run_cases(cases, repeat=args.repeat)
+            requests = server.requests
+
+    print(f"📊 벤치마크 {len(results)}건 (스텁 요청 {requests}회)")
+    for name, timing in results.items():
+        print(f"  {name:<40} {timing['best_ms']:9.3f} ms (중앙값 {timing['median_ms']:.3f})")
+
+    if args.save:
+        save_baseline(results, path)
+        print(f"💾 기준값 저장: {path}")
+        return 0
+
+    try:
+        baseline = load_baseline(path)
+    except (OSError, ValueError):
+        print(f"⚠️ 기준값 없음: {path} (--save로 생성)")
+        return 0
+
+    regressions = compare(results, baseline, tolerance=args.tolerance)
+    if regressions:
+        print(f"❌ 성능 저하 {len(regressions)}건 (허용 {args.tolerance:.0%})")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("✅ 기준값 대비 성능 저하 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Microbenchmark: dict news items + per-call strptime vs NewsItem + memoized parse.
+
+Usage:
+    python -m benchmarks.bench_news_item [--items 20000] [--repeat 5]
+
+Builds the same synthetic feed entries both ways and reports time per
+item and peak allocated memory (tracemalloc). Dates repeat across
+entries the way they do across tickers in a real run.
+"""
+
+import argparse
+import random
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from src.collectors.news_item import NewsItem
+from src.utils.dates import parse_datetime
+
+FORMATS = [
+    "%a, %d %b %Y %H:%M:%S GMT",
+    "%a, %d %b %Y %H:%M:%S +0000",
+    "%Y-%m-%dT%H:%M:%SZ",
+]
+
+
+def make_entries(count, distinct_dates=500, seed=7):
+    """Synthetic feed entries with ``distinct_dates`` repeating timestamps."""
+    rng = random.Random(seed)
+    base = datetime(2025, 4, 12, tzinfo=timezone.utc)
+    dates = [
+        (base - timedelta(minutes=rng.randrange(60 * 24 * 3))).strftime(rng.choice(FORMATS))
+        for _ in range(distinct_dates)
+    ]
+    return [
+        {
+            "title": f"Headline {i}",
+            "link": f"https://example.com/news/{i}",
+            "published": rng.choice(dates),
+            "summary": "Lorem ipsum dolor sit amet " * 4,
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_items(entries):
+    """Previous shape: a dict per item with the date reparsed on every entry."""
+    items = []
+    for entry in entries:
+        raw = entry["published"]
+        date = "N/A"
+        for fmt in ("%a, %d %b %Y %H:%M:%S %Z", "%a, %d %b %Y %H:%M:%S %z", "%Y-%m-%dT%H:%M:%SZ"):
+            try:
+                date = datetime.strptime(raw, fmt).strftime("%Y-%m-%d")
+                break
+            except ValueError:
+                continue
+        item = dict(entry)
+        items.append({
+            "title": item["title"],
+            "link": item["link"],
+            "snippet": item["summary"],
+            "date": date,
+        })
+    return items
+
+
+def news_items(entries):
+    """Current shape: NewsItem with the shared memoized parser."""
+    return [
+        NewsItem.from_raw(e["title"], e["link"], e["published"], e["summary"], "bench")
+        for e in entries
+    ]
+
+
+def peak_memory(fn, entries):
+    tracemalloc.start()
+    result = fn(entries)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    entries = make_entries(args.items)
+    legacy = legacy_items(entries)
+    current = news_items(entries)
+    mismatched = sum(a["date"] != b.date for a, b in zip(legacy, current))
+
+    print(f"📊 뉴스 항목 {args.items}개 × {args.repeat}회")
+    for name, fn in (("dict + strptime", legacy_items), ("NewsItem + cache", news_items)):
+        parse_datetime.cache_clear()
+        best = min(timeit.repeat(lambda: fn(entries), number=1, repeat=args.repeat))
+        peak = peak_memory(fn, entries)
+        print(
+            f"  {name:<18} {best / args.items * 1e6:7.2f} µs/항목  "
+            f"최대 메모리 {peak / 1024 / 1024:6.2f} MiB"
+        )
+    print(f"  날짜 불일치: {mismatched}건")
+
+
+if __name__ == "__main__":
+    main()
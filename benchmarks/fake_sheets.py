@@ -0,0 +1,168 @@
+"""
+In-memory stand-in for gspread worksheets with API call accounting.
+
+Implements the subset of ``gspread.Worksheet`` the pipelines use
+(``col_values``, ``get``, ``batch_get``, ``batch_update``, ``update``)
+and records every call against the Sheets per-user quota of 60 read and
+60 write requests per minute.
+"""
+
+import re
+import threading
+import time
+from collections import Counter, deque
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.sheet_diff import column_number
+
+READ_LIMIT_PER_MINUTE = 60
+WRITE_LIMIT_PER_MINUTE = 60
+
+_A1_RE = re.compile(r"^([A-Z]+)(\d*)(?::([A-Z]+)(\d*))?$")
+
+
+def parse_range(a1_range: str) -> Tuple[int, int, Optional[int], int]:
+    """``A2:D31`` → (first_row, first_col, last_row or None, last_col)."""
+    match = _A1_RE.match(a1_range.split("!")[-1].replace("$", ""))
+    if not match:
+        raise ValueError(f"Unsupported range: {a1_range}")
+    first_col, first_row, last_col, last_row = match.groups()
+    if last_col is None:
+        last_col, last_row = first_col, first_row
+    return (
+        int(first_row or 1),
+        column_number(first_col),
+        int(last_row) if last_row else None,
+        column_number(last_col),
+    )
+
+
+class QuotaMeter:
+    """Counts read/write requests and the busiest 60-second window of each."""
+
+    def __init__(self, sleep_per_call: float = 0.0):
+        self.sleep_per_call = sleep_per_call
+        self.calls: Counter = Counter()
+        self.reads = 0
+        self.writes = 0
+        self.peak = {"read": 0, "write": 0}
+        self.over_quota = {"read": 0, "write": 0}
+        self._windows = {"read": deque(), "write": deque()}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, kind: str) -> None:
+        if self.sleep_per_call:
+            time.sleep(self.sleep_per_call)
+        limit = READ_LIMIT_PER_MINUTE if kind == "read" else WRITE_LIMIT_PER_MINUTE
+        now = time.monotonic()
+        with self._lock:
+            self.calls[method] += 1
+            if kind == "read":
+                self.reads += 1
+            else:
+                self.writes += 1
+            window = self._windows[kind]
+            window.append(now)
+            while window and now - window[0] > 60:
+                window.popleft()
+            self.peak[kind] = max(self.peak[kind], len(window))
+            if len(window) > limit:
+                self.over_quota[kind] += 1
+
+    def summary(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "reads": self.reads,
+                "writes": self.writes,
+                "calls": dict(self.calls),
+                "peak_per_minute": dict(self.peak),
+                "over_quota": dict(self.over_quota),
+            }
+
+
+class FakeWorksheet:
+    """Sparse cell grid behaving like a gspread worksheet."""
+
+    def __init__(self, title: str, meter: QuotaMeter, rows: Optional[List[List[str]]] = None):
+        self.title = title
+        self.meter = meter
+        self.cells: Dict[Tuple[int, int], str] = {}
+        # 실제 시트처럼 기록된 적 있는 마지막 행까지를 범위로 봄
+        self.row_count = 0
+        self._lock = threading.Lock()
+        if rows:
+            self._write("A1", rows)
+
+    def _read(self, first_row, first_col, last_row, last_col) -> List[List[str]]:
+        last_row = last_row or self.row_count
+        rows = []
+        for r in range(first_row, last_row + 1):
+            row = [self.cells.get((r, c), "") for c in range(first_col, last_col + 1)]
+            while row and row[-1] == "":
+                row.pop()
+            rows.append(row)
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    def _write(self, a1_range: str, values: List[List[str]]) -> None:
+        first_row, first_col, _, _ = parse_range(a1_range)
+        for i, row in enumerate(values):
+            for j, value in enumerate(row):
+                key = (first_row + i, first_col + j)
+                if value in ("", None):
+                    self.cells.pop(key, None)
+                else:
+                    self.cells[key] = str(value)
+        self.row_count = max(self.row_count, first_row + len(values) - 1)
+
+    def col_values(self, col: int) -> List[str]:
+        self.meter.record("col_values", "read")
+        with self._lock:
+            values = [self.cells.get((r, col), "") for r in range(1, self.row_count + 1)]
+        while values and values[-1] == "":
+            values.pop()
+        return values
+
+    def get(self, a1_range: str) -> List[List[str]]:
+        self.meter.record("get", "read")
+        with self._lock:
+            return self._read(*parse_range(a1_range))
+
+    def batch_get(self, ranges: List[str]) -> List[List[List[str]]]:
+        self.meter.record("batch_get", "read")
+        with self._lock:
+            return [self._read(*parse_range(a1_range)) for a1_range in ranges]
+
+    def batch_update(self, data: List[Dict[str, object]], **kwargs) -> None:
+        self.meter.record("batch_update", "write")
+        with self._lock:
+            for entry in data:
+                self._write(entry["range"], entry["values"])
+
+    def update(self, a1_range, values=None, **kwargs) -> None:
+        # gspread 6 accepts update(values, range_name) as well as update(range_name, values)
+        if not isinstance(a1_range, str):
+            a1_range, values = values, a1_range
+        self.meter.record("update", "write")
+        with self._lock:
+            self._write(a1_range, values)
+
+
+class FakeSpreadsheet:
+    """Worksheets by title sharing one quota meter."""
+
+    def __init__(self, meter: Optional[QuotaMeter] = None):
+        self.meter = meter or QuotaMeter()
+        self.sheets: Dict[str, FakeWorksheet] = {}
+
+    def add_worksheet(self, title: str, rows: Optional[List[List[str]]] = None) -> FakeWorksheet:
+        self.sheets[title] = FakeWorksheet(title, self.meter, rows)
+        return self.sheets[title]
+
+    def load_sheet(self, sheet_id=None, worksheet_name: str = "kr") -> FakeWorksheet:
+        """Drop-in replacement for ``load_sheet(sheet_id, worksheet_name)``."""
+        self.meter.record("open", "read")
+        if worksheet_name not in self.sheets:
+            self.add_worksheet(worksheet_name)
+        return self.sheets[worksheet_name]
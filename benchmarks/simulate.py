@@ -0,0 +1,220 @@
+"""
+End-to-end scale simulator for the kr / global / CNBC pipelines.
+
+Usage:
+    python -m benchmarks.simulate --scales 100,1000,10000 [--latency 0.05]
+        [--error-rate 0.02] [--items 20] [--sheet-latency 0.1]
+        [--llm-latency 1.0] [--pipelines kr,global,cnbc] [--concurrent]
+        [--budget SECONDS] [--output sim.json]
+
+Each scale runs in a fresh process with:
+    - ``load_sheet`` swapped for an in-memory ``FakeSpreadsheet`` holding
+      ``scale`` tickers per sheet, counting Sheets calls against quota
+    - upstream HTTP served by ``SyntheticFeeds`` on the shared session
+    - Claude calls answered by a local ``LLMStub``
+
+Rate limits and daily quotas (Naver, NewsAPI, Claude) stay at their
+configured values, so the report shows where they bind. Reported per
+pipeline: wall time, throughput, Sheets
+reads/writes and quota overruns, upstream requests per host, LLM calls
+and peak RSS of the process. With ``--concurrent`` the selected pipelines
+run together through ``PipelineScheduler`` and are reported as one row
+plus the per-pipeline timeline. ``--budget`` runs under a run deadline
+and reports the tickers that missed it.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_scale(config):
+    """Run the selected pipelines once at ``config['scale']`` tickers (in a worker process)."""
+    cache_dir = tempfile.mkdtemp(prefix="stocknews-sim-")
+    os.environ["STOCKNEWS_CACHE_DIR"] = cache_dir
+    os.environ["NO_PROXY"] = "127.0.0.1,localhost"
+    os.environ.setdefault("NEWSAPI_KEY", "sim")
+    os.environ.setdefault("NAVER_CLIENT_ID", "sim")
+    os.environ.setdefault("NAVER_CLIENT_SECRET", "sim")
+    os.environ.setdefault("CLAUDE_API_KEY", "sim")
+
+    from .fake_sheets import FakeSpreadsheet, QuotaMeter
+    from .synthetic import LLMStub, SyntheticFeeds
+
+    llm = LLMStub(latency=config["llm_latency"]).start()
+    os.environ["ANTHROPIC_BASE_URL"] = llm.url
+
+    import global_news
+    import kr_news
+    import news_cnbc
+    from src.utils import deadline, transport
+
+    feeds = SyntheticFeeds(
+        latency=config["latency"],
+        error_rate=config["error_rate"],
+        items=config["items"],
+        seed=config["scale"]
+    )
+    session = transport.get_session()
+    session.mount("https://", feeds)
+    session.mount("http://", feeds)
+
+    scale = config["scale"]
+    spreadsheet = FakeSpreadsheet(QuotaMeter(config["sheet_latency"]))
+    spreadsheet.add_worksheet("kr", [["종목명"]] + [[f"종목{i:05d}"] for i in range(scale)])
+    spreadsheet.add_worksheet("global", [["Ticker"]] + [[f"S{i:05d}"] for i in range(scale)])
+    spreadsheet.add_worksheet("cnbc")
+    for module in (kr_news, global_news, news_cnbc):
+        module.load_sheet = spreadsheet.load_sheet
+
+    pipelines = {
+        "kr": (lambda: kr_news.run_kr_news_summary(None), scale),
+        "global": (lambda: global_news.run_global_news_summary(None), scale),
+        "cnbc": (news_cnbc.update_cnbc_sheet, config["items"]),
+    }
+
+    runs = [(name,) + pipelines[name] for name in config["pipelines"]]
+    if config.get("concurrent"):
+        from src.utils.scheduler import PipelineScheduler, Stage
+
+        scheduler = PipelineScheduler([Stage(name, fn) for name, fn, _ in runs])
+        runs = [("+".join(config["pipelines"]), scheduler.run, sum(units for _, _, units in runs))]
+
+    run_deadline = deadline.start_run(config["budget"]) if config.get("budget") else None
+
+    results = []
+    for name, fn, units in runs:
+        sheets_before = spreadsheet.meter.summary()
+        upstream_before = dict(feeds.requests)
+        errors_before = sum(feeds.errors.values())
+        llm_before = llm.calls
+
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        wall = time.perf_counter() - started
+
+        sheets = spreadsheet.meter.summary()
+        results.append({
+            "scale": scale,
+            "pipeline": name,
+            "units": units,
+            "wall_s": round(wall, 3),
+            "throughput_per_s": round(units / wall, 2) if wall else None,
+            "sheet_reads": sheets["reads"] - sheets_before["reads"],
+            "sheet_writes": sheets["writes"] - sheets_before["writes"],
+            "upstream_requests": {
+                host: count - upstream_before.get(host, 0)
+                for host, count in feeds.requests.items()
+                if count - upstream_before.get(host, 0)
+            },
+            "upstream_errors": sum(feeds.errors.values()) - errors_before,
+            "llm_calls": llm.calls - llm_before,
+        })
+
+    if run_deadline:
+        for result in results:
+            result["deadline_missed"] = {
+                pipeline: len(tickers) for pipeline, tickers in run_deadline.missed.items()
+                if pipeline in result["pipeline"].split("+")
+            }
+
+    if config.get("concurrent"):
+        results[0]["timeline"] = {
+            name: [round(stage.started - scheduler.started, 2), round(stage.finished - scheduler.started, 2)]
+            for name, stage in scheduler.stages.items()
+        }
+
+    summary = spreadsheet.meter.summary()
+    for result in results:
+        result["peak_rss_mb"] = peak_rss_mb()
+        result["sheet_peak_per_minute"] = summary["peak_per_minute"]
+        result["sheet_over_quota"] = summary["over_quota"]
+    llm.stop()
+    return results
+
+
+def print_report(results):
+    print("📈 규모별 시뮬레이션 결과 (처리량 = 단위 / 실행 시간)")
+    print(
+        f"  {'규모':>6} {'파이프라인':<8} {'시간(s)':>9} {'처리량/s':>9} "
+        f"{'시트 R/W':>10} {'쿼터초과':>8} {'업스트림':>8} {'오류':>5} {'LLM':>5} {'RSS(MB)':>8}"
+    )
+    for r in results:
+        over = r["sheet_over_quota"]["read"] + r["sheet_over_quota"]["write"]
+        print(
+            f"  {r['scale']:>6} {r['pipeline']:<8} {r['wall_s']:>9.2f} "
+            f"{r['throughput_per_s'] or 0:>9.2f} {r['sheet_reads']:>4}/{r['sheet_writes']:<5} {over:>8} "
+            f"{sum(r['upstream_requests'].values()):>8} {r['upstream_errors']:>5} {r['llm_calls']:>5} "
+            f"{r['peak_rss_mb'] if r['peak_rss_mb'] is not None else '-':>8}"
+        )
+        for pipeline, missed in r.get("deadline_missed", {}).items():
+            print(f"         ⌛ {pipeline} 마감 초과 {missed}개 종목")
+        for name, (start, end) in r.get("timeline", {}).items():
+            print(f"         └ {name:<8} {start:7.2f}s → {end:7.2f}s ({end - start:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scale simulator for the news pipelines")
+    parser.add_argument("--scales", default="100,1000", help="comma-separated ticker counts")
+    parser.add_argument("--pipelines", default="kr,global,cnbc")
+    parser.add_argument("--latency", type=float, default=0.05, help="mean upstream latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="upstream 503 probability")
+    parser.add_argument("--items", type=int, default=20, help="articles per query / feed")
+    parser.add_argument("--sheet-latency", type=float, default=0.1, help="latency per Sheets call (s)")
+    parser.add_argument("--llm-latency", type=float, default=1.0, help="latency per Claude call (s)")
+    parser.add_argument("--concurrent", action="store_true", help="run the pipelines together via the scheduler")
+    parser.add_argument("--budget", type=float, help="run deadline in seconds (default: no deadline)")
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    configs = [
+        {
+            "scale": int(scale),
+            "pipelines": args.pipelines.split(","),
+            "latency": args.latency,
+            "error_rate": args.error_rate,
+            "items": args.items,
+            "sheet_latency": args.sheet_latency,
+            "llm_latency": args.llm_latency,
+            "concurrent": args.concurrent,
+            "budget": args.budget,
+        }
+        for scale in args.scales.split(",")
+    ]
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for config in configs:
+        print(f"🚀 {config['scale']}개 종목 시뮬레이션 중...")
+        with context.Pool(1) as pool:
+            results.extend(pool.apply(run_scale, (config,)))
+
+    print_report(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Local HTTP server replaying recorded upstream payloads.
+
+Routes (query strings are honoured where the real API pages):
+    /rss/cnbc, /rss/yahoo, /rss/google    RSS fixtures
+    /naver/search                          Naver news search JSON (display/start/sort)
+    /naver/finance                         Naver Finance news HTML
+    /newsapi                               NewsAPI /everything JSON (pageSize/page)
+
+Naver ``pubDate`` values are shifted so the newest item is "now",
+keeping the recency filter meaningful whenever the suite runs.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from src.utils.dates import parse_datetime
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+RSS_ROUTES = {
+    "/rss/cnbc": "cnbc_top_news.xml",
+    "/rss/yahoo": "yahoo_headline.xml",
+    "/rss/google": "google_news_search.xml",
+}
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+def shift_pubdates(items, key="pubDate", fmt="%a, %d %b %Y %H:%M:%S %z"):
+    """Move every ``key`` date by the same offset so the newest one is now."""
+    dates = [parse_datetime(item[key]) for item in items]
+    newest = max(d for d in dates if d is not None)
+    offset = datetime.now(newest.tzinfo) - newest
+    return [
+        dict(item, **{key: (d + offset).strftime(fmt)}) if d is not None else item
+        for item, d in zip(items, dates)
+    ]
+
+
+class StubServer:
+    """Threaded fixture server bound to an ephemeral localhost port."""
+
+    def __init__(self):
+        self.rss = {path: load_fixture(name) for path, name in RSS_ROUTES.items()}
+        self.naver_items = shift_pubdates(json.loads(load_fixture("naver_news.json"))["items"])
+        self.naver_by_date = sorted(
+            self.naver_items, key=lambda item: parse_datetime(item["pubDate"]), reverse=True
+        )
+        self.naver_html = load_fixture("naver_finance_news.html")
+        self.newsapi = json.loads(load_fixture("newsapi_everything.json"))
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _naver(self, query):
+        display = int(query.get("display", ["10"])[0])
+        start = int(query.get("start", ["1"])[0])
+        items = self.naver_by_date if query.get("sort", ["sim"])[0] == "date" else self.naver_items
+        page = items[start - 1:start - 1 + display]
+        return {"total": len(items), "start": start, "display": len(page), "items": page}
+
+    def _newsapi(self, query):
+        size = int(query.get("pageSize", ["100"])[0])
+        page = int(query.get("page", ["1"])[0])
+        articles = self.newsapi["articles"][(page - 1) * size:page * size]
+        return dict(self.newsapi, articles=articles)
+
+    def respond(self, path, query):
+        """Return ``(status, content_type, body)`` for a request."""
+        if path in self.rss:
+            return 200, "application/rss+xml; charset=utf-8", self.rss[path]
+        if path == "/naver/search":
+            return 200, "application/json", json.dumps(self._naver(query), ensure_ascii=False).encode()
+        if path == "/naver/finance":
+            return 200, "text/html; charset=utf-8", self.naver_html
+        if path == "/newsapi":
+            return 200, "application/json", json.dumps(self._newsapi(query)).encode()
+        return 404, "text/plain", b"not found"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                with server._lock:
+                    server.requests += 1
+                status, content_type, body = server.respond(parsed.path, parse_qs(parsed.query))
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
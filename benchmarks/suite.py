@@ -0,0 +1,191 @@
+"""
+Offline benchmark cases for collectors, date parsing and row assembly.
+
+Every collector is pointed at the local ``StubServer``; each call uses a
+fresh URL so the feed cache and parse memo never short-circuit the
+request, matching a run where every ticker is a new query.
+"""
+
+import itertools
+import json
+import os
+import statistics
+import timeit
+from typing import Callable, Dict, List, NamedTuple
+
+from .stub_server import StubServer, load_fixture
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "suite.json")
+
+
+class Case(NamedTuple):
+    name: str
+    fn: Callable[[], object]
+    number: int = 1
+
+
+class ListWriter:
+    """Collects ``add(row, values)`` calls in place of ``BatchSheetWriter``."""
+
+    def __init__(self):
+        self.rows = []
+
+    def add(self, row, values):
+        self.rows.append((row, values))
+
+
+def _fresh(url: str) -> Callable[[], str]:
+    """URL factory appending a unique query parameter per call."""
+    counter = itertools.count()
+    sep = "&" if "?" in url else "?"
+    return lambda: f"{url}{sep}bench={next(counter)}"
+
+
+def build_cases(server: StubServer) -> List[Case]:
+    """Create benchmark cases bound to ``server``."""
+    import cnbc_news
+    import global_news
+    import kr_news
+    from src.collectors import naver
+    from src.collectors.google_rss import GoogleRSSCollector
+    from src.collectors.naver import NaverCollector
+    from src.collectors.news_item import NewsItem
+    from src.collectors.newsapi import NewsAPICollector
+    from src.collectors.yahoo import YahooCollector
+    from src.utils.dates import parse_datetime
+    from src.utils.rss import parse_feed
+
+    base = server.url
+    naver.NAVER_NEWS_URL = f"{base}/naver/search"
+
+    yahoo = YahooCollector()
+    yahoo.max_age = 0
+    yahoo_url = _fresh(f"{base}/rss/yahoo")
+
+    def yahoo_fetch():
+        yahoo.base_url = yahoo_url() + "&s={}"
+        return yahoo.fetch_news("AAPL", count=3)
+
+    def yahoo_batch():
+        yahoo.base_url = yahoo_url() + "&s={}"
+        yahoo.batch_size = 3
+        return yahoo.fetch_news_batch(["AAPL", "MSFT", "NVDA"], count=3)
+
+    google = GoogleRSSCollector()
+    google.max_age = 0
+    google_url = _fresh(f"{base}/rss/google")
+
+    def google_fetch():
+        google.base_url = google_url() + "&q={}"
+        return google.fetch_news("Nvidia", count=2)
+
+    newsapi = NewsAPICollector()
+    newsapi.base_url = f"{base}/newsapi"
+    tickers = ["AAPL", "MSFT", "NVDA", "AMZN", "GOOGL", "META", "TSLA", "AVGO", "AMD", "NFLX"]
+
+    finance = NaverCollector()
+    finance.base_url = f"{base}/naver/finance"
+
+    cnbc_url = _fresh(f"{base}/rss/cnbc")
+
+    rss = {name: load_fixture(name) for name in ("cnbc_top_news.xml", "google_news_search.xml")}
+    naver_items = server.naver_items
+    dates = (
+        [item["pubDate"] for item in naver_items]
+        + [article["publishedAt"] for article in server.newsapi["articles"]]
+        + [item["published"] for item in parse_feed(rss["cnbc_top_news.xml"])]
+        + [item["published"] for item in parse_feed(rss["google_news_search.xml"])]
+    )
+
+    def parse_dates_cold():
+        parse_datetime.cache_clear()
+        return [parse_datetime(value) for value in dates]
+
+    def naver_filter():
+        query = "삼성전자"
+        return [
+            item for item in naver_items
+            if naver.is_recent(item["pubDate"])
+            and query in item["title"].replace("<b>", "").replace("</b>", "")
+        ]
+
+    news = [
+        NewsItem.from_raw(f"Headline {i}", f"https://example.com/{i}", "Fri, 11 Apr 2025 10:00:00 GMT")
+        for i in range(6)
+    ]
+
+    def kr_rows():
+        writer = ListWriter()
+        for row in range(2, 502):
+            kr_news.update_kr_sheet(writer, row, f"종목{row}", news)
+        return writer.rows
+
+    def global_rows():
+        return [global_news.build_global_row(f"T{row}", news) for row in range(2, 502)]
+
+    return [
+        Case("collector.yahoo.fetch_news", yahoo_fetch, number=5),
+        Case("collector.yahoo.fetch_news_batch", yahoo_batch, number=5),
+        Case("collector.google.fetch_news", google_fetch, number=5),
+        Case("collector.newsapi.fetch_news", lambda: newsapi.fetch_news("AAPL", count=1), number=5),
+        Case("collector.newsapi.fetch_news_batch", lambda: newsapi.fetch_news_batch(tickers, count=1), number=5),
+        Case("collector.naver.fetch_news", lambda: naver.fetch_news("삼성전자", limit=3), number=5),
+        Case("collector.naver_finance.fetch_news", lambda: finance.fetch_news("005930", count=5), number=5),
+        Case("collector.cnbc.fetch_cnbc_rss", lambda: cnbc_news.fetch_cnbc_rss(count=30, url=cnbc_url()), number=5),
+        Case("parse.dates_cold", parse_dates_cold, number=10),
+        Case("filter.naver", naver_filter, number=20),
+        Case("rows.kr_500", kr_rows, number=10),
+        Case("rows.global_500", global_rows, number=10),
+    ]
+
+
+def run_cases(cases: List[Case], repeat: int = 9) -> Dict[str, Dict[str, float]]:
+    """
+    Time every case after one warm-up call.
+
+    Returns:
+        Dict[str, Dict[str, float]]: ``best_ms`` and ``median_ms`` per call, keyed by case name
+    """
+    results = {}
+    for case in cases:
+        case.fn()
+        times = [t / case.number for t in timeit.repeat(case.fn, number=case.number, repeat=repeat)]
+        results[case.name] = {
+            "best_ms": round(min(times) * 1000, 4),
+            "median_ms": round(statistics.median(times) * 1000, 4),
+        }
+    return results
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Dict[str, float]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(results: Dict[str, Dict[str, float]], path: str = BASELINE_PATH) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float = 1.0,
+    floor_ms: float = 0.25
+) -> List[str]:
+    """
+    List cases whose best time regressed beyond ``tolerance``.
+
+    Differences under ``floor_ms`` are ignored so sub-millisecond cases
+    do not fail on timer noise.
+    """
+    regressions = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        before, now = baseline[name]["best_ms"], current["best_ms"]
+        if now > before * (1 + tolerance) and now - before > floor_ms:
+            regressions.append(f"{name}: {before:.3f}ms → {now:.3f}ms (+{now / before - 1:.0%})")
+    return regressions
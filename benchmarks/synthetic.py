@@ -0,0 +1,254 @@
+"""
+Synthetic upstreams for the scale simulator.
+
+``SyntheticFeeds`` is a requests adapter mounted on the shared transport
+session, so every collector keeps its real URLs while responses are
+generated locally with configurable latency, error rate and volume.
+``LLMStub`` is a local Messages API endpoint for ``ANTHROPIC_BASE_URL``.
+"""
+
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+# 헤드라인 피드가 한 번에 돌려주는 최대 항목 수
+YAHOO_FEED_LIMIT = 20
+
+
+def _rss(title, entries):
+    items = "".join(
+        f"<item><title>{escape(t)}</title><link>{escape(link)}</link>"
+        f"<description>{escape(desc)}</description><pubDate>{date}</pubDate></item>"
+        for t, link, desc, date in entries
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>{escape(title)}</title>{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+class SyntheticFeeds(BaseAdapter):
+    """Generates Naver, Google News, Yahoo, NewsAPI and CNBC responses."""
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, items: int = 20, seed: int = 0):
+        """
+        Args:
+            latency (float): Mean response latency in seconds (uniform ±50%)
+            error_rate (float): Probability of a 503 response
+            items (int): Articles available per query
+            seed (int): Random seed for latency and errors
+        """
+        super().__init__()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.items = items
+        self.requests: Counter = Counter()
+        self.errors: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _dates(self, count, step_minutes=45):
+        now = datetime.now(timezone.utc)
+        return [format_datetime(now - timedelta(minutes=step_minutes * i), usegmt=True) for i in range(count)]
+
+    def _naver(self, query):
+        q = query.get("query", [""])[0]
+        display = int(query.get("display", ["10"])[0])
+        start = int(query.get("start", ["1"])[0])
+        kst = timezone(timedelta(hours=9))
+        now = datetime.now(kst)
+        items = []
+        for i in range(start - 1, min(self.items, start - 1 + display)):
+            # 4건 중 1건은 제목에 종목명이 없음
+            title = f"<b>{q}</b> 실적 전망 {i}" if i % 4 else f"증시 마감 시황 {i}"
+            items.append({
+                "title": title,
+                "originallink": f"https://news.example.kr/{zlib.crc32(q.encode())}/{i}",
+                "link": f"https://n.news.naver.com/article/{zlib.crc32(q.encode())}/{i}",
+                "description": f"{q} 관련 기사 요약 {i}",
+                "pubDate": (now - timedelta(hours=2 * i)).strftime("%a, %d %b %Y %H:%M:%S %z"),
+            })
+        body = {"total": self.items, "start": start, "display": len(items), "items": items}
+        return "application/json", json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    def _google(self, query):
+        q = query.get("q", [""])[0]
+        dates = self._dates(self.items)
+        entries = [
+            (f"{q} headline {i} - Publisher", f"https://news.google.com/articles/{zlib.crc32(q.encode())}-{i}",
+             f"{q} summary {i}", dates[i])
+            for i in range(self.items)
+        ]
+        return "application/rss+xml", _rss(f"{q} - Google News", entries)
+
+    def _yahoo(self, query):
+        symbols = query.get("s", [""])[0].split(",")
+        count = min(YAHOO_FEED_LIMIT, self.items * len(symbols))
+        dates = self._dates(count)
+        entries = []
+        for i in range(count):
+            symbol = symbols[i % len(symbols)]
+            entries.append((f"{symbol}: market update {i}", f"https://finance.yahoo.com/news/{symbol}-{i}",
+                            f"{symbol} shares moved {i}", dates[i]))
+        return "application/rss+xml", _rss("Yahoo! Finance", entries)
+
+    def _newsapi(self, query):
+        terms = [t.strip().strip('"') for t in query.get("q", [""])[0].split(" OR ")]
+        size = int(query.get("pageSize", ["100"])[0])
+        page = int(query.get("page", ["1"])[0])
+        total = self.items * len(terms)
+        now = datetime.now(timezone.utc)
+        articles = []
+        for i in range((page - 1) * size, min(total, page * size)):
+            term = terms[i % len(terms)]
+            articles.append({
+                "source": {"id": None, "name": "Example"},
+                "title": f"{term} stock news {i}",
+                "description": f"{term} description {i}",
+                "content": f"{term} content {i}",
+                "url": f"https://example.com/{term}/{i}",
+                "publishedAt": (now - timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            })
+        body = {"status": "ok", "totalResults": total, "articles": articles}
+        return "application/json", json.dumps(body).encode("utf-8")
+
+    def _cnbc(self, query):
+        stamp = int(time.time())
+        dates = self._dates(self.items, 20)
+        entries = [
+            (f"Markets headline {stamp}-{i}", f"https://www.cnbc.com/{stamp}/{i}.html",
+             f"Story summary {stamp}-{i}", dates[i])
+            for i in range(self.items)
+        ]
+        return "application/rss+xml", _rss("CNBC", entries)
+
+    ROUTES = {
+        "openapi.naver.com": "_naver",
+        "news.google.com": "_google",
+        "feeds.finance.yahoo.com": "_yahoo",
+        "newsapi.org": "_newsapi",
+        "www.cnbc.com": "_cnbc",
+    }
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlparse(request.url)
+        host = url.hostname
+        with self._lock:
+            self.requests[host] += 1
+            delay = self.latency * self._rng.uniform(0.5, 1.5)
+            failed = self._rng.random() < self.error_rate
+
+        if delay:
+            time.sleep(delay)
+
+        response = Response()
+        response.url = request.url
+        response.request = request
+        route = self.ROUTES.get(host)
+        if failed or route is None:
+            with self._lock:
+                self.errors[host] += 1
+            response.status_code, response.reason = (503, "Service Unavailable") if failed else (404, "Not Found")
+            response._content = b""
+            response.headers = CaseInsensitiveDict({"Content-Type": "text/plain"})
+            return response
+
+        content_type, body = getattr(self, route)(parse_qs(url.query))
+        response.status_code, response.reason = 200, "OK"
+        response._content = body
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict({
+            "Content-Type": content_type,
+            "Content-Length": str(len(body)),
+        })
+        return response
+
+    def close(self):
+        pass
+
+
+class LLMStub:
+    """Local ``/v1/messages`` endpoint answering translation prompts."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._httpd = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @staticmethod
+    def answer(prompt: str) -> str:
+        """Fake translation, keeping the numbered JSON format of batch prompts."""
+        last = prompt.strip().splitlines()[-1]
+        try:
+            payload = json.loads(last)
+            return json.dumps(
+                [{"id": entry["id"], "translation": f"번역 {entry['text'][:40]}"} for entry in payload],
+                ensure_ascii=False
+            )
+        except (ValueError, TypeError, KeyError):
+            return f"번역 {last[:40]}"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                with stub._lock:
+                    stub.calls += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+                prompt = body["messages"][0]["content"]
+                data = json.dumps({
+                    "id": f"msg_{stub.calls}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": body.get("model", "stub"),
+                    "content": [{"type": "text", "text": stub.answer(prompt)}],
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {"input_tokens": len(prompt) // 3, "output_tokens": 10},
+                }, ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
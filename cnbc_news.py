@@ -1,44 +1,47 @@
 # cnbc_news.py
 
 import os
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
 from dotenv import load_dotenv
 from src.config.sheet import load_sheet
+from src.collectors.news_item import NewsItem
+from src.utils import metrics
+from src.utils.feed_cache import get_feed_cache
+from src.utils.rss import parse_feed
+from src.config.settings import Settings
+from src.utils.sheet_diff import diff_update
 
 load_dotenv()
 SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
 
-def fetch_cnbc_rss(count=10):
-    url = "https://www.cnbc.com/id/100003114/device/rss/rss.html"
+CNBC_RSS_URL = "https://www.cnbc.com/id/100003114/device/rss/rss.html"
+
+@metrics.instrument("cnbc")
+def fetch_cnbc_rss(count=10, url=CNBC_RSS_URL):
     headers = {
         "User-Agent": "Mozilla/5.0"
     }
 
     try:
-        res = requests.get(url, headers=headers)
-        res.raise_for_status()
+        content = get_feed_cache().fetch(
+            url,
+            "cnbc",
+            max_age=Settings().get_news_settings("cnbc").get("max_age", 0),
+            headers=headers
+        )
     except Exception as e:
         print(f"❌ CNBC RSS 수집 실패: {e}")
         return []
 
-    soup = BeautifulSoup(res.content, "xml")
-    items = soup.find_all("item")[:count]
-
     result = []
-    for item in items:
-        title = item.title.text.strip()
-        description = item.description.text.strip()
-        link = item.link.text.strip()
-        pub_date_raw = item.pubDate.text.strip()
-
-        try:
-            pub_date = datetime.strptime(pub_date_raw, "%a, %d %b %Y %H:%M:%S %Z").strftime("%Y-%m-%d %H:%M")
-        except:
-            pub_date = pub_date_raw
-
-        result.append([title, description, pub_date, link])
+    for item in parse_feed(content, limit=count):
+        news = NewsItem.from_raw(
+            item["title"],
+            item["link"],
+            item["published"],
+            item["summary"],
+            "cnbc"
+        )
+        result.append([news.title, news.snippet, news.format_date("%Y-%m-%d %H:%M"), news.link])
 
     return result
 
@@ -50,9 +53,8 @@ def update_cnbc_sheet(sheet_id):
         print("❌ 뉴스 없음")
         return
 
-    # A2:D11 영역 업데이트
-    # sheet.update("A2:D31", news)
-    sheet.update(range_name='A2:D31', values=news)
+    # A2:D31 영역 업데이트 (변경된 셀만)
+    diff_update(sheet, [('A2:D31', news)])
     print("✅ CNBC 뉴스 업데이트 완료")
 
 if __name__ == "__main__":
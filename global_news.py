@@ -1,11 +1,19 @@
 import os
-import time
+from functools import partial
 from dotenv import load_dotenv
 from src.config.sheet import load_sheet
 from src.collectors.yahoo import YahooCollector
 from src.collectors.newsapi import NewsAPICollector
 from src.collectors.google_rss import GoogleRSSCollector
 from src.config.settings import Settings
+from src.utils import deadline, metrics
+from src.utils import sheet_api
+from src.utils.concurrent_fetch import FetchEngine
+from src.utils.poll_planner import get_poll_planner
+from src.utils.ratelimit import save_quota_ledgers
+from src.utils.resilience import allocate_slots, get_breaker
+from src.utils.sheet_writer import BatchSheetWriter
+from src.utils.ticker_index import TickerIndex
 
 load_dotenv()
 SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
@@ -20,96 +28,164 @@ def chunked(seq, size):
 # ✅ 시트 로딩
 def load_global_tickers(sheet_id):
     sheet = load_sheet(sheet_id, worksheet_name="global")
-    tickers = sheet.col_values(1)[1:]  # A열 (헤더 제외)
-    return tickers, sheet
-
-
-# ✅ 종목명 → 시트 행번호 탐색
-def get_row_for_ticker(sheet, ticker_name):
-    tickers = sheet.col_values(1)
-    for i, name in enumerate(tickers):
-        if name.strip() == ticker_name.strip():
-            return i + 1
-    return None
-
-
-# ✅ 뉴스 수집 (Yahoo 3 + NewsAPI 1 + GoogleRSS 2)
-def fetch_global_news(ticker):
-    news_items = []
-
-    yahoo = YahooCollector()
-    yahoo_items = yahoo.fetch_news(ticker, count=3) or []
-    for item in yahoo_items:
-        news_items.append({
-            "title": item["title"],
-            "link": item["link"],
-            "date": item["publish_date"],
-            "snippet": item.get("snippet", "")
-        })
-
-    googlerss = GoogleRSSCollector()
-    rss_items = googlerss.fetch_news(ticker, count=2) or []
-    for item in rss_items:
-        news_items.append({
-            "title": item["title"],
-            "link": item["link"],
-            "date": item["publish_date"],
-            "snippet": item.get("snippet", "")
-        })
-
-    newsapi = NewsAPICollector()
-    newsapi_items = newsapi.fetch_news(ticker, count=1) or []
-    for item in newsapi_items:
-        news_items.append({
-            "title": item["title"],
-            "link": item["link"],
-            "date": item["date"],
-            "snippet": item.get("snippet", "")
-        })
-
-    return news_items
+    column = sheet_api.call("col_values", sheet.col_values, 1)  # A열 (1회 조회)
+    index = TickerIndex.load(column, "global")  # 종목명 → 행번호
+    return column[1:], sheet, index
+
+
+# ✅ 수집 소스 정의: (이름, 업스트림 호스트, 개수) → Yahoo 3 + GoogleRSS 2 + NewsAPI 1
+GLOBAL_SOURCES = [
+    ("yahoo", "feeds.finance.yahoo.com", 3),
+    ("google", "news.google.com", 2),
+    ("newsapi", "newsapi.org", 1),
+]
+
+
+# ✅ 수집기 생성 (실행당 한 번)
+def make_collectors():
+    return {
+        "yahoo": YahooCollector(),
+        "google": GoogleRSSCollector(),
+        "newsapi": NewsAPICollector(),
+    }
+
+
+# ✅ 배치 모드로 수집할 소스 (Yahoo 다중 심볼, NewsAPI OR 검색)
+def get_batch_sources():
+    settings = Settings()
+    return {
+        source for source in ("yahoo", "newsapi")
+        if settings.get_news_settings(source).get("batch", False)
+    }
+
+
+# ✅ 여러 종목 동시 수집 (소스별 호스트 동시성 제한, 배치 소스는 묶음 요청)
+# 적응형 폴링이 생략한 (종목, 소스)는 이전 결과를 재사용
+# 회로가 열린 소스는 건너뛰고 그 칸을 정상 소스에 배분 (이전 결과는 남은 칸에만 사용)
+# 결과가 None인 (종목, 소스)는 조회되지 않은 것 (NewsAPI 한도 소진, 작업 실패) → 빈 종목으로 기록하지 않음
+# use_planner=False: 갱신 시점을 직접 정하는 데몬용 (적응형 폴링 판단·기록 없이 항상 조회)
+#   어떤 소스도 조회하지 못한 종목은 None (실제 빈 결과 []와 구분, 기존 행을 지우지 않도록)
+def fetch_global_news_many(tickers, engine, collectors, batch_sources=(), use_planner=True):
+    planner = get_poll_planner()
+    sources, skipped = allocate_slots(GLOBAL_SOURCES)
+    tasks = []
+    polled = {}
+    for source, host, count in sources:
+        polled[source] = planner.split(tickers, source) if use_planner else list(tickers)
+        if not polled[source]:
+            continue
+        if source in batch_sources:
+            tasks.append((source, host, partial(collectors[source].fetch_news_batch, polled[source], count=count)))
+            continue
+        tasks.extend(
+            ((ticker, source), host, partial(collectors[source].fetch_news, ticker, count=count))
+            for ticker in polled[source]
+        )
+    results = engine.run(tasks)
+
+    for source in batch_sources:
+        for ticker, items in (results.pop(source, None) or {}).items():
+            results[(ticker, source)] = items
+
+    failing = {source: get_breaker(host).failing or deadline.expired() for source, host, _ in sources}
+    if use_planner:
+        for source, _, _ in sources:
+            polled_set = set(polled[source])
+            for ticker in tickers:
+                items = results.get((ticker, source))
+                if ticker not in polled_set or items is None or (failing[source] and not items):
+                    # 생략했거나 조회하지 못했거나 (한도 소진·작업 실패) 장애로 비어 있는 결과
+                    # → 이전 결과 (폴링 통계에 반영하지 않음)
+                    results[(ticker, source)] = planner.cached(ticker, source)
+                else:
+                    planner.record(ticker, source, items)
+
+    news_by_ticker = {}
+    for ticker in tickers:
+        news_items = []
+        fetched = use_planner
+        for source, _, _ in sources:
+            items = results.get((ticker, source))
+            fetched = fetched or items is not None and not (failing[source] and not items)
+            news_items.extend(items or [])
+        if use_planner:
+            for source in skipped:
+                news_items.extend(planner.cached(ticker, source))
+        news_by_ticker[ticker] = news_items if fetched else None
+    return news_by_ticker
+
+
+# ✅ 시트 한 행 구성 (A열 종목 + 뉴스 6개 × 제목/링크/날짜 = A~S열)
+def build_global_row(ticker, news_items):
+    values = [ticker]
+    for item in news_items[:6]:  # 최대 6개 뉴스
+        values.extend(item.row_cells())
+    while len(values) < 19:  # 부족할 경우 빈칸 채우기
+        values.extend(["", "", ""])
+    return values
 
 
 # ✅ 배치 실행 함수
-def run_global_news_summary(sheet_id, batch_size=50):
-    tickers, sheet = load_global_tickers(sheet_id)
+def run_global_news_summary(sheet_id, batch_size=50, concurrent=None):
+    _, sheet, index = load_global_tickers(sheet_id)
     total_updated = 0
 
-    # 종목별 뉴스 수집
-    for batch in chunked(tickers, batch_size):
-        batch_data = []
-        row_map = {}
-
-        for ticker in batch:
+    fetch_settings = Settings().get_fetch_settings()
+    if concurrent is None:
+        concurrent = fetch_settings["concurrent"]
+    engine = FetchEngine(
+        max_workers=fetch_settings["max_workers"],
+        host_limits=fetch_settings["host_limits"],
+        concurrent=concurrent
+    )
+    collectors = make_collectors()
+    batch_sources = get_batch_sources()
+    writer = BatchSheetWriter(
+        sheet,
+        chunk_size=batch_size,
+        flush_interval=float("inf"),
+        diff=True
+    )
+
+    run_deadline = deadline.current()
+    batches = list(chunked(index.entries(), batch_size))
+
+    # 종목별 뉴스 수집 (마감 임박 시 남은 배치는 생략하고 수집된 결과만 기록)
+    for number, batch in enumerate(batches):
+        if run_deadline and run_deadline.low():
+            missed = [ticker for remaining in batches[number:] for ticker, _ in remaining]
+            run_deadline.miss("global", missed)
+            print(f"⏰ 마감 임박: 남은 {len(missed)}개 종목 수집 생략")
+            break
+
+        rows = dict(batch)
+
+        for ticker in rows:
             print(f"🌍 [수집 중] {ticker}")
-            row = get_row_for_ticker(sheet, ticker)
-            if not row:
-                print(f"⚠️ 종목 '{ticker}' 행 찾기 실패 → 건너뜀")
-                continue
 
-            news_items = fetch_global_news(ticker)
+        news_by_ticker = fetch_global_news_many(list(rows), engine, collectors, batch_sources)
 
-            values = [ticker]
-            for item in news_items[:6]:  # 최대 6개 뉴스
-                values.extend([item["title"], item["link"], item["date"]])
-            while len(values) < 19:  # 부족할 경우 빈칸 채우기
-                values.extend(["", "", ""])
-
-            row_map[row] = values
+        for ticker, row in rows.items():
+            news_items = news_by_ticker[ticker]
+            if not news_items and run_deadline and run_deadline.expired():
+                run_deadline.miss("global", [ticker])  # 기존 행을 빈칸으로 덮지 않음
+                continue
+            metrics.observe("items_per_ticker", min(len(news_items), 6), metrics.COUNT_BUCKETS, pipeline="global")
+            writer.add(row, build_global_row(ticker, news_items))
             total_updated += 1
 
-        # 일반 뉴스 데이터 업데이트
-        batch_data = [
-            {"range": f"A{row}:S{row}", "values": [row_map[row]]}
-            for row in sorted(row_map.keys())
-        ]
-
-        if batch_data:
-            sheet.batch_update(batch_data)
-            print(f"✅ 배치 업데이트 완료: {len(batch_data)}개")
-
-        time.sleep(2)
-
+        # 일반 뉴스 데이터 업데이트 (변경된 셀만)
+        writer.flush()
+
+    writer.close()
+    get_poll_planner().save()
+    save_quota_ledgers()
+    print(engine.report())
+    print(get_poll_planner().report())
+    print(
+        f"📝 시트 쓰기 요청 {writer.requests}회: "
+        f"셀 기록 {writer.cells_written}개 / 변경 없음 {writer.cells_skipped}개"
+    )
     print(f"\n🎯 전체 완료: 총 {total_updated}개 종목 처리됨")
 
 
@@ -3,21 +3,32 @@
 import os
 from dotenv import load_dotenv
 from src.config.sheet import load_sheet
-from datetime import datetime
-import feedparser
-from src.collectors.naver import fetch_news
+from src.collectors.naver import fetch_news, get_display_hints
+from src.collectors.news_item import NewsItem
+from src.config.settings import Settings
+from src.utils.sheet_writer import BatchSheetWriter
+from src.utils.ticker_index import TickerIndex
+from src.utils import deadline, metrics
+from src.utils import sheet_api
+from src.utils.feed_cache import get_feed_cache
+from src.utils.poll_planner import get_poll_planner
+from src.utils.ratelimit import save_quota_ledgers
+from src.utils.resilience import allocate_slots
+from src.utils.rss import feed_parser
+from functools import partial
 from urllib.parse import quote
-import time
 
 # ✅ 환경변수 로딩
 load_dotenv()
 SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
 
+@metrics.instrument("google_kr")
 def get_google_rss_news(ticker, count=5):
     """
     Google 뉴스 RSS 기반 종목 뉴스 수집
     ticker: 종목명 (예: '삼성전자')
     count: 가져올 뉴스 개수
+    결과 없음은 [], 수집 실패는 None
     """
     try:
         # URL 인코딩 적용
@@ -25,33 +36,30 @@ def get_google_rss_news(ticker, count=5):
         url = f"https://news.google.com/rss/search?q={encoded_ticker}&hl=ko&gl=KR&ceid=KR:ko"
         
         # 요청 시도
-        feed = feedparser.parse(url)
+        feed = get_feed_cache().fetch_parsed(
+            url,
+            "google",
+            feed_parser(count),
+            max_age=Settings().get_news_settings("google").get("max_age", 0)
+        )
         
         # 피드가 비어있는지 확인
-        if not feed.entries:
+        if not feed:
             print(f"⚠️ 구글 뉴스 검색 결과 없음: {ticker}")
-            return None
-
-        results = []
-        for entry in feed.entries[:count]:
-            raw_date = entry.published if "published" in entry else "N/A"
-
-            try:
-                parsed_date = datetime.strptime(raw_date, "%a, %d %b %Y %H:%M:%S %Z")
-                publish_date = parsed_date.strftime("%Y-%m-%d")
-            except Exception as e:
-                print(f"⚠️ 날짜 파싱 실패 ({ticker}): {e}")
-                publish_date = "N/A"
-
-            results.append({
-                "title": entry.title,
-                "link": entry.link,
-                "snippet": entry.summary,
-                "lang": "lang_ko",
-                "publish_date": publish_date
-            })
-
-        return results if results else None
+            return []
+
+        results = [
+            NewsItem.from_raw(
+                entry["title"],
+                entry["link"],
+                entry["published"],
+                entry["summary"],
+                "google"
+            )
+            for entry in feed
+        ]
+
+        return results
     except Exception as e:
         print(f"❌ 구글 뉴스 RSS 수집 실패 ({ticker}): {e}")
         return None
@@ -59,87 +67,123 @@ def get_google_rss_news(ticker, count=5):
 # ✅ 시트 불러오기 + 종목 리스트 추출
 def load_kr_tickers(sheet_id):
     sheet = load_sheet(sheet_id, worksheet_name="kr")
-    tickers = sheet.col_values(1)[1:]  # A열 종목명 (헤더 제외)
-    return tickers, sheet
-
-# ✅ 종목명 → 시트 행 번호 찾기
-def get_row_for_ticker(sheet, ticker_name):
-    tickers = sheet.col_values(1)
-    for i, name in enumerate(tickers):
-        if name.strip() == ticker_name.strip():
-            return i + 1  # 1-based index
-    return None
-
-# ✅ 뉴스 수집 (Naver + Google RSS)
-def fetch_kr_news(ticker):
+    column = sheet_api.call("col_values", sheet.col_values, 1)  # A열 종목명 (1회 조회)
+    index = TickerIndex.load(column, "kr")  # 종목명 → 행 번호
+    return column[1:], sheet, index
+
+# ✅ 수집 소스 정의: (이름, 업스트림 호스트, 개수) → Naver 3 + Google RSS 3
+KR_SOURCES = [
+    ("naver", "openapi.naver.com", 3),
+    ("google_kr", "news.google.com", 3),
+]
+
+# ✅ 소스별 조회 함수 (네이버 뉴스 / 구글 뉴스)
+def kr_source_fetch(ticker, source, count):
+    if source == "naver":
+        return partial(fetch_news, ticker, limit=count)
+    return partial(get_google_rss_news, ticker, count=count)
+
+# ✅ 뉴스 수집 (Naver + Google RSS, 새 기사가 없을 소스는 이전 결과 재사용)
+# 회로가 열린 소스의 칸은 정상 소스가 대신 채우고, 남은 칸만 이전 결과로 채움
+# use_planner=False: 갱신 시점을 직접 정하는 데몬용 (적응형 폴링 판단 없이 항상 조회)
+def fetch_kr_news(ticker, use_planner=True):
     news_items = []
+    planner = get_poll_planner()
+    sources, skipped = allocate_slots(KR_SOURCES)
 
     try:
-        # 네이버 뉴스 먼저 수집
-        naver_items = fetch_news(ticker, display=10) or []
-        for item in naver_items[:3]:
-            news_items.append({
-                "title": item["title"],
-                "link": item["link"],
-                "date": item["date"]
-            })
-
-        # 구글 뉴스 수집
-        rss_items = get_google_rss_news(ticker, count=3) or []
-        for item in rss_items[:3]:
-            news_items.append({
-                "title": item["title"],
-                "link": item["link"],
-                "date": item["publish_date"]
-            })
+        for source, host, count in sources:
+            fetch = kr_source_fetch(ticker, source, count)
+            items = planner.poll(ticker, source, fetch, host=host) if use_planner else (fetch() or [])
+            news_items.extend(items[:count])
+
+        if use_planner:
+            for source in skipped:
+                news_items.extend(planner.cached(ticker, source))
     except Exception as e:
         print(f"❌ 뉴스 수집 중 오류 발생 ({ticker}): {e}")
 
-    return news_items
+    return news_items[:6]
 
-# ✅ 시트에 뉴스 쓰기 (A~S열)
-def update_kr_sheet(sheet, row, ticker, news_items):
+# ✅ 여러 종목 동시 수집 (데몬용, 적응형 폴링 없이 항상 조회)
+# 소스마다 별도 작업으로 나눠 각 업스트림 호스트의 동시성 제한을 받도록 함
+# 어떤 소스도 조회하지 못한 종목은 None (실제 빈 결과 []와 구분)
+def fetch_kr_news_many(tickers, engine):
+    sources, _ = allocate_slots(KR_SOURCES)
+    results = engine.run([
+        ((ticker, source), host, kr_source_fetch(ticker, source, count))
+        for ticker in tickers
+        for source, host, count in sources
+    ])
+
+    news_by_ticker = {}
+    for ticker in tickers:
+        news_items = []
+        fetched = False
+        for source, _, count in sources:
+            items = results.get((ticker, source))
+            fetched = fetched or items is not None
+            news_items.extend((items or [])[:count])
+        news_by_ticker[ticker] = news_items[:6] if fetched else None
+    return news_by_ticker
+
+# ✅ 시트에 뉴스 쓰기 (A~S열, 버퍼에 모았다가 batch_update로 일괄 기록)
+def update_kr_sheet(writer, row, ticker, news_items):
     try:
         values = [ticker]
         for item in news_items:
-            values.extend([item["title"], item["link"], item["date"]])
+            values.extend(item.row_cells())
         while len(values) < 19:
             values.extend(["", "", ""])
-        sheet.update(f"A{row}:S{row}", [values])
+        writer.add(row, values)
     except Exception as e:
         print(f"❌ 시트 업데이트 실패 ({ticker}): {e}")
 
 # ✅ 전체 실행
 def run_kr_news_summary(sheet_id):
-    tickers, sheet = load_kr_tickers(sheet_id)
+    _, sheet, index = load_kr_tickers(sheet_id)
+    writer = BatchSheetWriter(sheet, diff=True, **Settings().get_sheet_write_settings())
     total_processed = 0
+    run_deadline = deadline.current()
+    entries = index.entries()
+
+    for number, (ticker, row) in enumerate(entries):
+        # 마감 임박 시 남은 종목은 생략하고 수집된 결과만 기록
+        if run_deadline and run_deadline.low():
+            missed = [name for name, _ in entries[number:]]
+            run_deadline.miss("kr", missed)
+            print(f"⏰ 마감 임박: 남은 {len(missed)}개 종목 수집 생략")
+            break
 
-    for ticker in tickers:
         try:
             print(f"\n🔍 {ticker}")
-            row = get_row_for_ticker(sheet, ticker)
-
-            if not row:
-                print(f"⚠️ 종목 '{ticker}'의 위치를 찾을 수 없음 → 건너뜀")
-                continue
-
             news_items = fetch_kr_news(ticker)
+            metrics.observe("items_per_ticker", len(news_items), metrics.COUNT_BUCKETS, pipeline="kr")
 
+            if not news_items and run_deadline and run_deadline.expired():
+                run_deadline.miss("kr", [ticker])
+                continue
             if not news_items:
                 print("❌ 뉴스 없음")
                 continue
 
-            update_kr_sheet(sheet, row, ticker, news_items)
+            update_kr_sheet(writer, row, ticker, news_items)
             print("✅ 완료")
             total_processed += 1
             
-            # API 호출 간 간격 두기
-            time.sleep(1)
-            
         except Exception as e:
             print(f"❌ 종목 처리 중 오류 발생 ({ticker}): {e}")
             continue
-    
+
+    writer.close()
+    get_poll_planner().save()
+    get_display_hints().save()
+    save_quota_ledgers()
+    print(
+        f"📝 시트 쓰기 요청 {writer.requests}회: "
+        f"셀 기록 {writer.cells_written}개 / 변경 없음 {writer.cells_skipped}개"
+    )
+    print(get_poll_planner().report())
     print(f"\n🎯 전체 완료: 총 {total_processed}개 종목 처리됨")
 
 # ✅ 메인
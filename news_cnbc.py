@@ -1,14 +1,19 @@
 import os
-import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from src.utils.sheets import load_sheet
-from src.utils.translator import translate_with_claude
+from src.utils import metrics
+from src.utils.feed_cache import get_feed_cache
+from src.utils.rss import parse_feed
+from src.config.settings import Settings
+from src.utils.translator import translate_batch
+from src.utils.translation_cache import get_translation_cache
+from src.utils.sheet_diff import diff_update
 
 # Load environment variables
 load_dotenv()
 SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
 
+@metrics.instrument("cnbc")
 def fetch_cnbc_rss():
     """
     Fetch and parse CNBC RSS feeds.
@@ -27,36 +32,41 @@ def fetch_cnbc_rss():
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
         }
         
-        # Fetch RSS feed
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        # Fetch RSS feed (reuses the cached copy when unchanged)
+        content = get_feed_cache().fetch(
+            url,
+            "cnbc",
+            max_age=Settings().get_news_settings("cnbc").get("max_age", 0),
+            headers=headers
+        )
         
-        # Parse XML content
-        soup = BeautifulSoup(response.content, 'xml')
-        items = soup.find_all('item')
+        # Parse XML content (stops after the first 30 items)
+        items = parse_feed(content, limit=30)
         
         # Collect news items
         original_news = []
-        translated_news = []
         
-        for item in items[:30]:  # Get first 30 items
-            title = item.title.text
-            content = item.description.text
-            pub_date = item.pubDate.text
-            link = item.link.text
+        for item in items:
+            title = item["title"]
+            content = item["summary"]
+            pub_date = item["published"]
+            link = item["link"]
             
             # Store original news
             original_news.append([title, content, pub_date, link])
             
-            # Translate title and content
-            translated_title = translate_with_claude(title)
-            translated_content = translate_with_claude(content)
-            
-            # Store translated news
-            translated_news.append([translated_title, translated_content])
-            
             print(f"Processed: {title}")  # Add progress indicator
         
+        # Translate all titles and contents in batched requests
+        texts = [news[0] for news in original_news] + [news[1] for news in original_news]
+        translated = translate_batch(texts)
+        half = len(original_news)
+        translated_news = [
+            [translated[i], translated[half + i]]
+            for i in range(half)
+        ]
+        
+        print(get_translation_cache().report())
         return original_news, translated_news
         
     except Exception as e:
@@ -81,11 +91,12 @@ def update_cnbc_sheet():
             print("❌ Failed to load Google Sheet")
             return
         
-        # Update original news (A2:D31)
-        worksheet.update(range_name='A2:D31', values=original_news)
-
-        # Update translated news (A34:B63)
-        worksheet.update(range_name='A34:B63', values=translated_news)
+        # Update original news (A2:D31) and translated news (A34:B63),
+        # writing only the cells that changed since the last run
+        diff_update(worksheet, [
+            ('A2:D31', original_news),
+            ('A34:B63', translated_news)
+        ])
         
         print("✅ CNBC 뉴스 업데이트 완료")
         
@@ -1,7 +1,11 @@
-from datetime import datetime
-import feedparser
 import urllib.parse 
+from src.utils import metrics
+from src.utils.feed_cache import get_feed_cache
+from src.utils.rss import feed_parser
+from src.config.settings import Settings
+from src.collectors.news_item import NewsItem
 
+@metrics.instrument("google")
 def get_google_rss_global_news(ticker, count=5):
     """
     Google 뉴스 RSS (영어) 기반 글로벌 종목 뉴스 수집
@@ -10,24 +14,26 @@ def get_google_rss_global_news(ticker, count=5):
     """
     query = urllib.parse.quote_plus(ticker)  # ← 공백 포함 인코딩
     url = f"https://news.google.com/rss/search?q={query}&hl=en&gl=US&ceid=US:en"
-    feed = feedparser.parse(url)
+    try:
+        feed = get_feed_cache().fetch_parsed(
+            url,
+            "google",
+            feed_parser(count),
+            max_age=Settings().get_news_settings("google").get("max_age", 0)
+        )
+    except Exception as e:
+        print(f"❌ 구글 뉴스 RSS 수집 실패 ({ticker}): {e}")
+        return None
 
-    results = []
-    for entry in feed.entries[:count]:
-        raw_date = entry.published if "published" in entry else "N/A"
-
-        try:
-            parsed_date = datetime.strptime(raw_date, "%a, %d %b %Y %H:%M:%S %Z")
-            publish_date = parsed_date.strftime("%Y-%m-%d")
-        except:
-            publish_date = "N/A"
-
-        results.append({
-            "title": entry.title,
-            "link": entry.link,
-            "snippet": entry.summary,
-            "lang": "lang_en",
-            "publish_date": publish_date
-        })
+    results = [
+        NewsItem.from_raw(
+            entry["title"],
+            entry["link"],
+            entry["published"],
+            entry["summary"],
+            "google"
+        )
+        for entry in feed
+    ]
 
     return results if results else None
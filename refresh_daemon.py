@@ -0,0 +1,272 @@
+"""
+Long-running refresh daemon for the kr / global / CNBC news sheets.
+
+Usage:
+    python run.py --daemon [--max-runtime SECONDS]
+
+The process stays up, so the pooled HTTP session, feed and translation
+caches, Sheets session and ticker indexes stay warm. Tickers are
+refreshed one by one from a ``RefreshQueue``:
+    - hot tickers (tier 1 or many new articles) come back within minutes
+    - quiet ones wait up to their tier interval
+Rows are buffered and written in coalesced ``batch_update`` calls every
+``DAEMON_FLUSH_INTERVAL`` seconds. CNBC is refreshed on its own interval.
+The queue alone decides when a ticker is refreshed, so daemon fetches
+bypass the adaptive poll planner used by the batch runs.
+
+Tiers are read from ``DAEMON_TIERS_FILE`` (default ``tiers.json``), e.g.
+``{"kr": {"삼성전자": 1}, "global": {"AAPL": 1, "XYZ": 3}}``. A flat
+``{"AAPL": 1}`` applies to both sheets, and unlisted tickers use
+``DAEMON_DEFAULT_TIER``.
+"""
+
+import json
+import os
+import signal
+import threading
+import time
+
+from dotenv import load_dotenv
+
+import global_news
+import kr_news
+import news_cnbc
+from src.config.settings import Settings
+from src.collectors.naver import get_display_hints
+from src.utils import metrics, transport
+from src.utils.concurrent_fetch import FetchEngine
+from src.utils.feed_cache import get_feed_cache
+from src.utils.ratelimit import save_quota_ledgers
+from src.utils.refresh_queue import RefreshQueue
+from src.utils.sheet_writer import BatchSheetWriter
+
+load_dotenv()
+SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
+
+PIPELINES = ("kr", "global")
+
+
+def load_tiers(path):
+    """
+    Read the ticker tier file.
+
+    Args:
+        path (str): JSON file with ``{pipeline: {ticker: tier}}`` or ``{ticker: tier}``
+
+    Returns:
+        Dict[str, Dict[str, int]]: Tiers per pipeline (empty when the file is missing)
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️ 티어 파일 읽기 실패 ({path}): {e}")
+        return {}
+
+    if any(pipeline in data for pipeline in PIPELINES):
+        return {pipeline: {k: int(v) for k, v in data.get(pipeline, {}).items()} for pipeline in PIPELINES}
+    flat = {k: int(v) for k, v in data.items()}
+    return {pipeline: flat for pipeline in PIPELINES}
+
+
+class RefreshDaemon:
+    """Keeps the pipelines warm and refreshes tickers as they come due."""
+
+    def __init__(self, sheet_id=None, settings=None):
+        """
+        Initialize daemon.
+
+        Args:
+            sheet_id (str, optional): Google Sheet ID
+            settings (Settings, optional): Application settings
+        """
+        settings = settings or Settings()
+        self.sheet_id = sheet_id
+        self.settings = settings.get_daemon_settings()
+        self.write_settings = settings.get_sheet_write_settings()
+        fetch_settings = settings.get_fetch_settings()
+        self.engine = FetchEngine(
+            max_workers=fetch_settings["max_workers"],
+            host_limits=fetch_settings["host_limits"],
+            concurrent=fetch_settings["concurrent"]
+        )
+        self.collectors = global_news.make_collectors()
+        self.batch_sources = global_news.get_batch_sources()
+        self.queue = RefreshQueue(self.settings["tier_intervals"], self.settings["min_interval"])
+        self.rows = {}
+        self.writers = {}
+        self.stop_event = threading.Event()
+        self.refreshes = 0
+        self.new_articles = 0
+        self._loaded_at = 0.0
+        self._exported_at = 0.0
+        self._cnbc_due = 0.0
+
+    # ✅ 종목/시트 로딩 (재로딩 시 버퍼를 먼저 기록)
+    def load(self):
+        self.flush(force=True)
+        tiers = load_tiers(self.settings["tiers_file"])
+        default_tier = self.settings["default_tier"]
+        loaders = {"kr": kr_news.load_kr_tickers, "global": global_news.load_global_tickers}
+
+        keys, rows = {}, {}
+        for pipeline in PIPELINES:
+            _, sheet, index = loaders[pipeline](self.sheet_id)
+            self.writers[pipeline] = BatchSheetWriter(
+                sheet,
+                chunk_size=self.write_settings["chunk_size"],
+                flush_interval=self.settings["flush_interval"],
+                max_retries=self.write_settings["max_retries"],
+                diff=True
+            )
+            for ticker, row in index.entries():
+                rows[(pipeline, ticker)] = row
+                keys[(pipeline, ticker)] = tiers.get(pipeline, {}).get(ticker, default_tier)
+
+        self.rows = rows
+        self.queue.sync(keys)
+        self._loaded_at = time.monotonic()
+        counts = {pipeline: sum(1 for p, _ in keys if p == pipeline) for pipeline in PIPELINES}
+        tiered = sum(1 for key, tier in keys.items() if tier != default_tier)
+        print(f"📋 종목 로드: 국내 {counts['kr']}개 / 해외 {counts['global']}개 (티어 지정 {tiered}개)")
+
+    # ✅ 만기 종목 갱신 (국내는 종목·소스별, 해외는 배치 소스로 묶어서 수집)
+    def refresh(self, keys):
+        kr_tickers = [ticker for pipeline, ticker in keys if pipeline == "kr"]
+        global_tickers = [ticker for pipeline, ticker in keys if pipeline == "global"]
+
+        results = {}
+        if kr_tickers:
+            news_by_ticker = kr_news.fetch_kr_news_many(kr_tickers, self.engine)
+            results.update({("kr", ticker): items for ticker, items in news_by_ticker.items()})
+        if global_tickers:
+            news_by_ticker = global_news.fetch_global_news_many(
+                global_tickers, self.engine, self.collectors, self.batch_sources, use_planner=False
+            )
+            results.update({("global", ticker): items for ticker, items in news_by_ticker.items()})
+
+        now = time.monotonic()
+        new_total = 0
+        failed = 0
+        for key in keys:
+            pipeline, ticker = key
+            items = results.get(key)
+            if items is None:
+                # 수집 실패 (장애·한도 소진) → 기존 행과 갱신 속도는 그대로 두고 다음 주기에 재시도
+                self.queue.reschedule(key, self.queue.interval(key), now)
+                failed += 1
+                metrics.inc("daemon_failed_refreshes_total", pipeline=pipeline)
+                continue
+            new = self.queue.record(key, items, now)
+            new_total += new
+            row = self.rows.get(key)
+            if row is None:
+                continue  # 재로딩으로 시트에서 빠진 종목
+            if items:
+                if pipeline == "kr":
+                    kr_news.update_kr_sheet(self.writers["kr"], row, ticker, items)
+                else:
+                    self.writers["global"].add(row, global_news.build_global_row(ticker, items))
+            metrics.observe("items_per_ticker", min(len(items), 6), metrics.COUNT_BUCKETS, pipeline=pipeline)
+            metrics.inc("daemon_refreshes_total", pipeline=pipeline)
+            metrics.inc("daemon_new_articles_total", new, pipeline=pipeline)
+
+        self.refreshes += len(keys)
+        self.new_articles += new_total
+        next_due = self.queue.next_due()
+        wait = f"{max(0.0, next_due - now):.0f}초 후" if next_due is not None else "없음"
+        failures = f", 수집 실패 {failed}개" if failed else ""
+        print(f"🔄 {len(keys)}개 종목 갱신: 새 기사 {new_total}건{failures} (대기열 {len(self.queue)}개, 다음 갱신 {wait})")
+
+    # ✅ 버퍼 기록 (flush_interval 경과 시 또는 강제, 네이버 display 학습·일일 할당량 포함)
+    def flush(self, force=False):
+        for writer in self.writers.values():
+            if force:
+                writer.close()
+            elif writer.due():
+                writer.flush()
+
+        now = time.monotonic()
+        if force or now - self._exported_at >= self.settings["flush_interval"]:
+            self._exported_at = now
+            metrics.export()
+            get_display_hints().save()
+            save_quota_ledgers()
+
+    def _refresh_cnbc(self, now):
+        if now < self._cnbc_due:
+            return
+        self._cnbc_due = now + self.settings["cnbc_interval"]
+        try:
+            news_cnbc.update_cnbc_sheet()
+        except Exception as e:
+            print(f"❌ CNBC 갱신 실패: {e}")
+
+    def stop(self, *_):
+        self.stop_event.set()
+
+    def report(self):
+        lines = [f"📊 데몬 요약: 갱신 {self.refreshes}회, 새 기사 {self.new_articles}건"]
+        hot = sorted(self.queue.states.items(), key=lambda item: -item[1].rate)[:5]
+        for (pipeline, ticker), state in hot:
+            if state.rate <= 0:
+                break
+            lines.append(
+                f"  🔥 [{pipeline}] {ticker}: 시간당 {state.rate:.1f}건, "
+                f"티어 {state.tier}, 갱신 간격 {self.queue.interval((pipeline, ticker)):.0f}초"
+            )
+        return "\n".join(lines)
+
+    def run(self, max_runtime=None):
+        """
+        Refresh until stopped (SIGINT/SIGTERM) or ``max_runtime`` seconds pass.
+
+        Args:
+            max_runtime (float, optional): Seconds to run before flushing and exiting
+        """
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.stop)
+            signal.signal(signal.SIGTERM, self.stop)
+
+        started = time.monotonic()
+        batch_size = self.settings["batch_size"]
+        print("🛰️ 뉴스 갱신 데몬 시작")
+        try:
+            self.load()
+            while not self.stop_event.is_set():
+                now = time.monotonic()
+                if max_runtime is not None and now - started >= max_runtime:
+                    break
+                if now - self._loaded_at >= self.settings["reload_interval"]:
+                    self.load()
+
+                self._refresh_cnbc(now)
+                keys = self.queue.pop_due(batch_size, now)
+                if keys:
+                    self.refresh(keys)
+                self.flush()
+                if keys:
+                    continue
+
+                wake = [self._cnbc_due, self._loaded_at + self.settings["reload_interval"]]
+                next_due = self.queue.next_due()
+                if next_due is not None:
+                    wake.append(next_due)
+                if max_runtime is not None:
+                    wake.append(started + max_runtime)
+                # 버퍼 기록 시점을 놓치지 않도록 최대 5초마다 깨어남
+                self.stop_event.wait(min(5.0, max(0.05, min(wake) - time.monotonic())))
+        finally:
+            self.flush(force=True)
+            print(self.report())
+            print(self.engine.report())
+            print(transport.report())
+            print(get_feed_cache().report())
+            print("🛑 뉴스 갱신 데몬 종료")
+
+
+# ✅ 실행
+if __name__ == "__main__":
+    RefreshDaemon(SHEET_ID).run()
@@ -1,31 +1,111 @@
 """
 Main execution file for stock news collection.
+
+Usage:
+    python run.py [--sequential] [--budget SECONDS] [--profile [DIR]] [--profile-interval SECONDS] [--profile-top N]
+    python run.py --daemon [--max-runtime SECONDS]
+
+The kr, global and CNBC pipelines use different upstream hosts, so they
+run concurrently. Shared limits such as the Sheets quota and Claude rate
+limits are enforced by process-wide limiters, not pauses between pipelines.
+The run can have one deadline budget (``RUN_BUDGET`` or ``--budget``, off by default). Each
+pipeline gets a slice of it; when time runs low, pipelines write what
+they have and the tickers that missed the deadline are reported.
+``--daemon`` keeps running and refreshes tickers by priority instead
+(see ``refresh_daemon.py``).
 """
 
+import argparse
 import os
+from contextlib import nullcontext
+from functools import partial
 from dotenv import load_dotenv
-import time
 from global_news import run_global_news_summary
 from kr_news import run_kr_news_summary
 from news_cnbc import update_cnbc_sheet
+from src.utils import deadline, metrics, transport
+from src.utils.feed_cache import get_feed_cache
+from src.utils.profiler import SamplingProfiler
+from src.utils.scheduler import PipelineScheduler, Stage
+
+# 순차 실행 시 파이프라인별 예산 비중 (남은 시간을 아직 실행하지 않은 파이프라인끼리 나눔)
+STAGE_SHARES = {"kr": 0.45, "global": 0.45, "cnbc": 0.10}
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Collect stock news into Google Sheets")
+    parser.add_argument("--sequential", action="store_true", help="run the pipelines one after another")
+    parser.add_argument("--daemon", action="store_true", help="stay up and refresh tickers by priority")
+    parser.add_argument("--max-runtime", type=float, help="daemon: seconds to run before exiting")
+    parser.add_argument("--budget", type=float, help="seconds for the whole run (default: RUN_BUDGET, 0 = no limit)")
+    parser.add_argument(
+        "--profile", nargs="?", const="profiles", metavar="DIR",
+        help="sample the run and write per-stage pstats / flame files to DIR (default: profiles)"
+    )
+    parser.add_argument("--profile-interval", type=float, default=0.01, help="seconds between samples")
+    parser.add_argument("--profile-top", type=int, default=20, help="hotspots listed in the summary")
+    return parser.parse_args()
+
+def build_stages(sheet_id, profiler=None, run_deadline=None, sequential=False):
+    """Pipeline graph: kr, global and CNBC share no data, so none depends on another."""
+    pending = list(STAGE_SHARES)
+
+    def pipeline(name, banner, fn, deps=()):
+        def run_stage():
+            # 동시 실행은 전체 남은 시간을, 순차 실행은 남은 파이프라인 비중만큼을 사용
+            share = STAGE_SHARES[name] / sum(STAGE_SHARES[p] for p in pending) if sequential else 1.0
+            pending.remove(name)
+            stage_deadline = run_deadline.child(name, share) if run_deadline else None
+            print(f"\n{banner} 수집 시작...")
+            with metrics.timer("pipeline_seconds", pipeline=name), \
+                    (profiler.stage(name) if profiler else nullcontext()), \
+                    deadline.scope(stage_deadline):
+                fn()
+        return Stage(name, run_stage, deps)
+
+    return [
+        pipeline("kr", "🇰🇷 한국 뉴스", partial(run_kr_news_summary, sheet_id)),
+        pipeline("global", "🌍 글로벌 뉴스", partial(run_global_news_summary, sheet_id)),
+        pipeline("cnbc", "📈 CNBC 뉴스", update_cnbc_sheet),
+    ]
 
 def main():
+    args = parse_args()
     # Load environment variables
     load_dotenv()
     SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
-    
-    print("\n🇰🇷 한국 뉴스 수집 시작...")
-    run_kr_news_summary(SHEET_ID)
-    time.sleep(2)
-    
-    print("\n🌍 글로벌 뉴스 수집 시작...")
-    run_global_news_summary(SHEET_ID)
-    time.sleep(2)  # API 호출 간 간격 두기
-    
-    print("\n📈 CNBC 뉴스 수집 시작...")
-    update_cnbc_sheet()
+
+    profiler = None
+    if args.profile:
+        profiler = SamplingProfiler(args.profile, args.profile_interval, args.profile_top).start()
+
+    if args.daemon:
+        from refresh_daemon import RefreshDaemon
+
+        with profiler.stage("daemon") if profiler else nullcontext():
+            RefreshDaemon(SHEET_ID).run(max_runtime=args.max_runtime)
+        if profiler:
+            profiler.stop()
+            print(profiler.write())
+        return
+
+    run_deadline = deadline.start_run(args.budget)
+    scheduler = PipelineScheduler(
+        build_stages(SHEET_ID, profiler, run_deadline, sequential=args.sequential),
+        concurrent=not args.sequential
+    )
+    scheduler.run()
     
     print("\n✨ 모든 뉴스 수집 완료!")
+    print(scheduler.timeline())
+    print(run_deadline.report())
+    print(transport.report())
+    print(get_feed_cache().report())
+    metrics.export()
+
+    if profiler:
+        profiler.stop()
+        print(profiler.write())
+        print(f"🔥 프로파일 저장: {args.profile}/ (*.pstats, *.collapsed, summary.txt)")
 
 if __name__ == "__main__":
     main()
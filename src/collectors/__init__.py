@@ -7,6 +7,7 @@ from .yahoo import YahooCollector
 from .newsapi import NewsAPICollector
 from .google_rss import GoogleRSSCollector
 from .naver import NaverCollector
+from .news_item import NewsItem
 
 __all__ = [
     'CNBCCollector',
@@ -14,4 +15,5 @@ __all__ = [
     'NewsAPICollector',
     'GoogleRSSCollector',
     'NaverCollector',
+    'NewsItem',
 ] 
\ No newline at end of file
@@ -3,16 +3,17 @@ CNBC news collector.
 """
 
 import os
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
 from typing import List, Tuple
 
-from cnbc_news import update_cnbc_sheet
-
-from ..utils.translator import translate_with_claude
+from .news_item import NewsItem
+from ..utils.translator import translate_batch
+from ..utils.translation_cache import get_translation_cache
 from ..utils.summarizer import summarize_with_claude
 from ..utils.logger import setup_logger
+from ..utils import metrics
+from ..utils.feed_cache import get_feed_cache
+from ..utils.rss import parse_feed
+from ..utils.sheet_diff import diff_update
 from ..config.sheet import load_sheet
 from ..config.settings import Settings
 
@@ -38,6 +39,7 @@ class CNBCCollector:
         
         logger.debug("Initialized CNBC collector")
     
+    @metrics.instrument("cnbc")
     def fetch_news(self, count: int = None) -> Tuple[List[List[str]], List[List[str]]]:
         """
         Fetch news from CNBC RSS feed.
@@ -52,43 +54,46 @@ class CNBCCollector:
         
         try:
             logger.info("Fetching CNBC news")
-            res = requests.get(self.url, headers=self.headers)
-            res.raise_for_status()
+            content = get_feed_cache().fetch(
+                self.url,
+                "cnbc",
+                max_age=self.settings.get_news_settings("cnbc").get("max_age", 0),
+                headers=self.headers
+            )
         except Exception as e:
             logger.error(f"Failed to fetch CNBC RSS: {e}")
             return [], []
 
-        soup = BeautifulSoup(res.content, "xml")
-        items = soup.find_all("item")[:count]
+        items = parse_feed(content, limit=count)
         logger.info(f"Found {len(items)} news items")
 
         original_news = []
         translated_news = []
 
         for i, item in enumerate(items, 1):
-            title = item.title.text.strip()
-            description = item.description.text.strip()
-            link = item.link.text.strip()
-            pub_date_raw = item.pubDate.text.strip()
-
-            try:
-                pub_date = datetime.strptime(pub_date_raw, "%a, %d %b %Y %H:%M:%S %Z").strftime("%Y-%m-%d %H:%M")
-            except Exception as e:
-                logger.warning(f"Failed to parse date '{pub_date_raw}': {e}")
-                pub_date = pub_date_raw
+            news = NewsItem.from_raw(
+                item["title"],
+                item["link"],
+                item["published"],
+                item["summary"],
+                "cnbc"
+            )
+            if news.published is None:
+                logger.warning(f"Failed to parse date '{news.raw_date}'")
 
             logger.debug(f"Processing news item {i}/{len(items)}")
             
             # 원본 영문 뉴스 저장 (제목, 내용, 날짜, 링크)
-            original_news.append([title, description, pub_date, link])
-            
-            # 제목과 내용 번역
-            translated_title = translate_with_claude(title)
-            translated_desc = translate_with_claude(description)
-            
-            # 번역된 뉴스 저장
-            translated_news.append([translated_title, translated_desc])
+            original_news.append([news.title, news.snippet, news.format_date("%Y-%m-%d %H:%M"), news.link])
+
+        # 제목과 내용을 배치 요청으로 한꺼번에 번역
+        texts = [news[0] for news in original_news] + [news[1] for news in original_news]
+        translated = translate_batch(texts)
+        half = len(original_news)
+        for i in range(half):
+            translated_news.append([translated[i], translated[half + i]])
 
+        logger.info(get_translation_cache().report())
         return original_news, translated_news
     
     def update_sheet(self) -> None:
@@ -104,23 +109,17 @@ class CNBCCollector:
         update_range = settings.get("update_range", {})
 
         try:
-            # 원본 영문 뉴스 업데이트
-            self.sheet.update(
-                update_range.get("original", "A2:D31"),
-                original_news
-            )
-            logger.info("Updated original news")
-            
-            # 번역된 한국어 뉴스 업데이트
-            self.sheet.update(
-                update_range.get("translated", "A34:B63"),
-                translated_news
-            )
-            logger.info("Updated translated news")
+            # 원본 영문 / 번역된 한국어 뉴스 업데이트 (변경된 셀만)
+            written, skipped = diff_update(self.sheet, [
+                (update_range.get("original", "A2:D31"), original_news),
+                (update_range.get("translated", "A34:B63"), translated_news)
+            ])
+            logger.info(f"Updated news cells: {written} written, {skipped} unchanged")
             
             logger.info("✅ CNBC news update completed")
         except Exception as e:
             logger.error(f"Failed to update sheet: {e}")
 
 if __name__ == "__main__":
-    update_cnbc_sheet(SHEET_ID) 
\ No newline at end of file
+    from cnbc_news import SHEET_ID, update_cnbc_sheet
+    update_cnbc_sheet(SHEET_ID)
\ No newline at end of file
@@ -2,19 +2,25 @@
 Google RSS news collector.
 """
 
-import feedparser
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import List
 from urllib.parse import quote
 
+from .news_item import NewsItem
+from ..utils import metrics
+from ..utils.feed_cache import get_feed_cache
+from ..utils.rss import feed_parser
+from ..config.settings import Settings
+
 class GoogleRSSCollector:
     """Google RSS news collector class."""
     
     def __init__(self):
         """Initialize Google RSS collector."""
         self.base_url = "https://news.google.com/rss/search?q={}&hl=en-US&gl=US&ceid=US:en"
+        self.max_age = Settings().get_news_settings("google").get("max_age", 0)
     
-    def fetch_news(self, query: str, count: int = 2) -> List[Dict[str, str]]:
+    @metrics.instrument("google")
+    def fetch_news(self, query: str, count: int = 2) -> List[NewsItem]:
         """
         Fetch news for a specific query.
         
@@ -23,39 +29,27 @@ class GoogleRSSCollector:
             count (int): Number of news items to fetch
             
         Returns:
-            List[Dict[str, str]]: List of news items
+            List[NewsItem]: List of news items
         """
         try:
             encoded_query = quote(query)
-            feed = feedparser.parse(self.base_url.format(encoded_query))
-            items = feed.entries[:count]
-            
-            news_items = []
-            for item in items:
-                news_items.append({
-                    "title": item.title,
-                    "link": item.link,
-                    "publish_date": self._parse_date(item.published),
-                    "snippet": item.get("summary", "")
-                })
+            feed = get_feed_cache().fetch_parsed(
+                self.base_url.format(encoded_query),
+                "google",
+                feed_parser(count),
+                max_age=self.max_age
+            )
             
-            return news_items
+            return [
+                NewsItem.from_raw(
+                    item["title"],
+                    item["link"],
+                    item["published"],
+                    item["summary"],
+                    "google"
+                )
+                for item in feed
+            ]
         except Exception as e:
             print(f"❌ Google RSS 뉴스 수집 실패 ({query}): {e}")
             return []
-    
-    def _parse_date(self, date_str: str) -> str:
-        """
-        Parse date string to formatted date.
-        
-        Args:
-            date_str (str): Date string from RSS feed
-            
-        Returns:
-            str: Formatted date string
-        """
-        try:
-            dt = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %Z")
-            return dt.strftime("%Y-%m-%d")
-        except:
-            return date_str
@@ -1,9 +1,15 @@
 # news_naver.py
 
+import json
+import os
 import re
-import requests
+import threading
 from datetime import datetime, timedelta
-from src.config.env import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+from src.config.env import CACHE_DIR, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+from src.utils import metrics, transport
+from src.utils.ratelimit import QuotaExhausted, get_quota_ledger
+from src.utils.dates import parse_datetime
+from src.collectors.news_item import NewsItem
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 
@@ -13,23 +19,86 @@ def is_recent(pubdate_str):
     pubDate 문자열이 최근 3일 이내인지 확인 (RFC822 포맷)
     예시: 'Fri, 12 Apr 2025 09:34:00 +0900'
     """
-    try:
-        news_time = datetime.strptime(pubdate_str, "%a, %d %b %Y %H:%M:%S %z")
-        now = datetime.now(news_time.tzinfo)
-        return now - news_time <= timedelta(days=3)
-    except Exception as e:
-        print(f"⚠️ 날짜 파싱 실패: {e}")
+    news_time = parse_datetime(pubdate_str)
+    if news_time is None:
+        print(f"⚠️ 날짜 파싱 실패: {pubdate_str}")
         return False
+    return datetime.now(news_time.tzinfo) - news_time <= timedelta(days=3)
 
 
-def fetch_news(query, display=10):
-    """
-    네이버 뉴스에서 query 키워드로 뉴스 수집
-    - 정확도순 정렬
-    - 종목명 포함 + 3일 이내 뉴스만 허용
-    - 최대 3건 반환
-    """
-    url = "https://openapi.naver.com/v1/search/news.json"
+NAVER_NEWS_URL = "https://openapi.naver.com/v1/search/news.json"
+MIN_DISPLAY, MAX_DISPLAY = 5, 100
+# 종목당 최대 요청 수 (정확도순 → 최신순 순서로 소진)
+PAGE_BUDGET = int(os.getenv("NAVER_PAGE_BUDGET", "4"))
+
+# 네이버 검색 API 한도: 초당 10회 (transport의 호스트별 제한, NAVER_RPS), 일 25,000회
+_daily = get_quota_ledger("naver", int(os.getenv("NAVER_DAILY_LIMIT", "25000")))
+_quota_warned = False
+
+
+class DisplayHints:
+    """Per-query ``display`` sizes learned across runs (written once per run with ``save``)."""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CACHE_DIR, "naver_display.json")
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.hints = json.load(f)
+        except (OSError, ValueError):
+            self.hints = {}
+
+    def get(self, query, default=10):
+        return self.hints.get(query, default)
+
+    def learn(self, query, needed, display):
+        """
+        needed: 마지막 유효 뉴스까지 읽은 항목 수 (목표 건수를 못 채우면 None)
+        → 다음 실행의 display = needed + 25% 여유, 못 채웠으면 2배
+        """
+        if needed is None:
+            size = display * 2
+        else:
+            size = (needed * 5 + 3) // 4  # 25% 여유
+        size = max(MIN_DISPLAY, min(MAX_DISPLAY, size))
+        with self._lock:
+            if self.hints.get(query) != size:
+                self.hints[query] = size
+                self._dirty = True
+
+    def save(self):
+        """변경된 학습 결과를 파일에 원자적으로 기록 (실행 종료 시 호출)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self.hints, ensure_ascii=False)
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"⚠️ 네이버 display 기록 실패: {e}")
+
+
+_hints = None
+_hints_lock = threading.Lock()
+
+
+def get_display_hints():
+    global _hints
+    with _hints_lock:
+        if _hints is None:
+            _hints = DisplayHints()
+        return _hints
+
+
+def _search(query, display, start, sort):
+    if not _daily.try_consume():
+        raise QuotaExhausted(f"daily limit {_daily.daily_limit} reached")
     headers = {
         "X-Naver-Client-Id": NAVER_CLIENT_ID,
         "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
@@ -37,52 +106,95 @@ def fetch_news(query, display=10):
     params = {
         "query": query,
         "display": display,
-        "start": 1,
-        "sort": "sim"  # 정확도순
+        "start": start,
+        "sort": sort
     }
+    response = transport.get(NAVER_NEWS_URL, headers=headers, params=params)
+    response.raise_for_status()
+    return response.json().get("items", [])
+
 
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-    except Exception as e:
-        print(f"❌ 네이버 뉴스 API 요청 실패: {e}")
-        return []
+@metrics.instrument("naver")
+def fetch_news(query, display=None, limit=3):
+    """
+    네이버 뉴스에서 query 키워드로 뉴스 수집
+    - 정확도순으로 시작, 부족하면 다음 페이지 → 최신순으로 전환
+    - 종목명 포함 + 3일 이내 뉴스만 허용
+    - 최신순에서 3일 기준을 지나면 즉시 중단
+    - 최대 limit건 반환, 종목별 display 크기는 실행 간 학습
+    - 요청이 실패해 아무것도 받지 못하면 None (검색 결과 없음인 [] 와 구분)
+    - 일일 한도 소진 시 QuotaExhausted (받은 결과가 있으면 그 결과를 반환)
+    """
+    global _quota_warned
+    hints = get_display_hints()
+    display = display or hints.get(query)
 
-    items = response.json().get("items", [])
     results = []
+    seen = set()
+    scanned = 0
+    requests_made = 0
+    done = False
+    failed = False
 
-    for item in items:
-        title = item["title"].replace("<b>", "").replace("</b>", "")
-        desc = item["description"].replace("<b>", "").replace("</b>", "")
-        link = item.get("originallink") or item.get("link")
-        pubdate = item.get("pubDate")
+    for sort in ("sim", "date"):
+        start = 1
+        while not done and requests_made < PAGE_BUDGET and start <= 1000:
+            try:
+                items = _search(query, display, start, sort)
+            except QuotaExhausted as e:
+                if not _quota_warned:
+                    print(f"⚠️ 네이버 일일 호출 한도 도달 → 남은 종목 건너뜀: {e}")
+                    _quota_warned = True
+                if not results:
+                    raise
+                done = failed = True
+                break
+            except Exception as e:
+                print(f"❌ 네이버 뉴스 API 요청 실패: {e}")
+                done = failed = True
+                break
+            requests_made += 1
 
-        # 종목명이 제목에 없으면 제외
-        if query not in title:
-            continue
+            for item in items:
+                scanned += 1
+                title = item["title"].replace("<b>", "").replace("</b>", "")
+                desc = item["description"].replace("<b>", "").replace("</b>", "")
+                link = item.get("originallink") or item.get("link")
+                pubdate = item.get("pubDate")
 
-        # 날짜 필터
-        if not pubdate or not is_recent(pubdate):
-            continue
+                if link in seen:
+                    continue
 
-        # ✅ 날짜 포맷 변환
-        try:
-            parsed = datetime.strptime(pubdate, "%a, %d %b %Y %H:%M:%S %z")
-            formatted_date = parsed.strftime("%Y-%m-%d")
-        except Exception as e:
-            print(f"⚠️ 날짜 포맷 실패: {e}")
-            formatted_date = "N/A"
+                # 날짜 필터 (최신순이면 이후 항목도 모두 오래된 뉴스 → 중단)
+                if not pubdate or not is_recent(pubdate):
+                    if sort == "date" and pubdate:
+                        done = True
+                        break
+                    continue
 
-        results.append({
-            "title": title,
-            "description": desc,
-            "link": link,
-            "date": formatted_date
-        })
+                # 종목명이 제목에 없으면 제외
+                if query not in title:
+                    continue
+
+                seen.add(link)
+                results.append(NewsItem.from_raw(title, link, pubdate, desc, "naver"))
+
+                if len(results) >= limit:
+                    done = True
+                    break
 
-        if len(results) >= 3:
+            # 결과가 더 없거나 정확도순 2페이지를 넘기면 다음 정렬로
+            start += display
+            if len(items) < display or (sort == "sim" and start > display * 2):
+                break
+        if done:
             break
 
+    # 요청이 실패한 조회는 학습하지 않음 (표시 개수가 부족했던 것이 아님)
+    if failed:
+        return results or None
+    needed = scanned if len(results) >= limit else None
+    hints.learn(query, needed, display)
     return results
 
 
@@ -100,7 +212,8 @@ class NaverCollector:
             )
         }
     
-    def fetch_news(self, code: str, count: int = 5) -> List[Dict[str, str]]:
+    @metrics.instrument("naver_finance")
+    def fetch_news(self, code: str, count: int = 5) -> List[NewsItem]:
         """
         Fetch news for a specific stock code.
         
@@ -109,7 +222,7 @@ class NaverCollector:
             count (int): Number of news items to fetch
             
         Returns:
-            List[Dict[str, str]]: List of news items
+            List[NewsItem]: List of news items
         """
         try:
             params = {
@@ -117,7 +230,7 @@ class NaverCollector:
                 "page": 1
             }
             
-            res = requests.get(
+            res = transport.get(
                 self.base_url,
                 params=params,
                 headers=self.headers
@@ -141,12 +254,12 @@ class NaverCollector:
                 link = "https://finance.naver.com" + title_tag["href"]
                 date = row.select_one("td:nth-child(3)").text.strip()
                 
-                news_items.append({
-                    "title": title,
-                    "link": link,
-                    "publish_date": date,
-                    "source": row.select_one("td:nth-child(2)").text.strip()
-                })
+                news_items.append(NewsItem.from_raw(
+                    title,
+                    link,
+                    date,
+                    source=row.select_one("td:nth-child(2)").text.strip()
+                ))
                 
                 if len(news_items) >= count:
                     break
@@ -0,0 +1,84 @@
+"""
+Unified news item record shared by all collectors.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+from ..utils.dates import parse_datetime
+
+
+@dataclass(frozen=True, slots=True)
+class NewsItem:
+    """
+    Immutable news item with a tz-aware publish timestamp.
+
+    ``source`` names the collector, or the publisher when the collector
+    reports one (Naver Finance).
+    """
+
+    title: str
+    link: str
+    published: Optional[datetime] = None
+    snippet: str = ""
+    source: str = ""
+    raw_date: str = ""
+
+    @classmethod
+    def from_raw(
+        cls,
+        title: str,
+        link: str,
+        raw_date: str = "",
+        snippet: str = "",
+        source: str = ""
+    ) -> "NewsItem":
+        """
+        Build an item, parsing ``raw_date`` with the shared memoized parser.
+
+        Args:
+            title (str): Headline
+            link (str): Article URL
+            raw_date (str): Date string as published by the source
+            snippet (str): Summary or description
+            source (str): Collector or publisher name
+
+        Returns:
+            NewsItem: New item
+        """
+        return cls(title, link, parse_datetime(raw_date), snippet or "", source, raw_date or "")
+
+    def format_date(self, fmt: str = "%Y-%m-%d") -> str:
+        """Published date in ``fmt``, falling back to the raw string or ``N/A``."""
+        if self.published is None:
+            return self.raw_date or "N/A"
+        return self.published.strftime(fmt)
+
+    @property
+    def date(self) -> str:
+        """Published date as ``YYYY-MM-DD``."""
+        return self.format_date()
+
+    def row_cells(self) -> Tuple[str, str, str]:
+        """Title, link and date cells for the A~S news sheets."""
+        return self.title, self.link, self.format_date()
+
+
+def ticker_pattern(ticker: str) -> "re.Pattern":
+    """
+    Pattern finding ``ticker`` as a whole word in article text.
+
+    All-caps symbols match case-sensitively, so tickers that are also
+    common words (ON, ALL, NOW, IT) do not match ordinary prose; other
+    terms (e.g. company names) match in any case.
+
+    Args:
+        ticker (str): Ticker symbol or search term
+
+    Returns:
+        re.Pattern: Compiled pattern
+    """
+    flags = 0 if ticker.isupper() else re.IGNORECASE
+    return re.compile(rf"(?<![A-Za-z0-9]){re.escape(ticker)}(?![A-Za-z0-9])", flags)
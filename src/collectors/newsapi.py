@@ -5,64 +5,188 @@ NewsAPI collector for financial news.
 """
 
 import os
-import requests
+import re
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 
+from .news_item import NewsItem, ticker_pattern
+from ..utils import metrics, transport
+from ..utils.ratelimit import QuotaExhausted, get_quota_ledger
+from ..config.settings import Settings
+
+# NewsAPI q 파라미터 최대 길이
+MAX_QUERY_LENGTH = 500
+MAX_PAGE_SIZE = 100
+
+
+class NewsAPIQuotaExceeded(QuotaExhausted):
+    """Raised when the local daily quota ledger is exhausted."""
+
+
 class NewsAPICollector:
     """NewsAPI collector class."""
-    
+
     def __init__(self):
         """Initialize NewsAPI collector."""
         self.api_key = os.getenv("NEWSAPI_KEY")
         self.base_url = "https://newsapi.org/v2/everything"
-        
+
         if not self.api_key:
             raise ValueError("NewsAPI key not found in environment variables")
-    
-    def fetch_news(self, query: str, count: int = 1) -> List[Dict[str, str]]:
+
+        settings = Settings().get_news_settings("newsapi")
+        self.max_pages = settings.get("max_pages", 1)
+        self.ledger = get_quota_ledger("newsapi", settings.get("daily_limit", 100))
+        self._quota_warned = False
+
+    def _request(self, query: str, page_size: int, page: int = 1) -> Dict:
+        """Send one /everything request, charging it to the daily quota ledger."""
+        if not self.ledger.try_consume():
+            raise NewsAPIQuotaExceeded(
+                f"daily limit {self.ledger.daily_limit} reached"
+            )
+
+        # Get date range for last 7 days
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=7)
+
+        params = {
+            "q": query,
+            "apiKey": self.api_key,
+            "language": "en",
+            "sortBy": "relevancy",
+            "pageSize": page_size,
+            "page": page,
+            "from": start_date.strftime("%Y-%m-%d"),
+            "to": end_date.strftime("%Y-%m-%d")
+        }
+
+        res = transport.get(self.base_url, params=params)
+        res.raise_for_status()
+        data = res.json()
+
+        if data["status"] != "ok":
+            raise Exception(f"API Error: {data.get('message', 'Unknown error')}")
+        return data
+
+    @staticmethod
+    def _to_item(article: Dict) -> NewsItem:
+        return NewsItem.from_raw(
+            article["title"],
+            article["url"],
+            article["publishedAt"],
+            article["description"] or article["content"] or "",
+            "newsapi"
+        )
+
+    @metrics.instrument("newsapi")
+    def fetch_news(self, query: str, count: int = 1) -> List[NewsItem]:
         """
         Fetch news for a specific query.
-        
+
         Args:
             query (str): Search query
             count (int): Number of news items to fetch
-            
+
         Returns:
-            List[Dict[str, str]]: List of news items
+            List[NewsItem]: List of news items
+
+        Raises:
+            NewsAPIQuotaExceeded: The daily quota is used up (the query was not searched)
         """
         try:
-            # Get date range for last 7 days
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=7)
-            
-            params = {
-                "q": query,
-                "apiKey": self.api_key,
-                "language": "en",
-                "sortBy": "relevancy",
-                "pageSize": count,
-                "from": start_date.strftime("%Y-%m-%d"),
-                "to": end_date.strftime("%Y-%m-%d")
-            }
-            
-            res = requests.get(self.base_url, params=params)
-            res.raise_for_status()
-            data = res.json()
-            
-            if data["status"] != "ok":
-                raise Exception(f"API Error: {data.get('message', 'Unknown error')}")
-            
-            news_items = []
-            for article in data["articles"][:count]:
-                news_items.append({
-                    "title": article["title"],
-                    "link": article["url"],
-                    "date": article["publishedAt"].split("T")[0],
-                    "snippet": article["description"] or article["content"] or ""
-                })
-            
-            return news_items
+            data = self._request(query, count)
+            return [self._to_item(article) for article in data["articles"][:count]]
+        except NewsAPIQuotaExceeded as e:
+            if not self._quota_warned:
+                print(f"⚠️ NewsAPI 일일 한도 도달 → 남은 종목 건너뜀: {e}")
+                self._quota_warned = True
+            raise
         except Exception as e:
             print(f"❌ NewsAPI 뉴스 수집 실패 ({query}): {e}")
             return []
+
+    @staticmethod
+    def _quote(query: str) -> str:
+        return f'"{query}"' if re.search(r"\s", query) else query
+
+    @classmethod
+    def build_queries(cls, queries: List[str]) -> List[List[str]]:
+        """
+        Group queries into ``A OR B OR ...`` searches within the length limit.
+
+        Args:
+            queries (List[str]): Individual search terms
+
+        Returns:
+            List[List[str]]: Groups of terms, one group per request
+        """
+        groups: List[List[str]] = []
+        length = 0
+        for query in queries:
+            term = cls._quote(query)
+            extra = len(term) + (4 if groups and groups[-1] else 0)  # " OR "
+            if groups and length + extra <= MAX_QUERY_LENGTH:
+                groups[-1].append(query)
+                length += extra
+            else:
+                groups.append([query])
+                length = len(term)
+        return groups
+
+    @metrics.instrument("newsapi")
+    def fetch_news_batch(self, queries: List[str], count: int = 1) -> Dict[str, List[NewsItem]]:
+        """
+        Fetch news for many queries with combined OR searches.
+
+        Articles are assigned to every query they mention (title,
+        description or content; all-caps symbols case-sensitively, as
+        for Yahoo), keeping at most ``count`` per query. Further pages are requested only while some
+        query in the group is still short. Once the daily quota ledger is
+        exhausted the remaining groups are skipped instead of failing one
+        request at a time, and their queries are left out of the result
+        (not searched, as opposed to searched with no match).
+
+        Args:
+            queries (List[str]): Search queries (tickers)
+            count (int): Number of news items per query
+
+        Returns:
+            Dict[str, List[NewsItem]]: News items keyed by searched query
+        """
+        results = {query: [] for query in queries}
+        patterns = {query: ticker_pattern(query) for query in results}
+
+        groups = self.build_queries(list(results))
+        for number, group in enumerate(groups):
+            q = " OR ".join(self._quote(query) for query in group)
+            for page in range(1, self.max_pages + 1):
+                try:
+                    data = self._request(q, MAX_PAGE_SIZE, page)
+                except NewsAPIQuotaExceeded as e:
+                    if not self._quota_warned:
+                        print(f"⚠️ NewsAPI 일일 한도 도달 → 남은 종목 건너뜀: {e}")
+                        self._quota_warned = True
+                    # 조회하지 못한 종목은 빈 결과와 구분되도록 제외 (첫 페이지를 받은 묶음은 유지)
+                    for unsearched in groups[number if page == 1 else number + 1:]:
+                        for query in unsearched:
+                            results.pop(query)
+                    return results
+                except Exception as e:
+                    print(f"❌ NewsAPI 배치 수집 실패 ({len(group)}개 종목): {e}")
+                    break
+
+                articles = data.get("articles", [])
+                for article in articles:
+                    text = " ".join(
+                        article.get(key) or "" for key in ("title", "description", "content")
+                    )
+                    for query in group:
+                        if len(results[query]) < count and patterns[query].search(text):
+                            results[query].append(self._to_item(article))
+
+                done = all(len(results[query]) >= count for query in group)
+                if done or len(articles) < MAX_PAGE_SIZE or page * MAX_PAGE_SIZE >= data.get("totalResults", 0):
+                    break
+
+        return results
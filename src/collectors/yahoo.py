@@ -2,19 +2,34 @@
 Yahoo Finance news collector.
 """
 
-import feedparser
+import re
 from typing import List, Dict, Optional
-from datetime import datetime
 from urllib.parse import quote
 
+from .news_item import NewsItem, ticker_pattern
+from ..utils import metrics
+from ..utils.feed_cache import get_feed_cache
+from ..utils.rss import feed_parser
+from ..config.settings import Settings
+
+# 헤드라인 피드가 한 번에 돌려주는 최대 항목 수 (이만큼 오면 잘린 것으로 간주)
+FEED_ITEM_LIMIT = 20
+MAX_BATCH_SIZE = 40
+
+
 class YahooCollector:
     """Yahoo Finance news collector class."""
     
     def __init__(self):
         """Initialize Yahoo collector."""
         self.base_url = "https://feeds.finance.yahoo.com/rss/2.0/headline?s={}&region=US&lang=en-US"
+        settings = Settings().get_news_settings("yahoo")
+        self.max_age = settings.get("max_age", 0)
+        self.batch_size = settings.get("batch_size", 10)
+        self.batch_requests = 0
     
-    def fetch_news(self, ticker: str, count: int = 3) -> List[Dict[str, str]]:
+    @metrics.instrument("yahoo")
+    def fetch_news(self, ticker: str, count: int = 3) -> List[NewsItem]:
         """
         Fetch news for a specific ticker.
         
@@ -23,40 +38,111 @@ class YahooCollector:
             count (int): Number of news items to fetch
             
         Returns:
-            List[Dict[str, str]]: List of news items
+            List[NewsItem]: List of news items
         """
         try:
             # URL encode the ticker to handle spaces and special characters
             encoded_ticker = quote(ticker)
-            feed = feedparser.parse(self.base_url.format(encoded_ticker))
-            items = feed.entries[:count]
-            
-            news_items = []
-            for item in items:
-                news_items.append({
-                    "title": item.title,
-                    "link": item.link,
-                    "publish_date": self._parse_date(item.published),
-                    "snippet": item.get("summary", "")
-                })
+            feed = get_feed_cache().fetch_parsed(
+                self.base_url.format(encoded_ticker),
+                "yahoo",
+                feed_parser(count),
+                max_age=self.max_age
+            )
             
-            return news_items
+            return [self._to_item(item) for item in feed]
         except Exception as e:
             print(f"❌ Yahoo Finance 뉴스 수집 실패 ({ticker}): {e}")
             return []
     
-    def _parse_date(self, date_str: str) -> str:
+    @staticmethod
+    def _to_item(entry: Dict[str, str]) -> NewsItem:
+        return NewsItem.from_raw(
+            entry["title"],
+            entry["link"],
+            entry["published"],
+            entry["summary"],
+            "yahoo"
+        )
+    
+    @staticmethod
+    def _matchers(tickers: List[str], names: Optional[Dict[str, str]]) -> Dict[str, List[re.Pattern]]:
+        matchers = {}
+        for ticker in tickers:
+            patterns = [ticker_pattern(ticker)]
+            name = (names or {}).get(ticker)
+            if name:
+                patterns.append(re.compile(rf"\b{re.escape(name)}\b", re.IGNORECASE))
+            matchers[ticker] = patterns
+        return matchers
+    
+    @metrics.instrument("yahoo")
+    def fetch_news_batch(
+        self,
+        tickers: List[str],
+        count: int = 3,
+        names: Optional[Dict[str, str]] = None
+    ) -> Dict[str, List[NewsItem]]:
         """
-        Parse date string to formatted date.
+        Fetch news for many tickers with comma-separated symbol requests.
+        
+        Items are assigned back to each ticker whose symbol (or company
+        name, when given) appears in the title or summary, keeping at most
+        ``count`` per ticker. When a response is truncated and leaves some
+        tickers short, the batch size is halved and those tickers are
+        requested again; untruncated responses grow the batch size.
         
         Args:
-            date_str (str): Date string from RSS feed
+            tickers (List[str]): Stock ticker symbols
+            count (int): Number of news items per ticker
+            names (Dict[str, str], optional): Company names keyed by ticker
             
         Returns:
-            str: Formatted date string
+            Dict[str, List[NewsItem]]: News items keyed by ticker
         """
-        try:
-            dt = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
-            return dt.strftime("%Y-%m-%d")
-        except:
-            return date_str
+        results = {ticker: [] for ticker in tickers}
+        seen = {ticker: set() for ticker in tickers}
+        matchers = self._matchers(tickers, names)
+        queue = list(dict.fromkeys(tickers))
+        retries = {ticker: 0 for ticker in queue}
+        
+        while queue:
+            batch, queue = queue[:self.batch_size], queue[self.batch_size:]
+            symbols = ",".join(quote(ticker) for ticker in batch)
+            
+            try:
+                feed = get_feed_cache().fetch_parsed(
+                    self.base_url.format(symbols),
+                    "yahoo",
+                    feed_parser(),
+                    max_age=self.max_age
+                )
+                self.batch_requests += 1
+            except Exception as e:
+                print(f"❌ Yahoo Finance 배치 수집 실패 ({symbols}): {e}")
+                continue
+            
+            for entry in feed:
+                text = f"{entry['title']} {entry['summary']}"
+                for ticker in batch:
+                    if len(results[ticker]) >= count or entry["link"] in seen[ticker]:
+                        continue
+                    # 단일 종목 요청은 모든 항목이 해당 종목 뉴스
+                    if len(batch) == 1 or any(p.search(text) for p in matchers[ticker]):
+                        results[ticker].append(self._to_item(entry))
+                        seen[ticker].add(entry["link"])
+            
+            truncated = len(feed) >= FEED_ITEM_LIMIT
+            starved = [
+                ticker for ticker in batch
+                if len(results[ticker]) < count and retries[ticker] < 3
+            ]
+            if truncated and starved and len(batch) > 1:
+                self.batch_size = max(1, len(batch) // 2)
+                for ticker in starved:
+                    retries[ticker] += 1
+                queue = starved + queue
+            elif not truncated:
+                self.batch_size = min(MAX_BATCH_SIZE, self.batch_size + 2)
+        
+        return results
@@ -2,7 +2,7 @@
 Configuration management for the application.
 """
 
-from .sheet import load_sheet
+from .sheet import load_sheet, get_session, SheetSession
 from .env import load_env
 
-__all__ = ['load_sheet', 'load_env'] 
\ No newline at end of file
+__all__ = ['load_sheet', 'get_session', 'SheetSession', 'load_env'] 
\ No newline at end of file
@@ -13,4 +13,5 @@ NAVER_CLIENT_ID =  os.getenv("NAVER_CLIENT_ID")
 NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
 GOOGLE_SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
 NEWSAPI_KEY = os.getenv("NEWSAPI_KEY")
-CX = os.getenv("CX")
\ No newline at end of file
+CX = os.getenv("CX")
+CACHE_DIR = os.getenv("STOCKNEWS_CACHE_DIR", ".cache")
@@ -43,24 +43,140 @@ class Settings:
         self.news_settings = {
             "cnbc": {
                 "count": 30,
+                "max_age": 300,
                 "update_range": {
                     "original": "A2:D31",
                     "translated": "A34:B63"
                 }
             },
             "yahoo": {
-                "count": 3
+                "count": 3,
+                "max_age": 600,
+                "batch": os.getenv("YAHOO_BATCH", "True").lower() == "true",
+                "batch_size": int(os.getenv("YAHOO_BATCH_SIZE", "10"))
             },
             "newsapi": {
-                "count": 1
+                "count": 1,
+                "batch": os.getenv("NEWSAPI_BATCH", "True").lower() == "true",
+                "daily_limit": int(os.getenv("NEWSAPI_DAILY_LIMIT", "100")),
+                # 개발자(무료) 요금제는 100건 이후 결과를 거부하므로 기본 1페이지
+                "max_pages": int(os.getenv("NEWSAPI_MAX_PAGES", "1"))
             },
             "google": {
-                "count": 2
+                "count": 2,
+                "max_age": 900
             },
             "naver": {
                 "count": 5
             }
         }
+        
+        # Concurrent Fetch Settings
+        self.fetch_settings = {
+            "concurrent": os.getenv("FETCH_CONCURRENT", "True").lower() == "true",
+            "max_workers": int(os.getenv("FETCH_MAX_WORKERS", "16")),
+            "host_limits": {
+                "feeds.finance.yahoo.com": 4,
+                "news.google.com": 4,
+                "newsapi.org": 2,
+                "openapi.naver.com": 5
+            }
+        }
+        
+        # Claude API Rate Limits
+        self.llm_settings = {
+            "max_workers": int(os.getenv("LLM_MAX_WORKERS", "4")),
+            "rpm": float(os.getenv("LLM_RPM", "50")),
+            "tpm": float(os.getenv("LLM_TPM", "50000")),
+            "max_retries": int(os.getenv("LLM_MAX_RETRIES", "5"))
+        }
+        
+        # Translation Cache Settings
+        self.translation_cache_settings = {
+            "ttl_days": float(os.getenv("TRANSLATION_CACHE_TTL_DAYS", "30")),
+            "max_entries": int(os.getenv("TRANSLATION_CACHE_MAX", "20000")),
+            "memory_entries": int(os.getenv("TRANSLATION_CACHE_MEMORY", "2000"))
+        }
+        
+        # RSS Feed Cache Settings
+        self.feed_cache_settings = {
+            "max_parsed": int(os.getenv("FEED_CACHE_MAX_PARSED", "512")),
+            "max_age_days": float(os.getenv("FEED_CACHE_MAX_AGE_DAYS", "7"))
+        }
+        
+        # Sheet Write Settings
+        self.sheet_write_settings = {
+            "chunk_size": int(os.getenv("SHEET_WRITE_CHUNK", "200")),
+            "flush_interval": float(os.getenv("SHEET_FLUSH_INTERVAL", "30")),
+            "max_retries": 3
+        }
+        
+        # Per-Host Rate Limits (requests per second, burst) and HTTP Retries
+        self.rate_limit_settings = {
+            "hosts": {
+                "openapi.naver.com": (float(os.getenv("NAVER_RPS", "10")), 10),
+                "finance.naver.com": (float(os.getenv("NAVER_FINANCE_RPS", "5")), 5),
+                "newsapi.org": (float(os.getenv("NEWSAPI_RPS", "2")), 2),
+                "news.google.com": (float(os.getenv("GOOGLE_NEWS_RPS", "10")), 10),
+                "feeds.finance.yahoo.com": (float(os.getenv("YAHOO_RPS", "5")), 5),
+                "www.cnbc.com": (float(os.getenv("CNBC_RPS", "1")), 2)
+            },
+            "max_retries": int(os.getenv("HTTP_MAX_RETRIES", "3")),
+            "retry_base": float(os.getenv("HTTP_RETRY_BASE", "1.0")),
+            "retry_max": float(os.getenv("HTTP_RETRY_MAX", "30"))
+        }
+        
+        # Circuit Breakers and Hedged Requests (per upstream host)
+        self.resilience_settings = {
+            "failure_threshold": int(os.getenv("BREAKER_FAILURES", "5")),
+            "reset_timeout": float(os.getenv("BREAKER_RESET_TIMEOUT", "300")),
+            "hedge_hosts": [h.strip() for h in os.getenv("HEDGE_HOSTS", "").split(",") if h.strip()],
+            "hedge_percentile": float(os.getenv("HEDGE_PERCENTILE", "95")),
+            "hedge_min_samples": int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+        }
+        
+        # Run Deadline Budget and Network Timeouts (seconds)
+        self.deadline_settings = {
+            # 0 = 제한 없음 (기존처럼 끝날 때까지 실행)
+            "run_budget": float(os.getenv("RUN_BUDGET", "0")),
+            "reserve": float(os.getenv("DEADLINE_RESERVE", "60")),
+            "connect_timeout": float(os.getenv("HTTP_CONNECT_TIMEOUT", "5")),
+            "read_timeout": float(os.getenv("HTTP_READ_TIMEOUT", "20")),
+            "sheets_timeout": float(os.getenv("SHEETS_TIMEOUT", "60")),
+            "llm_timeout": float(os.getenv("LLM_TIMEOUT", "60"))
+        }
+        
+        # Google Sheets API Quota (per user, shared by all pipelines)
+        self.sheet_quota_settings = {
+            "reads_per_minute": int(os.getenv("SHEETS_READS_PER_MINUTE", "60")),
+            "writes_per_minute": int(os.getenv("SHEETS_WRITES_PER_MINUTE", "60")),
+            "burst": int(os.getenv("SHEETS_BURST", "10"))
+        }
+        
+        # Adaptive Polling Settings (per ticker and source)
+        self.poll_settings = {
+            "enabled": os.getenv("ADAPTIVE_POLLING", "True").lower() == "true",
+            "min_expected": float(os.getenv("POLL_MIN_EXPECTED", "0.5")),
+            "max_interval": float(os.getenv("POLL_MAX_INTERVAL", "21600")),
+            "backoff_base": float(os.getenv("POLL_BACKOFF_BASE", "1800")),
+            "backoff_max": float(os.getenv("POLL_BACKOFF_MAX", "86400"))
+        }
+        
+        # Refresh Daemon Settings (seconds)
+        self.daemon_settings = {
+            "tier_intervals": {
+                1: float(os.getenv("DAEMON_TIER1_INTERVAL", "600")),
+                2: float(os.getenv("DAEMON_TIER2_INTERVAL", "3600")),
+                3: float(os.getenv("DAEMON_TIER3_INTERVAL", "21600"))
+            },
+            "default_tier": int(os.getenv("DAEMON_DEFAULT_TIER", "2")),
+            "tiers_file": os.getenv("DAEMON_TIERS_FILE", "tiers.json"),
+            "min_interval": float(os.getenv("DAEMON_MIN_INTERVAL", "120")),
+            "batch_size": int(os.getenv("DAEMON_BATCH_SIZE", "50")),
+            "flush_interval": float(os.getenv("DAEMON_FLUSH_INTERVAL", "60")),
+            "reload_interval": float(os.getenv("DAEMON_RELOAD_INTERVAL", "1800")),
+            "cnbc_interval": float(os.getenv("DAEMON_CNBC_INTERVAL", "600"))
+        }
     
     def get_sheet_name(self, key: str) -> str:
         """Get sheet name by key."""
@@ -68,4 +184,48 @@ class Settings:
     
     def get_news_settings(self, source: str) -> Dict[str, Any]:
         """Get news settings by source."""
-        return self.news_settings.get(source, {}) 
\ No newline at end of file
+        return self.news_settings.get(source, {})
+    
+    def get_fetch_settings(self) -> Dict[str, Any]:
+        """Get concurrent fetch settings."""
+        return self.fetch_settings
+    
+    def get_llm_settings(self) -> Dict[str, Any]:
+        """Get Claude API concurrency and rate limit settings."""
+        return self.llm_settings
+    
+    def get_translation_cache_settings(self) -> Dict[str, Any]:
+        """Get translation cache settings."""
+        return self.translation_cache_settings
+    
+    def get_feed_cache_settings(self) -> Dict[str, Any]:
+        """Get RSS feed cache bounds."""
+        return self.feed_cache_settings
+    
+    def get_sheet_write_settings(self) -> Dict[str, Any]:
+        """Get buffered sheet writer settings."""
+        return self.sheet_write_settings
+    
+    def get_sheet_quota_settings(self) -> Dict[str, Any]:
+        """Get Google Sheets API quota settings."""
+        return self.sheet_quota_settings
+    
+    def get_daemon_settings(self) -> Dict[str, Any]:
+        """Get refresh daemon scheduling settings."""
+        return self.daemon_settings
+    
+    def get_poll_settings(self) -> Dict[str, Any]:
+        """Get adaptive polling settings."""
+        return self.poll_settings
+    
+    def get_rate_limit_settings(self) -> Dict[str, Any]:
+        """Get per-host rate limits and HTTP retry settings."""
+        return self.rate_limit_settings
+    
+    def get_resilience_settings(self) -> Dict[str, Any]:
+        """Get circuit breaker and hedged request settings."""
+        return self.resilience_settings
+    
+    def get_deadline_settings(self) -> Dict[str, Any]:
+        """Get run deadline budget and network timeout settings."""
+        return self.deadline_settings
@@ -1,11 +1,90 @@
+import os
+import threading
+
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 
+from .settings import Settings
+
+SCOPE = [
+    "https://spreadsheets.google.com/feeds",
+    "https://www.googleapis.com/auth/drive"
+]
+CREDS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "creds.json"
+)
+DEFAULT_SHEET_TITLE = "Stock News"
+
+
+class SheetSession:
+    """
+    Process-wide Google Sheets session.
+
+    Credentials are read and authorized once; the authorized session
+    refreshes its access token only when it has expired. Opened
+    spreadsheets and worksheet handles are cached so later lookups cost
+    no API round-trips.
+    """
+
+    def __init__(self, creds_path=CREDS_PATH, scope=None):
+        self.creds_path = creds_path
+        self.scope = scope or SCOPE
+        self._client = None
+        self._spreadsheets = {}
+        self._worksheets = {}
+        self._lock = threading.RLock()
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                creds = ServiceAccountCredentials.from_json_keyfile_name(self.creds_path, self.scope)
+                self._client = gspread.authorize(creds)
+                # 멈춘 연결이 실행 전체를 붙잡지 않도록 시트 요청에도 시간 제한
+                self._client.set_timeout(Settings().get_deadline_settings()["sheets_timeout"])
+            return self._client
+
+    def spreadsheet(self, sheet_id=None):
+        with self._lock:
+            key = sheet_id or DEFAULT_SHEET_TITLE
+            if key not in self._spreadsheets:
+                if sheet_id:
+                    self._spreadsheets[key] = self.client.open_by_key(sheet_id)
+                else:
+                    self._spreadsheets[key] = self.client.open(DEFAULT_SHEET_TITLE)
+            return self._spreadsheets[key]
+
+    def worksheet(self, sheet_id, worksheet_name):
+        with self._lock:
+            key = (sheet_id or DEFAULT_SHEET_TITLE, worksheet_name)
+            if key not in self._worksheets:
+                spreadsheet = self.spreadsheet(sheet_id)
+                # 한 번의 메타데이터 조회로 모든 워크시트 핸들을 캐시
+                for ws in spreadsheet.worksheets():
+                    self._worksheets[(key[0], ws.title)] = ws
+                if key not in self._worksheets:
+                    raise gspread.exceptions.WorksheetNotFound(worksheet_name)
+            return self._worksheets[key]
+
+    def reset(self):
+        with self._lock:
+            self._client = None
+            self._spreadsheets.clear()
+            self._worksheets.clear()
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = SheetSession()
+        return _session
+
+
 def load_sheet(sheet_id, worksheet_name="kr"):
-    scope = [
-        "https://spreadsheets.google.com/feeds",
-        "https://www.googleapis.com/auth/drive"
-    ]
-    creds = ServiceAccountCredentials.from_json_keyfile_name("creds.json", scope)
-    client = gspread.authorize(creds)
-    return client.open_by_key(sheet_id).worksheet(worksheet_name)
+    return get_session().worksheet(sheet_id, worksheet_name)
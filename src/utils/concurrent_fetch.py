@@ -0,0 +1,139 @@
+"""
+Concurrent fetch utilities.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from . import deadline
+from .ratelimit import QuotaExhausted
+
+# (결과 키, 업스트림 호스트, 호출 함수)
+FetchTask = Tuple[Hashable, str, Callable[[], Any]]
+
+
+class HostLimiter:
+    """Per-host concurrency limits backed by semaphores."""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, default: int = 4):
+        """
+        Initialize host limiter.
+
+        Args:
+            limits (Dict[str, int], optional): Max concurrent calls per host
+            default (int): Limit for hosts not listed in ``limits``
+        """
+        self.limits = dict(limits or {})
+        self.default = default
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.limits.get(host, self.default))
+                self._semaphores[host] = sem
+            return sem
+
+    @contextmanager
+    def slot(self, host: str) -> Iterator[None]:
+        """Hold one concurrency slot for ``host`` while the block runs."""
+        sem = self._semaphore(host)
+        sem.acquire()
+        try:
+            yield
+        finally:
+            sem.release()
+
+
+class FetchEngine:
+    """Fan out fetch tasks over a bounded thread pool."""
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        host_limits: Optional[Dict[str, int]] = None,
+        concurrent: bool = True
+    ):
+        """
+        Initialize fetch engine.
+
+        Args:
+            max_workers (int): Thread pool size
+            host_limits (Dict[str, int], optional): Max concurrent calls per host
+            concurrent (bool): Run tasks serially in the calling thread when False
+        """
+        self.max_workers = max(1, max_workers)
+        self.limiter = HostLimiter(host_limits)
+        self.concurrent = concurrent and self.max_workers > 1
+        self.wall_time = 0.0
+        self.task_time = 0.0
+        self._lock = threading.Lock()
+
+    def _call(self, host: str, fn: Callable[[], Any]) -> Any:
+        if deadline.expired():
+            return None  # 마감이 지난 작업은 시작하지 않음
+        with self.limiter.slot(host):
+            start = time.perf_counter()
+            try:
+                return fn()
+            except QuotaExhausted:
+                return None  # 한도 소진은 수집기가 한 번만 알림
+            except Exception as e:
+                print(f"❌ 수집 작업 실패 ({host}): {e}")
+                return None
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.task_time += elapsed
+
+    def run(self, tasks: List[FetchTask]) -> Dict[Hashable, Any]:
+        """
+        Run fetch tasks and collect their results.
+
+        A failing task is logged and yields ``None`` so one bad upstream
+        never aborts the whole batch (an exhausted daily quota also yields
+        ``None``, without a log line per task). Workers run under the caller's
+        deadline, and tasks not started before it passes yield ``None``.
+
+        Args:
+            tasks (List[FetchTask]): ``(key, host, fn)`` tuples
+
+        Returns:
+            Dict[Hashable, Any]: Task results keyed by task key
+        """
+        start = time.perf_counter()
+        results: Dict[Hashable, Any] = {}
+
+        if not self.concurrent:
+            for key, host, fn in tasks:
+                results[key] = self._call(host, fn)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {
+                    key: pool.submit(deadline.bind(self._call), host, fn)
+                    for key, host, fn in tasks
+                }
+                for key, future in futures.items():
+                    results[key] = future.result()
+
+        self.wall_time += time.perf_counter() - start
+        return results
+
+    def speedup(self) -> float:
+        """Ratio of summed task time (the serial estimate) to wall time."""
+        if self.wall_time <= 0:
+            return 1.0
+        return self.task_time / self.wall_time
+
+    def report(self) -> str:
+        """Format a one-line timing summary."""
+        mode = "병렬" if self.concurrent else "순차"
+        return (
+            f"⏱️ 수집 시간 ({mode}): {self.wall_time:.1f}초 "
+            f"(순차 예상 {self.task_time:.1f}초, 약 {self.speedup():.1f}배)"
+        )
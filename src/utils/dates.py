@@ -0,0 +1,68 @@
+"""
+Date parsing utilities shared by all collectors.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+
+KST = timezone(timedelta(hours=9))
+
+
+@lru_cache(maxsize=8192)
+def parse_datetime(value: str) -> Optional[datetime]:
+    """
+    Parse an RFC 822 or ISO 8601 date string into a tz-aware datetime.
+
+    Handles the formats seen across feeds and APIs, e.g.
+    ``Fri, 12 Apr 2025 09:34:00 +0900``, ``Fri, 12 Apr 2025 00:34:00 GMT``,
+    ``2025-04-12T00:34:00Z`` and Naver Finance's ``2025.04.12 09:34`` (KST).
+    Naive values are taken as UTC. Results are memoized because the same
+    strings repeat across tickers and runs.
+
+    Args:
+        value (str): Date string
+
+    Returns:
+        Optional[datetime]: Parsed datetime, or None when unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+
+    if value[:1].isdigit():
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            try:
+                return datetime.strptime(value, "%Y.%m.%d %H:%M").replace(tzinfo=KST)
+            except ValueError:
+                return None
+    else:
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def format_date(value: str, fmt: str = "%Y-%m-%d", default: Optional[str] = None) -> str:
+    """
+    Reformat a date string.
+
+    Args:
+        value (str): Date string
+        fmt (str): Output format
+        default (str, optional): Returned when parsing fails, defaults to ``value``
+
+    Returns:
+        str: Formatted date
+    """
+    dt = parse_datetime(value)
+    if dt is None:
+        return value if default is None else default
+    return dt.strftime(fmt)
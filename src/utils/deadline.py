@@ -0,0 +1,250 @@
+"""
+Run-wide deadline budget and network timeouts.
+
+A run gets one total budget (``RUN_BUDGET`` seconds, 0 = none). Each stage takes a
+slice of it with ``Deadline.child`` and installs the slice for its
+thread with ``scope``. Thread pools carry the caller's deadline into
+their workers with ``bind``. Network calls take their (connect, read)
+timeouts from ``http_timeout``: the configured defaults, clipped to the
+time left. No call can outlive the run, and a process without a run
+deadline (e.g. the daemon) still never waits on a socket forever.
+
+Pipelines stop starting new work once ``low()`` is true, i.e. only the
+``DEADLINE_RESERVE`` seconds kept for writing are left. They write what
+they have and record the tickers they did not reach with ``miss``.
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from . import metrics
+from ..config.settings import Settings
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised instead of starting work after the deadline has passed."""
+
+
+class Deadline:
+    """A point in time that work must finish by, optionally nested in a parent."""
+
+    def __init__(
+        self,
+        budget: Optional[float] = None,
+        reserve: float = 0.0,
+        name: str = "run",
+        parent: Optional["Deadline"] = None
+    ):
+        """
+        Initialize deadline.
+
+        Args:
+            budget (float, optional): Seconds from now; None or 0 means no limit
+            reserve (float): Seconds kept at the end for writing results
+                (at most a fifth of ``budget``)
+            name (str): Label used in errors and the report
+            parent (Deadline, optional): Enclosing deadline, which also bounds this one
+        """
+        self.name = name
+        # 예산이 짧으면 기록 예비 시간도 줄임 (예산의 최대 1/5)
+        self.reserve = min(reserve, budget / 5) if budget else reserve
+        self.parent = parent
+        self.started = time.monotonic()
+        expires = self.started + budget if budget else math.inf
+        self.expires = min(expires, parent.expires) if parent else expires
+        self.missed: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """Seconds left (``inf`` without a limit)."""
+        return self.expires - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def low(self) -> bool:
+        """True once only the write reserve is left: stop starting new work."""
+        return self.remaining() <= self.reserve
+
+    def check(self) -> None:
+        """Raise ``DeadlineExceeded`` when the deadline has passed."""
+        if self.expired():
+            raise DeadlineExceeded(f"{self.name} 마감 시간 초과")
+
+    def child(self, name: str, fraction: float = 1.0) -> "Deadline":
+        """
+        Slice off a deadline for a stage.
+
+        The child gets ``fraction`` of the usable time left (the time
+        before this deadline's reserve) plus its own write reserve.
+
+        Args:
+            name (str): Stage name
+            fraction (float): Share of the usable time left, 0-1
+
+        Returns:
+            Deadline: Child deadline that never outlasts this one
+        """
+        if math.isinf(self.expires):
+            return Deadline(None, self.reserve, name, parent=self)
+        usable = max(0.0, self.remaining() - self.reserve)
+        # 0초 예산은 무제한을 뜻하므로 이미 소진된 경우에도 아주 작은 값을 줌
+        return Deadline(max(1e-3, usable * fraction + self.reserve), self.reserve, name, parent=self)
+
+    def timeout(self, connect: float, read: float) -> Tuple[float, float]:
+        """
+        Connect and read timeouts clipped to the time left.
+
+        Raises:
+            DeadlineExceeded: The deadline has already passed
+        """
+        self.check()
+        left = self.remaining()
+        return min(connect, left), min(read, left)
+
+    def _root(self) -> "Deadline":
+        deadline = self
+        while deadline.parent is not None:
+            deadline = deadline.parent
+        return deadline
+
+    def miss(self, pipeline: str, tickers: List[str]) -> None:
+        """Record tickers that were not refreshed in time (kept on the run deadline)."""
+        if not tickers:
+            return
+        root = self._root()
+        with root._lock:
+            root.missed.setdefault(pipeline, []).extend(tickers)
+        metrics.inc("deadline_missed_tickers_total", len(tickers), pipeline=pipeline)
+
+    def report(self, limit: int = 10) -> str:
+        """Budget use and the tickers that missed the deadline."""
+        used = time.monotonic() - self.started
+        if math.isinf(self.expires):
+            lines = [f"⏰ 실행 시간 {used:.0f}초 (예산 없음)"]
+        else:
+            budget = self.expires - self.started
+            lines = [f"⏰ 실행 예산 {budget:.0f}초 중 {used:.0f}초 사용"]
+        with self._lock:
+            missed = {pipeline: list(tickers) for pipeline, tickers in self.missed.items()}
+        for pipeline, tickers in sorted(missed.items()):
+            shown = ", ".join(tickers[:limit])
+            more = f" 외 {len(tickers) - limit}개" if len(tickers) > limit else ""
+            lines.append(f"  ⌛ [{pipeline}] 마감 초과 {len(tickers)}개 종목: {shown}{more}")
+        return "\n".join(lines)
+
+
+_settings = Settings().get_deadline_settings()
+_local = threading.local()
+_run: Optional[Deadline] = None
+
+
+def start_run(budget: Optional[float] = None) -> Deadline:
+    """
+    Start the process-wide run deadline.
+
+    Args:
+        budget (float, optional): Seconds for the whole run, defaults to ``RUN_BUDGET``
+
+    Returns:
+        Deadline: The run deadline
+    """
+    global _run
+    _run = Deadline(
+        _settings["run_budget"] if budget is None else budget,
+        _settings["reserve"],
+        "run"
+    )
+    return _run
+
+
+def current() -> Optional[Deadline]:
+    """Deadline of the calling thread's stage, else the run deadline."""
+    return getattr(_local, "deadline", None) or _run
+
+
+@contextmanager
+def scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Make ``deadline`` the calling thread's deadline while the block runs."""
+    previous = getattr(_local, "deadline", None)
+    _local.deadline = deadline
+    try:
+        yield deadline
+    finally:
+        _local.deadline = previous
+
+
+def bind(fn: Callable) -> Callable:
+    """Wrap ``fn`` to run under the caller's deadline in another thread."""
+    deadline = getattr(_local, "deadline", None)
+    if deadline is None:
+        return fn
+
+    def bound(*args, **kwargs):
+        with scope(deadline):
+            return fn(*args, **kwargs)
+    return bound
+
+
+def check() -> None:
+    """Raise ``DeadlineExceeded`` when the current deadline has passed."""
+    deadline = current()
+    if deadline is not None:
+        deadline.check()
+
+
+def expired() -> bool:
+    deadline = current()
+    return deadline is not None and deadline.expired()
+
+
+def low() -> bool:
+    deadline = current()
+    return deadline is not None and deadline.low()
+
+
+def remaining() -> Optional[float]:
+    """Seconds left on the current deadline, or None without one."""
+    deadline = current()
+    return deadline.remaining() if deadline is not None else None
+
+
+def can_wait(seconds: float) -> bool:
+    """True when sleeping ``seconds`` (e.g. before a retry) still leaves time."""
+    deadline = current()
+    return deadline is None or deadline.remaining() > seconds
+
+
+def http_timeout(requested: Optional[Timeout] = None) -> Tuple[float, float]:
+    """
+    (connect, read) timeouts for one HTTP attempt.
+
+    Args:
+        requested (float or Tuple[float, float], optional): Caller's timeout,
+            defaults to ``HTTP_CONNECT_TIMEOUT`` / ``HTTP_READ_TIMEOUT``
+
+    Returns:
+        Tuple[float, float]: Timeouts clipped to the current deadline
+
+    Raises:
+        DeadlineExceeded: The current deadline has already passed
+    """
+    if requested is None:
+        connect, read = _settings["connect_timeout"], _settings["read_timeout"]
+    elif isinstance(requested, tuple):
+        connect, read = requested
+    else:
+        connect = read = requested
+    deadline = current()
+    return deadline.timeout(connect, read) if deadline else (connect, read)
+
+
+def call_timeout(seconds: float) -> float:
+    """Single timeout for a non-HTTP-transport call (e.g. the Claude SDK), clipped to the deadline."""
+    deadline = current()
+    return deadline.timeout(seconds, seconds)[1] if deadline else seconds
@@ -0,0 +1,256 @@
+"""
+Conditional GET cache for RSS feeds.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from . import transport
+from ..config.env import CACHE_DIR
+from ..config.settings import Settings
+
+# 오래된 디스크 항목 정리 주기 (초)
+PRUNE_INTERVAL = 3600
+
+
+class FeedCache:
+    """
+    On-disk feed cache keyed by URL.
+
+    Bodies are stored with their ``ETag``/``Last-Modified`` validators.
+    A cached body younger than ``max_age`` is served without a request;
+    an older one is revalidated with ``If-None-Match``/``If-Modified-Since``
+    and reused on ``304 Not Modified``. At most ``max_parsed`` parses are
+    kept in memory (least recently used first out), and entries not
+    fetched or revalidated for ``max_age`` seconds are removed from disk.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_parsed: int = 512,
+        max_age: float = 7 * 24 * 3600
+    ):
+        """
+        Initialize feed cache.
+
+        Args:
+            cache_dir (str, optional): Directory for cached bodies and metadata
+            max_parsed (int): Maximum number of memoized parses
+            max_age (float): Seconds an unused entry is kept on disk
+        """
+        self.cache_dir = cache_dir or os.path.join(CACHE_DIR, "feeds")
+        self.max_parsed = max(1, max_parsed)
+        self.max_age = max_age
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hit": 0, "miss": 0, "not_modified": 0, "bytes_saved": 0}
+        )
+        self._parsed: "OrderedDict[Tuple[str, Callable], Any]" = OrderedDict()
+        self._pruned_at = 0.0
+        self._lock = threading.Lock()
+
+    def _paths(self, url: str):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + ".json", base + ".body"
+
+    def _load(self, url: str):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                return meta, f.read()
+        except (OSError, ValueError):
+            return None, None
+
+    def _store(self, url: str, meta: Dict[str, Any], body: Optional[bytes] = None) -> None:
+        meta_path, body_path = self._paths(url)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if body is not None:
+                with open(body_path + ".tmp", "wb") as f:
+                    f.write(body)
+                os.replace(body_path + ".tmp", body_path)
+            with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(meta_path + ".tmp", meta_path)
+        except OSError as e:
+            print(f"⚠️ 피드 캐시 저장 실패: {e}")
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Remove entries not fetched or revalidated for ``max_age`` seconds.
+
+        Args:
+            now (float, optional): Current time (epoch seconds)
+
+        Returns:
+            int: Number of removed entries
+        """
+        now = time.time() if now is None else now
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return 0
+        removed = 0
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            meta_path = os.path.join(self.cache_dir, name)
+            try:
+                # 메타 파일은 다운로드·304 재검증 때마다 다시 쓰이므로 수정 시각이 마지막 사용 시각
+                if now - os.path.getmtime(meta_path) < self.max_age:
+                    continue
+                os.remove(meta_path)
+                body_path = meta_path[:-len(".json")] + ".body"
+                if os.path.exists(body_path):
+                    os.remove(body_path)
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def _count(self, source: str, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[source][key] += amount
+
+    def fetch(
+        self,
+        url: str,
+        source: str,
+        max_age: float = 0,
+        headers: Optional[Dict[str, str]] = None
+    ) -> bytes:
+        """
+        Fetch a feed body, reusing the cached copy when possible.
+
+        Args:
+            url (str): Feed URL
+            source (str): Source name used for statistics
+            max_age (float): Seconds a cached body is served without revalidation
+            headers (Dict[str, str], optional): Extra request headers
+
+        Returns:
+            bytes: Feed body
+        """
+        meta, body = self._load(url)
+        now = time.time()
+        with self._lock:
+            due = now - self._pruned_at >= PRUNE_INTERVAL
+            if due:
+                self._pruned_at = now
+        if due:
+            self.prune(now)
+
+        if meta and now - meta.get("fetched_at", 0) < max_age:
+            self._count(source, "hit")
+            self._count(source, "bytes_saved", len(body))
+            return body
+
+        request_headers = dict(headers or {})
+        if meta:
+            if meta.get("etag"):
+                request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = transport.get(url, headers=request_headers)
+
+        if response.status_code == 304 and meta:
+            self._count(source, "not_modified")
+            self._count(source, "bytes_saved", len(body))
+            meta["fetched_at"] = now
+            self._store(url, meta)
+            return body
+
+        response.raise_for_status()
+        self._count(source, "miss")
+        self._store(url, {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": now
+        }, response.content)
+        return response.content
+
+    def fetch_parsed(
+        self,
+        url: str,
+        source: str,
+        parse: Callable[[bytes], Any],
+        max_age: float = 0,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """
+        Fetch a feed and parse it, reusing the previous parse for an unchanged body.
+
+        Parses are memoized per URL and parser function, so pass the same
+        parser object (e.g. from ``rss.feed_parser``) to benefit. The
+        least recently used parse is dropped beyond ``max_parsed``.
+
+        Args:
+            url (str): Feed URL
+            source (str): Source name used for statistics
+            parse (Callable[[bytes], Any]): Parser applied to the body
+            max_age (float): Seconds a cached body is served without revalidation
+            headers (Dict[str, str], optional): Extra request headers
+
+        Returns:
+            Any: Parsed feed
+        """
+        body = self.fetch(url, source, max_age=max_age, headers=headers)
+        digest = hashlib.sha1(body).hexdigest()
+
+        key = (url, parse)
+
+        with self._lock:
+            cached = self._parsed.get(key)
+            if cached and cached[0] == digest:
+                self._parsed.move_to_end(key)
+                return cached[1]
+
+        parsed = parse(body)
+        with self._lock:
+            self._parsed[key] = (digest, parsed)
+            self._parsed.move_to_end(key)
+            while len(self._parsed) > self.max_parsed:
+                self._parsed.popitem(last=False)
+        return parsed
+
+    def report(self) -> str:
+        """Format per-source hit, miss and 304 rates plus bytes saved."""
+        lines = ["🗂️ 피드 캐시 통계 (적중 / 304 / 다운로드, 절약)"]
+        with self._lock:
+            items = sorted((source, dict(counts)) for source, counts in self.stats.items())
+        for source, counts in items:
+            total = counts["hit"] + counts["not_modified"] + counts["miss"]
+            if not total:
+                continue
+            lines.append(
+                f"  {source}: {counts['hit'] / total:.0%} / {counts['not_modified'] / total:.0%}"
+                f" / {counts['miss'] / total:.0%} ({counts['bytes_saved'] / 1024:.0f}KB)"
+            )
+        return "\n".join(lines)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_feed_cache() -> FeedCache:
+    """Return the process-wide feed cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            settings = Settings().get_feed_cache_settings()
+            _cache = FeedCache(
+                max_parsed=settings["max_parsed"],
+                max_age=settings["max_age_days"] * 24 * 3600
+            )
+        return _cache
@@ -0,0 +1,194 @@
+"""
+Rate-limited concurrent executor for Claude API calls.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+
+import anthropic
+from anthropic import Anthropic
+
+from . import deadline, metrics
+from .ratelimit import ANTHROPIC, TokenBucket, backoff_delay, get_host_limiter, parse_retry_after
+from ..config.settings import Settings
+
+# 재시도할 HTTP 상태 (429 Too Many Requests, 529 Overloaded, 5xx)
+RETRY_STATUSES = {408, 409, 429, 500, 502, 503, 504, 529}
+LLM_TIMEOUT = Settings().get_deadline_settings()["llm_timeout"]
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    if headers.get("retry-after-ms"):
+        try:
+            return float(headers["retry-after-ms"]) / 1000.0
+        except ValueError:
+            pass
+    return parse_retry_after(headers.get("retry-after"))
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, (anthropic.APIConnectionError, anthropic.APITimeoutError)):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code in RETRY_STATUSES
+    return False
+
+
+def estimate_request_tokens(kwargs: dict) -> int:
+    """Rough input + output token estimate of a ``messages.create`` call."""
+    chars = sum(len(str(m.get("content", ""))) for m in kwargs.get("messages", []))
+    return chars // 3 + kwargs.get("max_tokens", 0)
+
+
+class LLMExecutor:
+    """
+    Concurrent Claude API executor.
+
+    One shared client is used for every call. Requests-per-minute and
+    tokens-per-minute are enforced with token buckets, ``retry-after``
+    is honoured, and retryable failures (429, 529, 5xx, connection
+    errors) are retried with jittered exponential backoff. Pointing
+    ``ANTHROPIC_BASE_URL`` at a local stub server exercises the whole
+    path offline.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        rpm: Optional[float] = None,
+        tpm: float = 50000,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        client: Optional[Anthropic] = None
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            max_workers (int): Concurrent calls
+            rpm (float, optional): Requests per minute; by default the shared
+                ``api.anthropic.com`` bucket (``LLM_RPM``) is used
+            tpm (float): Tokens per minute (input + max output, estimated)
+            max_retries (int): Retries per call
+            base_delay (float): Backoff scale in seconds
+            max_delay (float): Backoff cap in seconds
+            client (Anthropic, optional): Client to use instead of a new one
+        """
+        self.max_workers = max(1, max_workers)
+        self.requests = get_host_limiter(ANTHROPIC) if rpm is None else TokenBucket.per_minute(rpm)
+        self.tokens = TokenBucket.per_minute(tpm)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        # 재시도는 이 실행기가 담당하므로 SDK 자체 재시도는 끔
+        self.client = client or Anthropic(
+            api_key=os.getenv("CLAUDE_API_KEY"),
+            base_url=os.getenv("ANTHROPIC_BASE_URL") or None,
+            max_retries=0
+        )
+        self.calls = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def call(self, fn: Callable[..., Any], *args, tokens: int = 0, **kwargs) -> Any:
+        """
+        Run one API call under the rate limits, retrying retryable errors.
+
+        Args:
+            fn (Callable): Function performing the API call
+            *args: Positional arguments for ``fn``
+            tokens (int): Estimated tokens the call consumes
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            Any: Result of ``fn``
+        """
+        for attempt in range(self.max_retries + 1):
+            deadline.check()
+            try:
+                self.requests.acquire(1, timeout=deadline.remaining())
+                if tokens:
+                    self.tokens.acquire(tokens, timeout=deadline.remaining())
+            except TimeoutError as e:
+                raise deadline.DeadlineExceeded(f"Claude API 마감 시간 초과: {e}") from e
+            with self._lock:
+                self.calls += 1
+            metrics.inc("llm_tokens_total", tokens)
+            try:
+                with metrics.timer("llm_call_seconds"):
+                    result = fn(*args, **kwargs)
+                metrics.inc("llm_calls_total", outcome="ok")
+                return result
+            except Exception as e:
+                if attempt == self.max_retries or not _is_retryable(e):
+                    metrics.inc("llm_calls_total", outcome="error")
+                    raise
+                wait = _retry_after(e)
+                retry_after = wait is not None
+                if not retry_after:
+                    wait = backoff_delay(attempt, self.base_delay, self.max_delay)
+                if not deadline.can_wait(wait):
+                    metrics.inc("llm_calls_total", outcome="error")
+                    raise
+                metrics.inc("llm_calls_total", outcome="retry")
+                metrics.inc("llm_retries_total")
+                if retry_after:
+                    # 서버가 지정한 대기 시간 동안 다른 호출도 멈춤
+                    self.requests.pause(wait)
+                with self._lock:
+                    self.retries += 1
+                print(f"⚠️ Claude API 재시도 {attempt + 1}/{self.max_retries} ({wait:.1f}초 후): {e}")
+                time.sleep(wait)
+
+    def create_message(self, **kwargs) -> Any:
+        """Rate-limited ``client.messages.create`` with each attempt's timeout clipped to the deadline."""
+        timeout = kwargs.pop("timeout", LLM_TIMEOUT)
+
+        def create():
+            # 토큰 대기·재시도 후 남은 시간으로 매 시도마다 다시 계산
+            return self.client.messages.create(timeout=deadline.call_timeout(timeout), **kwargs)
+
+        return self.call(create, tokens=estimate_request_tokens(kwargs))
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        Apply ``fn`` to every item concurrently.
+
+        Args:
+            fn (Callable[[Any], Any]): Function to apply, usually calling ``create_message``
+            items (Iterable[Any]): Inputs
+
+        Returns:
+            List[Any]: Results in the original order of ``items``
+        """
+        items = list(items)
+        if len(items) <= 1 or self.max_workers == 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            return list(pool.map(deadline.bind(fn), items))
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_llm_executor() -> LLMExecutor:
+    """Return the process-wide LLM executor."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            limits = Settings().get_llm_settings()
+            _executor = LLMExecutor(
+                max_workers=limits["max_workers"],
+                tpm=limits["tpm"],
+                max_retries=limits["max_retries"]
+            )
+        return _executor
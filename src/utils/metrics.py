@@ -0,0 +1,263 @@
+"""
+Run metrics: labelled counters and latency histograms.
+
+Recording is a no-op unless ``METRICS_ENABLED`` is true, so the calls
+can stay on hot paths. ``export()`` writes a Prometheus textfile-collector
+file and a JSON summary at the end of a run.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+ENABLED = os.getenv("METRICS_ENABLED", "False").lower() == "true"
+TEXTFILE_PATH = os.getenv("METRICS_TEXTFILE", os.path.join("metrics", "stocknews.prom"))
+JSON_PATH = os.getenv("METRICS_JSON", os.path.join("metrics", "stocknews.json"))
+
+PREFIX = "stocknews_"
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 4, 5, 6, 10, 20)
+
+HELP = {
+    "pipeline_seconds": "Pipeline wall time",
+    "http_requests_total": "Upstream HTTP requests by host and status class",
+    "http_request_seconds": "Upstream HTTP request latency by host",
+    "http_response_bytes_total": "Upstream response bytes by host",
+    "http_retries_total": "Retried upstream HTTP requests by host and reason",
+    "http_hedges_total": "Hedged duplicate HTTP requests by host and winner",
+    "breaker_transitions_total": "Circuit breaker state changes by source and new state",
+    "breaker_rejected_total": "Calls refused by an open circuit breaker by source",
+    "collector_calls_total": "Collector calls by source and outcome",
+    "collector_seconds": "Collector call latency by source",
+    "collector_items": "Items returned per collector call",
+    "items_per_ticker": "News items written per ticker",
+    "sheets_calls_total": "Google Sheets API calls by method",
+    "sheets_call_seconds": "Google Sheets API call latency by method",
+    "sheets_retries_total": "Retried Google Sheets API calls by method",
+    "llm_calls_total": "Claude API calls by outcome",
+    "llm_call_seconds": "Claude API call latency",
+    "llm_retries_total": "Retried Claude API calls",
+    "llm_tokens_total": "Estimated Claude tokens requested",
+    "poll_decisions_total": "Adaptive polling decisions by source (poll or skip)",
+    "daemon_refreshes_total": "Ticker refreshes by the daemon",
+    "daemon_new_articles_total": "Previously unseen articles found by daemon refreshes",
+    "daemon_failed_refreshes_total": "Daemon refreshes where no source could be fetched",
+    "deadline_missed_tickers_total": "Tickers not refreshed before the run deadline by pipeline",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Histogram:
+    """Cumulative-bucket histogram with sum and count."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[Tuple[str, int]]:
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            yield ("+Inf" if bound == float("inf") else f"{bound:g}"), total
+
+
+class Registry:
+    """Thread-safe store of counters and histograms keyed by name and labels."""
+
+    def __init__(self):
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        key = _key(labels)
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = LATENCY_BUCKETS, **labels) -> None:
+        key = _key(labels)
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram(buckets)
+            series[key].observe(value)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Render in the Prometheus text exposition format."""
+        lines = []
+
+        def labels_text(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+            pairs = list(key) + ([extra] if extra else [])
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+        with self._lock:
+            for name in sorted(self.counters):
+                full = PREFIX + name
+                lines.append(f"# HELP {full} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {full} counter")
+                for key, value in sorted(self.counters[name].items()):
+                    lines.append(f"{full}{labels_text(key)} {value:g}")
+            for name in sorted(self.histograms):
+                full = PREFIX + name
+                lines.append(f"# HELP {full} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {full} histogram")
+                for key, hist in sorted(self.histograms[name].items()):
+                    for bound, total in hist.cumulative():
+                        lines.append(f"{full}_bucket{labels_text(key, ('le', bound))} {total}")
+                    lines.append(f"{full}_sum{labels_text(key)} {hist.sum:g}")
+                    lines.append(f"{full}_count{labels_text(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self) -> Dict[str, object]:
+        """Summarize as plain data: counter values and histogram count, sum, mean and buckets."""
+        with self._lock:
+            counters = {
+                name: [{"labels": dict(key), "value": value} for key, value in sorted(series.items())]
+                for name, series in sorted(self.counters.items())
+            }
+            histograms = {
+                name: [
+                    {
+                        "labels": dict(key),
+                        "count": hist.count,
+                        "sum": round(hist.sum, 6),
+                        "mean": round(hist.sum / hist.count, 6) if hist.count else 0.0,
+                        "buckets": dict(hist.cumulative()),
+                    }
+                    for key, hist in sorted(series.items())
+                ]
+                for name, series in sorted(self.histograms.items())
+            }
+        return {"counters": counters, "histograms": histograms}
+
+
+registry = Registry()
+
+
+def inc(name: str, amount: float = 1, **labels) -> None:
+    """Add ``amount`` to counter ``name`` (no-op when disabled)."""
+    if ENABLED:
+        registry.inc(name, amount, **labels)
+
+
+def observe(name: str, value: float, buckets: Sequence[float] = LATENCY_BUCKETS, **labels) -> None:
+    """Record ``value`` in histogram ``name`` (no-op when disabled)."""
+    if ENABLED:
+        registry.observe(name, value, buckets, **labels)
+
+
+@contextmanager
+def _timed(name: str, labels: Dict[str, object]):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.observe(name, time.perf_counter() - started, **labels)
+
+
+def timer(name: str, **labels):
+    """Context manager observing the block's duration in histogram ``name``."""
+    if not ENABLED:
+        return nullcontext()
+    return _timed(name, labels)
+
+
+def instrument(source: str):
+    """
+    Decorator recording a collector call's latency, outcome and item count.
+
+    The wrapped function may return a list of items, a dict of lists
+    (batch fetches) or a tuple whose first element is the item list; an
+    empty result counts as ``empty``.
+
+    Args:
+        source (str): Collector name used as the ``source`` label
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception:
+                registry.inc("collector_calls_total", source=source, outcome="error")
+                raise
+            registry.observe("collector_seconds", time.perf_counter() - started, source=source)
+            if isinstance(result, tuple):
+                result_items = result[0] if result else []
+            else:
+                result_items = result
+            if isinstance(result_items, dict):
+                items = sum(len(v or []) for v in result_items.values())
+            else:
+                items = len(result_items or [])
+            registry.inc("collector_calls_total", source=source, outcome="ok" if items else "empty")
+            registry.observe("collector_items", items, COUNT_BUCKETS, source=source)
+            return result
+        return wrapper
+    return decorate
+
+
+def export(textfile: Optional[str] = None, json_path: Optional[str] = None) -> None:
+    """
+    Write the Prometheus textfile and JSON summary (no-op when disabled).
+
+    The textfile is written to a temporary name and renamed so the
+    node_exporter textfile collector never reads a partial file.
+
+    Args:
+        textfile (str, optional): ``.prom`` path, defaults to ``METRICS_TEXTFILE``
+        json_path (str, optional): JSON path, defaults to ``METRICS_JSON``
+    """
+    if not ENABLED:
+        return
+    outputs = (
+        (textfile or TEXTFILE_PATH, registry.to_prometheus()),
+        (json_path or JSON_PATH, json.dumps(
+            dict(registry.to_dict(), exported_at=time.strftime("%Y-%m-%dT%H:%M:%S%z")),
+            ensure_ascii=False,
+            indent=2
+        )),
+    )
+    for path, content in outputs:
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"⚠️ 메트릭 저장 실패 ({path}): {e}")
+    print(f"📊 메트릭 저장: {textfile or TEXTFILE_PATH}, {json_path or JSON_PATH}")
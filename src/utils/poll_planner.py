@@ -0,0 +1,258 @@
+"""
+Adaptive polling: decide per (ticker, source) whether a fetch is worth it.
+
+Each pair keeps a publish-rate estimate (new articles per hour) and the
+items it last returned, persisted across runs. A pair is polled again
+once ``rate × hours since last poll`` reaches ``min_expected`` or
+``max_interval`` has passed. Empty results back off exponentially. The
+first new article resets the backoff and raises the rate at once. When a
+pair is skipped, its cached items are returned, so sheet rows keep their
+previous news.
+
+The report compares skipped upstream queries with the freshness cost.
+The cost is the articles found late after a skip and how late they were,
+plus an estimate of articles still waiting behind skips.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from . import deadline, metrics
+from .ratelimit import QuotaExhausted
+from .resilience import get_breaker
+from ..collectors.news_item import NewsItem
+from ..config.env import CACHE_DIR
+from ..config.settings import Settings
+
+# 속도 추정 가중치 (최근 관측 비중)
+SMOOTHING = 0.3
+# 첫 관측 시 게시 시각을 반영할 최대 기간 (시간)
+SEED_WINDOW_HOURS = 24 * 7
+
+
+def _timestamp(item: NewsItem) -> Optional[float]:
+    return item.published.timestamp() if item.published else None
+
+
+class PollPlanner:
+    """Persisted per-(ticker, source) publish-rate estimates and poll decisions."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        enabled: bool = True,
+        min_expected: float = 0.5,
+        max_interval: float = 21600.0,
+        backoff_base: float = 1800.0,
+        backoff_max: float = 86400.0
+    ):
+        """
+        Initialize planner.
+
+        Args:
+            path (str, optional): JSON state file
+            enabled (bool): Poll everything when False (estimates are still updated)
+            min_expected (float): Expected new articles that justify a poll
+            max_interval (float): Longest gap in seconds between polls of a non-empty pair
+            backoff_base (float): First skip window in seconds after an empty result
+            backoff_max (float): Longest skip window in seconds for repeatedly empty pairs
+        """
+        self.path = path or os.path.join(CACHE_DIR, "poll_state.json")
+        self.enabled = enabled
+        self.min_expected = min_expected
+        self.max_interval = max_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._lock = threading.Lock()
+        self.state: Dict[str, Dict] = self._load()
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        self.polled = 0
+        self.skipped = 0
+        self.delayed = 0
+        self.delay_seconds = 0.0
+        self.expected_missed = 0.0
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self) -> None:
+        """Write the state file atomically."""
+        with self._lock:
+            data = json.dumps(self.state, ensure_ascii=False)
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"⚠️ 폴링 상태 기록 실패: {e}")
+
+    @staticmethod
+    def _key(ticker: str, source: str) -> str:
+        return f"{source}|{ticker}"
+
+    def should_poll(self, ticker: str, source: str, now: Optional[float] = None) -> bool:
+        """
+        Decide whether ``source`` is worth querying for ``ticker`` now.
+
+        Skips are counted for the report; a True result should be
+        followed by ``record`` with the fetched items.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self.state.get(self._key(ticker, source))
+            poll = True
+            if self.enabled and entry is not None:
+                elapsed = now - entry["polled_at"]
+                if entry["empty_streak"]:
+                    window = self.backoff_base * 2 ** (entry["empty_streak"] - 1)
+                    poll = elapsed >= min(self.backoff_max, window)
+                else:
+                    expected = entry["rate"] * elapsed / 3600.0
+                    poll = expected >= self.min_expected or elapsed >= self.max_interval
+
+            if poll:
+                self.polled += 1
+            else:
+                self.skipped += 1
+                if entry.get("skipped_since") is None:
+                    entry["skipped_since"] = now
+                self.expected_missed += entry["rate"] * (now - entry["polled_at"]) / 3600.0
+        metrics.inc("poll_decisions_total", source=source, decision="poll" if poll else "skip")
+        return poll
+
+    def cached(self, ticker: str, source: str) -> List[NewsItem]:
+        """Items returned by the last poll of the pair."""
+        with self._lock:
+            entry = self.state.get(self._key(ticker, source)) or {}
+            rows = list(entry.get("items", []))
+        return [NewsItem.from_raw(title, link, raw_date, "", item_source) for title, link, raw_date, item_source in rows]
+
+    def record(self, ticker: str, source: str, items: Optional[List[NewsItem]], now: Optional[float] = None) -> int:
+        """
+        Update the pair's estimate with a poll result.
+
+        Args:
+            ticker (str): Ticker or query
+            source (str): Collector name
+            items (List[NewsItem], optional): Fetched items
+            now (float, optional): Poll time (epoch seconds)
+
+        Returns:
+            int: Articles not seen in the previous poll
+        """
+        now = time.time() if now is None else now
+        items = list(items or [])
+        key = self._key(ticker, source)
+        with self._lock:
+            entry = self.state.get(key)
+            stamps = [ts for ts in map(_timestamp, items) if ts is not None]
+
+            if entry is None:
+                # 첫 관측: 최근 게시 간격으로 속도 추정
+                recent = [ts for ts in stamps if now - ts <= SEED_WINDOW_HOURS * 3600]
+                span_hours = max(1.0, (now - min(recent)) / 3600.0) if recent else 1.0
+                entry = {"rate": len(recent) / span_hours, "empty_streak": 0 if items else 1}
+                new = len(items)
+            else:
+                # 빈 결과 뒤에도 이전 기사를 새 기사로 세지 않도록 마지막 비어 있지 않은 결과의 링크로 비교
+                known = set(entry.get("links") or [link for _, link, _, _ in entry.get("items", [])])
+                newest = entry.get("newest")
+                fresh = [
+                    item for item in items
+                    if item.link not in known
+                    and (newest is None or _timestamp(item) is None or _timestamp(item) > newest)
+                ]
+                new = len(fresh)
+                hours = max((now - entry["polled_at"]) / 3600.0, 1e-3)
+                observed = new / hours
+                entry["rate"] = SMOOTHING * observed + (1 - SMOOTHING) * entry["rate"]
+                if new:
+                    # 새 기사 → 즉시 복귀 (백오프 해제, 관측 속도로 상향)
+                    entry["rate"] = max(entry["rate"], observed)
+                    entry["empty_streak"] = 0
+                elif not items:
+                    entry["empty_streak"] += 1
+
+                skipped_since = entry.get("skipped_since")
+                if skipped_since is not None:
+                    for item in fresh:
+                        published = _timestamp(item) or skipped_since
+                        self.delayed += 1
+                        self.delay_seconds += max(0.0, now - max(published, skipped_since))
+
+            # 빈 결과도 그대로 저장 (생략된 다음 실행이 지난 기사를 다시 내보내지 않도록)
+            entry["items"] = [[i.title, i.link, i.raw_date, i.source] for i in items]
+            if items:
+                entry["links"] = [i.link for i in items]
+                entry["newest"] = max(stamps) if stamps else entry.get("newest")
+            entry["polled_at"] = now
+            entry["skipped_since"] = None
+            self.state[key] = entry
+        return new
+
+    def poll(
+        self,
+        ticker: str,
+        source: str,
+        fetch: Callable[[], Optional[List[NewsItem]]],
+        host: Optional[str] = None
+    ) -> List[NewsItem]:
+        """
+        Fetch and record when worthwhile, otherwise return the cached items.
+
+        An empty result while ``host``'s circuit breaker reports failures,
+        or after the deadline has passed, is an outage, not a quiet
+        ticker: it is not recorded (so the pair does not back off) and
+        the cached items are returned. The same applies when ``fetch``
+        raises ``QuotaExhausted`` or returns None (a failed fetch, as
+        opposed to an empty result).
+        """
+        if not self.should_poll(ticker, source):
+            return self.cached(ticker, source)
+        try:
+            items = fetch()
+        except QuotaExhausted:
+            return self.cached(ticker, source)
+        if items is None or (not items and (deadline.expired() or (host and get_breaker(host).failing))):
+            return self.cached(ticker, source)
+        self.record(ticker, source, items)
+        return items
+
+    def split(self, tickers: List[str], source: str) -> List[str]:
+        """Tickers worth polling for ``source`` (for batch requests)."""
+        return [ticker for ticker in tickers if self.should_poll(ticker, source)]
+
+    def report(self) -> str:
+        """One-line summary of avoided calls versus freshness lost."""
+        total = self.polled + self.skipped
+        saved = self.skipped / total if total else 0.0
+        avg_delay = self.delay_seconds / self.delayed / 60.0 if self.delayed else 0.0
+        return (
+            f"🧭 적응형 폴링: 조회 {self.polled}회 / 생략 {self.skipped}회 ({saved:.0%} 절약), "
+            f"늦게 반영된 기사 {self.delayed}건 (평균 {avg_delay:.0f}분), "
+            f"생략 구간 예상 누락 {self.expected_missed:.1f}건"
+        )
+
+
+_planner = None
+_planner_lock = threading.Lock()
+
+
+def get_poll_planner() -> PollPlanner:
+    """Return the process-wide planner configured from settings."""
+    global _planner
+    with _planner_lock:
+        if _planner is None:
+            _planner = PollPlanner(**Settings().get_poll_settings())
+        return _planner
@@ -0,0 +1,262 @@
+"""
+Low-overhead sampling profiler with per-stage output.
+
+A background thread samples the stacks of every thread at a fixed
+interval (wall clock, so waiting on sockets and locks shows up). Each
+sample is assigned to a pipeline stage by the modules on its stack:
+
+    parse      RSS/date parsing (rss.py, dates.py, feedparser, bs4)
+    translate  Claude calls (translator.py, llm_pool.py, anthropic, httpx)
+    write      sheet writes (sheet_writer.py, sheet_diff.py)
+    sheet_load worksheet/ticker loading (config/sheet.py, ticker_index.py, gspread)
+    fetch      collectors and HTTP (collectors/, transport.py, requests, urllib3)
+    other      anything else in project code
+
+For every stage ``write()`` produces a ``.pstats`` file (loadable with
+``pstats``/snakeviz, times are sampled seconds and call counts are
+sample counts), a collapsed-stack ``.collapsed`` file for flamegraph.pl
+or speedscope, and a top-N hotspot summary.
+"""
+
+import marshal
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# (단계, 파일 경로 조각) — 위에서부터 우선 적용
+STAGE_RULES = (
+    ("parse", ("src/utils/rss.py", "src/utils/dates.py", "/feedparser/", "/bs4/", "/xml/etree/")),
+    ("translate", ("src/utils/translator.py", "src/utils/llm_pool.py", "src/utils/summarizer.py",
+                   "/anthropic/", "/httpx/")),
+    ("write", ("src/utils/sheet_writer.py", "src/utils/sheet_diff.py")),
+    ("sheet_load", ("src/config/sheet.py", "src/utils/sheets.py", "src/utils/ticker_index.py",
+                    "/gspread/", "/oauth2client/", "/google/auth/")),
+    ("fetch", ("src/collectors/", "src/utils/transport.py", "src/utils/feed_cache.py",
+               "src/utils/concurrent_fetch.py", "/requests/", "/urllib3/")),
+)
+STAGES = tuple(stage for stage, _ in STAGE_RULES) + ("other",)
+
+Frame = Tuple[str, int, str]  # (filename, first line, function)
+
+
+def _is_project_file(filename: str) -> bool:
+    return filename.startswith(PROJECT_ROOT) and "site-packages" not in filename
+
+
+def classify(stack: Tuple[Frame, ...]) -> str:
+    """Stage of a root→leaf stack, by the highest-priority module present."""
+    paths = [frame[0].replace("\\", "/") for frame in stack]
+    for stage, fragments in STAGE_RULES:
+        if any(fragment in path for path in paths for fragment in fragments):
+            return stage
+    return "other"
+
+
+def _label(frame: Frame) -> str:
+    filename, line, name = frame
+    if filename.startswith(PROJECT_ROOT) and "site-packages" not in filename:
+        filename = os.path.relpath(filename, PROJECT_ROOT)
+    else:
+        # 표준 라이브러리/서드파티는 site-packages 또는 lib/pythonX.Y 이후만 표시
+        filename = re.split(r"[/\\](?:site-packages|python\d+\.\d+)[/\\]", filename)[-1]
+    return f"{name} ({filename}:{line})"
+
+
+class SamplingProfiler:
+    """Samples all threads and aggregates stacks per (pipeline, stage)."""
+
+    def __init__(self, out_dir: str = "profiles", interval: float = 0.01, top: int = 20):
+        """
+        Initialize profiler.
+
+        Args:
+            out_dir (str): Directory for pstats, collapsed-stack and summary files
+            interval (float): Seconds between samples
+            top (int): Hotspots listed in the summary
+        """
+        self.out_dir = out_dir
+        self.interval = interval
+        self.top = top
+        self.samples: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+        self.sample_count = 0
+        self.elapsed = 0.0
+        self._pipelines: Dict[int, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+        self._busy = 0.0
+
+    @contextmanager
+    def stage(self, pipeline: str):
+        """
+        Label samples of the calling thread with ``pipeline`` inside the block.
+
+        Samples from other threads (fetch and LLM workers) take the label
+        of the only active pipeline, or ``shared`` while several overlap.
+        """
+        ident = threading.get_ident()
+        previous = self._pipelines.get(ident)
+        self._pipelines[ident] = pipeline
+        try:
+            yield
+        finally:
+            if previous is None:
+                self._pipelines.pop(ident, None)
+            else:
+                self._pipelines[ident] = previous
+
+    def _pipeline_of(self, ident: int, active: Dict[int, str]) -> str:
+        if ident in active:
+            return active[ident]
+        names = set(active.values())
+        if len(names) == 1:
+            return names.pop()
+        return "shared" if names else "run"
+
+    def _sample(self) -> None:
+        own = threading.get_ident()
+        active = dict(self._pipelines)
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = []
+            in_project = False
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                in_project = in_project or _is_project_file(code.co_filename)
+                frame = frame.f_back
+            # 프로젝트 코드가 없는 스택(대기 중인 풀 스레드 등)은 제외
+            if not in_project:
+                continue
+            stack.reverse()
+            stack = tuple(stack)
+            self.samples[(self._pipeline_of(ident, active), classify(stack))][stack] += 1
+            self.sample_count += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            started = time.perf_counter()
+            self._sample()
+            self._busy += time.perf_counter() - started
+
+    def start(self) -> "SamplingProfiler":
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.elapsed = time.perf_counter() - self._started
+
+    @property
+    def overhead(self) -> float:
+        """Fraction of wall time spent taking samples."""
+        return self._busy / self.elapsed if self.elapsed else 0.0
+
+    def _by_stage(self) -> Dict[str, Counter]:
+        merged: Dict[str, Counter] = defaultdict(Counter)
+        for (pipeline, stage), stacks in self.samples.items():
+            for stack, count in stacks.items():
+                merged[stage][(pipeline,) + stack] += count
+        return merged
+
+    def _pstats(self, stacks: Counter) -> Dict:
+        """Build a ``pstats``-loadable dict from sampled stacks."""
+        stats: Dict = {}
+
+        def entry(frame):
+            if frame not in stats:
+                stats[frame] = [0, 0, 0.0, 0.0, {}]
+            return stats[frame]
+
+        for key, count in stacks.items():
+            stack = key[1:]
+            seconds = count * self.interval
+            for frame in set(stack):
+                item = entry(frame)
+                item[0] += count
+                item[1] += count
+                item[3] += seconds
+            entry(stack[-1])[2] += seconds
+            for caller, callee in set(zip(stack, stack[1:])):
+                callers = entry(callee)[4]
+                nc, cc, tt, ct = callers.get(caller, (0, 0, 0.0, 0.0))
+                callers[caller] = (
+                    nc + count, cc + count,
+                    tt + (seconds if callee == stack[-1] else 0.0), ct + seconds
+                )
+        return {frame: tuple(item) for frame, item in stats.items()}
+
+    def hotspots(self, stacks: Counter, limit: int) -> List[Tuple[str, float, float]]:
+        """Top functions by self time: ``(label, self seconds, total seconds)``."""
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for key, count in stacks.items():
+            stack = key[1:]
+            own[stack[-1]] += count
+            for frame in set(stack):
+                total[frame] += count
+        return [
+            (_label(frame), count * self.interval, total[frame] * self.interval)
+            for frame, count in own.most_common(limit)
+        ]
+
+    def summary(self) -> str:
+        """Per-stage sampled time and top-N hotspots."""
+        by_stage = self._by_stage()
+        lines = [
+            f"🔥 프로파일 요약 (샘플 {self.sample_count}개, 간격 {self.interval * 1000:.0f}ms, "
+            f"실행 {self.elapsed:.1f}초, 샘플링 부하 {self.overhead:.1%})"
+        ]
+        for stage in STAGES:
+            stacks = by_stage.get(stage)
+            if not stacks:
+                continue
+            seconds = sum(stacks.values()) * self.interval
+            pipelines = Counter()
+            for key, count in stacks.items():
+                pipelines[key[0]] += count
+            share = ", ".join(f"{p} {c * self.interval:.1f}s" for p, c in pipelines.most_common())
+            lines.append(f"  [{stage}] {seconds:.1f}초 (스레드 합산) — {share}")
+            for label, own, total in self.hotspots(stacks, 5):
+                lines.append(f"      {own:7.2f}s 자체 / {total:7.2f}s 누적  {label}")
+
+        lines.append(f"  상위 {self.top}개 (자체 시간 기준)")
+        everything = Counter()
+        for stacks in by_stage.values():
+            everything.update(stacks)
+        for label, own, total in self.hotspots(everything, self.top):
+            lines.append(f"    {own:7.2f}s 자체 / {total:7.2f}s 누적  {label}")
+        return "\n".join(lines)
+
+    def write(self) -> str:
+        """
+        Write per-stage pstats and collapsed-stack files plus ``summary.txt``.
+
+        Returns:
+            str: The summary text
+        """
+        os.makedirs(self.out_dir, exist_ok=True)
+        for stage, stacks in self._by_stage().items():
+            with open(os.path.join(self.out_dir, f"{stage}.pstats"), "wb") as f:
+                marshal.dump(self._pstats(stacks), f)
+            with open(os.path.join(self.out_dir, f"{stage}.collapsed"), "w", encoding="utf-8") as f:
+                for key, count in sorted(stacks.items(), key=lambda item: -item[1]):
+                    names = [key[0]] + [_label(frame).replace(";", ":") for frame in key[1:]]
+                    f.write(f"{';'.join(names)} {count}\n")
+
+        text = self.summary()
+        with open(os.path.join(self.out_dir, "summary.txt"), "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        return text
@@ -0,0 +1,297 @@
+"""
+Rate limiting and retry utilities.
+
+Every upstream has one process-wide token bucket, looked up by host with
+``get_host_limiter``. The Sheets quota and the Claude request limit use
+named buckets (``SHEETS_READ``, ``SHEETS_WRITE``, ``ANTHROPIC``).
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from ..config.env import CACHE_DIR
+from ..config.settings import Settings
+
+
+class TokenBucket:
+    """Thread-safe token bucket."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float, optional): Maximum burst size, defaults to one second of tokens
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, amount: float) -> "TokenBucket":
+        """Bucket allowing ``amount`` tokens per minute."""
+        return cls(amount / 60.0, capacity=amount)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        Take ``amount`` tokens, blocking until they are available.
+
+        Requests larger than the capacity are clamped to it so they wait
+        for a full bucket instead of forever.
+
+        Args:
+            amount (float): Tokens to take
+            timeout (float, optional): Longest wait in seconds
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            TimeoutError: The tokens would not be available within ``timeout``
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                wait = max(
+                    self._blocked_until - now,
+                    (amount - self._tokens) / self.rate if self.rate > 0 else 1.0
+                )
+            if timeout is not None and waited + wait > timeout:
+                raise TimeoutError(f"토큰 대기 {timeout:.1f}초 초과")
+            time.sleep(wait)
+            waited += wait
+
+    def try_acquire(self, amount: float = 1.0) -> bool:
+        """Take ``amount`` tokens only if available right now."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self._blocked_until and self._tokens >= amount:
+                self._tokens -= amount
+                return True
+            return False
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back for ``seconds`` (e.g. after ``Retry-After``)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header.
+
+    Args:
+        value (str, optional): Delay in seconds or an HTTP date
+
+    Returns:
+        Optional[float]: Seconds to wait, or None when absent or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    Args:
+        attempt (int): Zero-based retry attempt
+        base (float): Delay scale in seconds
+        cap (float): Maximum delay in seconds
+
+    Returns:
+        float: Seconds to wait
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class QuotaExhausted(Exception):
+    """Raised instead of calling an upstream whose daily quota is used up."""
+
+
+class QuotaLedger:
+    """
+    Daily request quota persisted across runs.
+
+    Usage is stored per UTC day in a small JSON file so separate runs on
+    the same day share one budget. The file is rewritten every
+    ``SAVE_EVERY`` requests and by ``save`` at the end of a run, not on
+    every request.
+    """
+
+    SAVE_EVERY = 20
+
+    def __init__(self, name: str, daily_limit: int, path: Optional[str] = None):
+        """
+        Initialize quota ledger.
+
+        Args:
+            name (str): Quota name used for the ledger file
+            daily_limit (int): Requests allowed per UTC day
+            path (str, optional): Ledger file path
+        """
+        self.name = name
+        self.daily_limit = daily_limit
+        self.path = path or os.path.join(CACHE_DIR, f"quota_{name}.json")
+        self._lock = threading.Lock()
+        self._day, self._used = self._load()
+        self._unsaved = 0
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data.get("date"), int(data.get("used", 0))
+        except (OSError, ValueError):
+            return self._today(), 0
+
+    def _save(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"date": self._day, "used": self._used}, f)
+            os.replace(tmp, self.path)
+            self._unsaved = 0
+        except OSError as e:
+            print(f"⚠️ {self.name} 할당량 기록 실패: {e}")
+
+    def save(self) -> None:
+        """Write usage not yet saved to the ledger file atomically."""
+        with self._lock:
+            if self._unsaved:
+                self._save()
+
+    def _roll(self) -> None:
+        today = self._today()
+        if self._day != today:
+            self._day, self._used = today, 0
+
+    def remaining(self) -> int:
+        """Requests left today."""
+        with self._lock:
+            self._roll()
+            return max(0, self.daily_limit - self._used)
+
+    def try_consume(self, amount: int = 1) -> bool:
+        """
+        Reserve ``amount`` requests if today's quota allows it.
+
+        Args:
+            amount (int): Requests to reserve
+
+        Returns:
+            bool: False when the reservation would exceed the daily limit
+        """
+        with self._lock:
+            self._roll()
+            if self._used + amount > self.daily_limit:
+                return False
+            self._used += amount
+            self._unsaved += amount
+            if self._unsaved >= self.SAVE_EVERY:
+                self._save()
+            return True
+
+
+_ledgers = {}
+_ledgers_lock = threading.Lock()
+
+
+def get_quota_ledger(name: str, daily_limit: int) -> QuotaLedger:
+    """Return the process-wide ledger for ``name``."""
+    with _ledgers_lock:
+        if name not in _ledgers:
+            _ledgers[name] = QuotaLedger(name, daily_limit)
+        return _ledgers[name]
+
+
+def save_quota_ledgers() -> None:
+    """Write every process-wide ledger's unsaved usage (call at the end of a run)."""
+    with _ledgers_lock:
+        ledgers = list(_ledgers.values())
+    for ledger in ledgers:
+        ledger.save()
+
+
+# 재시도할 HTTP 상태 (429 Too Many Requests, 5xx)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+SHEETS_READ = "sheets.googleapis.com:read"
+SHEETS_WRITE = "sheets.googleapis.com:write"
+ANTHROPIC = "api.anthropic.com"
+
+
+def _build_limiter(name: str) -> Optional[TokenBucket]:
+    settings = Settings()
+    if name in (SHEETS_READ, SHEETS_WRITE):
+        # 버스트 + 1분간 충전량 = 분당 쿼터 → 어떤 60초 구간도 쿼터를 넘지 않음
+        quota = settings.get_sheet_quota_settings()
+        limit = quota["reads_per_minute" if name == SHEETS_READ else "writes_per_minute"]
+        burst = max(1, min(quota["burst"], limit - 1))
+        return TokenBucket((limit - burst) / 60.0, capacity=burst)
+    if name == ANTHROPIC:
+        return TokenBucket.per_minute(settings.get_llm_settings()["rpm"])
+    limit = settings.get_rate_limit_settings()["hosts"].get(name)
+    if limit is None:
+        return None
+    rate, burst = limit
+    return TokenBucket(rate, capacity=burst)
+
+
+_limiters: Dict[str, Optional[TokenBucket]] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str) -> Optional[TokenBucket]:
+    """
+    Return the process-wide bucket for ``host``.
+
+    Args:
+        host (str): Upstream hostname or a named quota (``SHEETS_READ`` etc.)
+
+    Returns:
+        Optional[TokenBucket]: Shared bucket, or None for unlimited hosts
+    """
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = _build_limiter(host)
+        return _limiters[host]
+
+
+def get_sheets_limiter(kind: str) -> TokenBucket:
+    """Shared Sheets quota bucket for ``kind`` (``read`` or ``write``)."""
+    return get_host_limiter(SHEETS_READ if kind == "read" else SHEETS_WRITE)
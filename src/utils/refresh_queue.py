@@ -0,0 +1,183 @@
+"""
+Per-ticker refresh scheduling for the long-running daemon.
+
+Each ticker has a tier (1 = hottest) with a base refresh interval and an
+observed news velocity (new articles per hour, exponentially smoothed).
+A ticker is refreshed again after roughly the time one new article is
+expected. The interval is capped by its tier interval and never drops
+below ``min_interval``. Due tickers come out of a heap ordered by due
+time, then tier, then velocity.
+"""
+
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Deque, Dict, Hashable, Iterable, List, Optional, Set
+
+# 링크 기억 개수 (새 기사 판별용)
+SEEN_LINKS = 64
+
+
+@dataclass
+class TickerState:
+    """Scheduling state of one ticker."""
+
+    tier: int
+    due: float
+    rate: float = 0.0  # 시간당 새 기사 수 (EWMA)
+    last_refresh: Optional[float] = None
+    refreshes: int = 0
+    seen: Deque[str] = field(default_factory=lambda: deque(maxlen=SEEN_LINKS))
+    seen_set: Set[str] = field(default_factory=set)
+
+    def remember(self, link: str) -> bool:
+        """Record ``link``; True when it was not seen before."""
+        if link in self.seen_set:
+            return False
+        if len(self.seen) == self.seen.maxlen:
+            self.seen_set.discard(self.seen[0])
+        self.seen.append(link)
+        self.seen_set.add(link)
+        return True
+
+
+class RefreshQueue:
+    """Priority queue of ticker refreshes driven by tier and news velocity."""
+
+    def __init__(
+        self,
+        tier_intervals: Dict[int, float],
+        min_interval: float = 120.0,
+        smoothing: float = 0.3,
+        clock=time.monotonic
+    ):
+        """
+        Initialize refresh queue.
+
+        Args:
+            tier_intervals (Dict[int, float]): Longest refresh interval per tier in seconds
+            min_interval (float): Shortest refresh interval in seconds
+            smoothing (float): Weight of the latest observation in the velocity average
+            clock (Callable[[], float]): Monotonic time source
+        """
+        self.tier_intervals = dict(tier_intervals)
+        self.min_interval = min_interval
+        self.smoothing = smoothing
+        self.clock = clock
+        self.states: Dict[Hashable, TickerState] = {}
+        self._heap: List = []
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def _push(self, key: Hashable, state: TickerState) -> None:
+        heapq.heappush(self._heap, (state.due, state.tier, -state.rate, next(self._seq), key))
+
+    def _base_interval(self, tier: int) -> float:
+        if tier in self.tier_intervals:
+            return self.tier_intervals[tier]
+        return self.tier_intervals[max(self.tier_intervals)]
+
+    def interval(self, key: Hashable) -> float:
+        """Seconds until ``key`` should be refreshed again."""
+        state = self.states[key]
+        base = self._base_interval(state.tier)
+        expected_gap = 3600.0 / state.rate if state.rate > 0 else base
+        return max(self.min_interval, min(base, expected_gap))
+
+    def add(self, key: Hashable, tier: int, due: Optional[float] = None) -> None:
+        """Schedule ``key`` (immediately by default); an existing key only changes tier."""
+        if key in self.states:
+            self.states[key].tier = tier
+            return
+        state = TickerState(tier=tier, due=self.clock() if due is None else due)
+        self.states[key] = state
+        self._push(key, state)
+
+    def sync(self, keys: Dict[Hashable, int]) -> None:
+        """Match the queue to ``keys`` (key → tier): add new keys, drop missing ones."""
+        for key in list(self.states):
+            if key not in keys:
+                del self.states[key]
+        for key, tier in keys.items():
+            self.add(key, tier)
+
+    def pop_due(self, limit: int, now: Optional[float] = None) -> List[Hashable]:
+        """
+        Take up to ``limit`` keys whose refresh is due, most urgent first.
+
+        Popped keys stay registered; ``record`` schedules them again.
+        """
+        now = self.clock() if now is None else now
+        due = []
+        while self._heap and len(due) < limit:
+            when, _, _, _, key = self._heap[0]
+            state = self.states.get(key)
+            if state is None or state.due != when:
+                heapq.heappop(self._heap)  # 삭제되었거나 다시 예약된 항목
+                continue
+            if when > now:
+                break
+            heapq.heappop(self._heap)
+            state.due = float("inf")
+            due.append(key)
+        return due
+
+    def next_due(self) -> Optional[float]:
+        """Clock time of the next scheduled refresh."""
+        while self._heap:
+            when, _, _, _, key = self._heap[0]
+            state = self.states.get(key)
+            if state is not None and state.due == when:
+                return when
+            heapq.heappop(self._heap)
+        return None
+
+    def record(self, key: Hashable, items: Iterable, now: Optional[float] = None) -> int:
+        """
+        Update velocity from a refresh result and reschedule ``key``.
+
+        The first refresh seeds the velocity from articles published in
+        the last 24 hours. Later refreshes count links not seen before,
+        per hour since the previous refresh.
+
+        Args:
+            key (Hashable): Refreshed ticker
+            items (Iterable[NewsItem]): Items returned by the refresh
+            now (float, optional): Clock time of the refresh
+
+        Returns:
+            int: New articles found
+        """
+        state = self.states.get(key)
+        if state is None:
+            return 0
+        now = self.clock() if now is None else now
+        items = list(items or [])
+        new = sum(1 for item in items if item.link and state.remember(item.link))
+
+        if state.last_refresh is None:
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+            recent = sum(1 for item in items if item.published and item.published >= cutoff)
+            state.rate = recent / 24.0
+        else:
+            hours = max((now - state.last_refresh) / 3600.0, 1e-6)
+            state.rate = self.smoothing * (new / hours) + (1 - self.smoothing) * state.rate
+
+        state.last_refresh = now
+        state.refreshes += 1
+        state.due = now + self.interval(key)
+        self._push(key, state)
+        return new
+
+    def reschedule(self, key: Hashable, delay: float, now: Optional[float] = None) -> None:
+        """Schedule ``key`` again after ``delay`` seconds without touching its velocity."""
+        state = self.states.get(key)
+        if state is None:
+            return
+        state.due = (self.clock() if now is None else now) + delay
+        self._push(key, state)
@@ -0,0 +1,214 @@
+"""
+Per-source circuit breakers and latency windows for hedged requests.
+
+Breakers are keyed by upstream host, so every collector that uses a host
+shares its health. A breaker opens after ``failure_threshold`` failures
+in a row (5xx, timeouts, connection errors). While open, requests fail
+fast with ``CircuitOpenError``. After ``reset_timeout`` one probe request
+is let through (half-open): success closes the breaker, failure opens it
+again. Every state change is logged and counted.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from . import metrics
+from ..config.settings import Settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a source whose breaker is open."""
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker for one upstream."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 300.0):
+        """
+        Initialize breaker.
+
+        Args:
+            name (str): Upstream name used in logs and metrics
+            failure_threshold (int): Consecutive failures that open the breaker
+            reset_timeout (float): Seconds open before a half-open probe
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.rejected = 0
+        self.transitions: List[str] = []
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def _move(self, state: str, reason: str) -> None:
+        previous, self.state = self.state, state
+        self.transitions.append(f"{previous}→{state}")
+        metrics.inc("breaker_transitions_total", source=self.name, state=state)
+        print(f"🔌 회로 차단기 [{self.name}] {previous} → {state} ({reason})")
+
+    @property
+    def failing(self) -> bool:
+        """True while the upstream has failed since its last success."""
+        return self.state != CLOSED or self.failures > 0
+
+    def available(self) -> bool:
+        """True when a call would be let through (without reserving a probe)."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                return time.monotonic() - self._opened_at >= self.reset_timeout
+            return not self._probing
+
+    def allow(self) -> bool:
+        """Reserve permission for one call; False means fail fast."""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._move(HALF_OPEN, "재시도 대기 경과")
+                self._probing = False
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            metrics.inc("breaker_rejected_total", source=self.name)
+            return False
+
+    def cancel(self) -> None:
+        """Release a reserved half-open probe without an outcome (e.g. the caller ran out of time)."""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            if self.state == HALF_OPEN:
+                self._probing = False
+                self._move(CLOSED, "시험 요청 성공")
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                self._probing = False
+                self._opened_at = time.monotonic()
+                self._move(OPEN, "시험 요청 실패")
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._move(OPEN, f"연속 실패 {self.failures}회")
+
+
+class LatencyWindow:
+    """Recent successful-call latencies of one upstream."""
+
+    def __init__(self, size: int = 200):
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency at ``pct`` (0-100), or None without samples."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * pct / 100.0))
+        return samples[index]
+
+
+_settings = Settings().get_resilience_settings()
+_breakers: Dict[str, CircuitBreaker] = {}
+_windows: Dict[str, LatencyWindow] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """Return the process-wide breaker for ``host``."""
+    with _registry_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host, _settings["failure_threshold"], _settings["reset_timeout"])
+        return _breakers[host]
+
+
+def get_latency_window(host: str) -> LatencyWindow:
+    """Return the process-wide latency window for ``host``."""
+    with _registry_lock:
+        if host not in _windows:
+            _windows[host] = LatencyWindow()
+        return _windows[host]
+
+
+def hedge_delay(host: str) -> Optional[float]:
+    """
+    Seconds after which a hedged duplicate request should be sent.
+
+    Only hosts listed in ``HEDGE_HOSTS`` are hedged, and only once
+    enough latencies have been observed to estimate the percentile.
+
+    Args:
+        host (str): Upstream hostname
+
+    Returns:
+        Optional[float]: The ``HEDGE_PERCENTILE`` latency, or None to not hedge
+    """
+    if host not in _settings["hedge_hosts"]:
+        return None
+    window = get_latency_window(host)
+    if len(window) < _settings["hedge_min_samples"]:
+        return None
+    return window.percentile(_settings["hedge_percentile"])
+
+
+def allocate_slots(sources: List[Tuple[str, str, int]]) -> Tuple[List[Tuple[str, str, int]], List[str]]:
+    """
+    Hand the news slots of sources whose breaker is open to healthy ones.
+
+    Args:
+        sources (List[Tuple[str, str, int]]): (name, host, count) in priority order
+
+    Returns:
+        Tuple[List[Tuple[str, str, int]], List[str]]: Healthy sources with
+        their new counts, and the names of skipped sources
+    """
+    healthy, skipped, spare = [], [], 0
+    for name, host, count in sources:
+        if get_breaker(host).available():
+            healthy.append([name, host, count])
+        else:
+            skipped.append(name)
+            spare += count
+    if healthy:
+        for i in range(spare):
+            healthy[i % len(healthy)][2] += 1
+    return [tuple(source) for source in healthy], skipped
+
+
+def report() -> str:
+    """Breakers that left the closed state, or an empty string."""
+    with _registry_lock:
+        breakers = [b for b in _breakers.values() if b.transitions]
+    if not breakers:
+        return ""
+    lines = ["🔌 회로 차단기 상태"]
+    for breaker in sorted(breakers, key=lambda b: b.name):
+        lines.append(
+            f"  {breaker.name}: {breaker.state} (차단된 요청 {breaker.rejected}회, "
+            f"전이 {', '.join(breaker.transitions)})"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,166 @@
+"""
+Dependency-graph scheduler for pipeline stages.
+
+Stages whose dependencies have finished run concurrently on a thread
+pool. Pipelines do not pause for each other. Shared upstream limits
+(Sheets quota, Claude rate limits, per-host fetch slots) are enforced by
+the process-wide limiters the pipelines already use.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+
+@dataclass
+class Stage:
+    """One node of the pipeline graph and its run record."""
+
+    name: str
+    fn: Callable[[], Any]
+    deps: Sequence[str] = ()
+    status: str = "pending"
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[BaseException] = field(default=None, repr=False)
+
+    @property
+    def seconds(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+class PipelineScheduler:
+    """Runs stages in dependency order, independent stages in parallel."""
+
+    def __init__(self, stages: Iterable[Stage], concurrent: bool = True):
+        """
+        Initialize scheduler.
+
+        Args:
+            stages (Iterable[Stage]): Graph nodes; ``deps`` name other stages
+            concurrent (bool): Run ready stages in parallel (False runs them one by one)
+        """
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage: {stage.name}")
+            self.stages[stage.name] = stage
+        for stage in self.stages.values():
+            missing = [dep for dep in stage.deps if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Unknown dependencies for {stage.name}: {missing}")
+        self.concurrent = concurrent
+        self.started = 0.0
+        self.finished = 0.0
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        order, done, visiting = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle at {name}")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def _execute(self, stage: Stage) -> None:
+        stage.status = "running"
+        stage.started = time.perf_counter()
+        try:
+            stage.fn()
+            stage.status = "ok"
+        except Exception as e:
+            stage.error = e
+            stage.status = "failed"
+            print(f"❌ 단계 실패 ({stage.name}): {e}")
+        finally:
+            stage.finished = time.perf_counter()
+
+    def _ready(self, stage: Stage) -> Optional[bool]:
+        """True when runnable, False when a dependency failed, None while waiting."""
+        states = [self.stages[dep].status for dep in stage.deps]
+        if any(state in ("failed", "skipped") for state in states):
+            return False
+        if all(state == "ok" for state in states):
+            return True
+        return None
+
+    def run(self) -> Dict[str, Stage]:
+        """
+        Run every stage; dependents of a failed stage are skipped.
+
+        Returns:
+            Dict[str, Stage]: Stages with status and timings
+        """
+        self.started = time.perf_counter()
+        pending = [self.stages[name] for name in self.order]
+
+        if not self.concurrent:
+            for stage in pending:
+                if self._ready(stage):
+                    self._execute(stage)
+                else:
+                    stage.status = "skipped"
+            self.finished = time.perf_counter()
+            return self.stages
+
+        with ThreadPoolExecutor(max_workers=len(pending) or 1, thread_name_prefix="pipeline") as pool:
+            running = {}
+            while pending or running:
+                for stage in list(pending):
+                    ready = self._ready(stage)
+                    if ready is None:
+                        continue
+                    pending.remove(stage)
+                    if ready:
+                        running[pool.submit(self._execute, stage)] = stage
+                    else:
+                        stage.status = "skipped"
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+
+        self.finished = time.perf_counter()
+        return self.stages
+
+    @property
+    def elapsed(self) -> float:
+        return self.finished - self.started
+
+    def timeline(self, width: int = 40) -> str:
+        """Per-stage start/end bars relative to the run start."""
+        total = max(self.elapsed, 1e-9)
+        serial = sum(stage.seconds for stage in self.stages.values())
+        marks = {"ok": "✅", "failed": "❌", "skipped": "⏭️", "pending": "…", "running": "…"}
+        label_width = max((len(name) for name in self.stages), default=0)
+        lines = [f"🗓️ 파이프라인 타임라인 (총 {self.elapsed:.1f}초, 순차 합계 {serial:.1f}초)"]
+        for name in self.order:
+            stage = self.stages[name]
+            if stage.started is None:
+                lines.append(f"  {name:<{label_width}} |{' ' * width}| {marks[stage.status]}")
+                continue
+            start = stage.started - self.started
+            end = stage.finished - self.started
+            first = min(width - 1, int(start / total * width))
+            last = max(first + 1, min(width, round(end / total * width)))
+            bar = " " * first + "█" * (last - first) + " " * (width - last)
+            lines.append(
+                f"  {name:<{label_width}} |{bar}| {start:6.1f}s → {end:6.1f}s "
+                f"({stage.seconds:.1f}s) {marks[stage.status]}"
+            )
+        return "\n".join(lines)
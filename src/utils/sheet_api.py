@@ -0,0 +1,92 @@
+"""
+Rate-limited, retried Google Sheets API calls.
+"""
+
+import time
+from typing import Any, Callable, Optional
+
+import requests
+
+from . import deadline, metrics
+from .deadline import DeadlineExceeded
+from .ratelimit import RETRY_STATUSES, backoff_delay, get_sheets_limiter, parse_retry_after
+
+WRITE_METHODS = frozenset({"batch_update", "update", "append_rows", "clear"})
+
+
+def _status(error: Exception) -> Optional[int]:
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        status = getattr(error, "code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    return parse_retry_after(headers.get("Retry-After"))
+
+
+def call(
+    method: str,
+    fn: Callable[..., Any],
+    *args,
+    max_retries: int = 3,
+    base_delay: float = 2.0,
+    max_delay: float = 60.0,
+    **kwargs
+) -> Any:
+    """
+    Call a worksheet method under the shared Sheets quota.
+
+    Each attempt takes a token from the read or write bucket. 429 and
+    5xx errors and connection failures are retried. A 429 with
+    ``Retry-After`` pauses every caller of that bucket; other errors
+    back off with jittered exponential delay. Anything else is raised at
+    once. Neither the token wait nor a retry delay may run past the
+    current deadline: the last error is raised instead of retrying.
+
+    Args:
+        method (str): Worksheet method name, used for the quota kind and metrics
+        fn (Callable): Bound worksheet method, e.g. ``sheet.batch_update``
+        *args: Positional arguments for ``fn``
+        max_retries (int): Retries for retryable failures
+        base_delay (float): Backoff scale in seconds
+        max_delay (float): Backoff and ``Retry-After`` cap in seconds
+        **kwargs: Keyword arguments for ``fn``
+
+    Returns:
+        Any: Result of ``fn``
+
+    Raises:
+        DeadlineExceeded: The deadline passed before a quota token was available
+    """
+    limiter = get_sheets_limiter("write" if method in WRITE_METHODS else "read")
+    for attempt in range(max_retries + 1):
+        try:
+            limiter.acquire(timeout=deadline.remaining())
+        except TimeoutError as e:
+            raise DeadlineExceeded(f"시트 {method} 마감 시간 초과") from e
+        metrics.inc("sheets_calls_total", method=method)
+        try:
+            with metrics.timer("sheets_call_seconds", method=method):
+                return fn(*args, **kwargs)
+        except Exception as e:
+            status = _status(e)
+            retryable = status in RETRY_STATUSES or isinstance(e, (requests.ConnectionError, requests.Timeout))
+            if attempt == max_retries or not retryable:
+                raise
+            wait = _retry_after(e) if status == 429 else None
+            paused = wait is not None
+            if paused:
+                wait = min(wait, max_delay)
+            else:
+                wait = backoff_delay(attempt, base_delay, max_delay)
+            if not deadline.can_wait(wait):
+                raise
+            if paused:
+                limiter.pause(wait)
+            metrics.inc("sheets_retries_total", method=method)
+            print(f"⚠️ 시트 {method} 재시도 {attempt + 1}/{max_retries} ({wait:.1f}초 후): {e}")
+            time.sleep(wait)
@@ -0,0 +1,145 @@
+"""
+Cell-level diffing for Google Sheets updates.
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+from . import sheet_api
+
+_CELL_RE = re.compile(r"^([A-Za-z]+)(\d+)")
+
+
+def column_letter(number: int) -> str:
+    """Convert a 1-based column number to letters (1 → A, 27 → AA)."""
+    letters = ""
+    while number > 0:
+        number, rem = divmod(number - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def column_number(letters: str) -> int:
+    """Convert column letters to a 1-based column number (A → 1)."""
+    number = 0
+    for ch in letters.upper():
+        number = number * 26 + ord(ch) - ord("A") + 1
+    return number
+
+
+def range_origin(a1_range: str) -> Tuple[int, int]:
+    """
+    Return the top-left ``(row, column)`` of an A1 range like ``A2:D31``.
+
+    Args:
+        a1_range (str): A1 notation range
+
+    Returns:
+        Tuple[int, int]: 1-based row and column numbers
+    """
+    match = _CELL_RE.match(a1_range.split("!")[-1])
+    if not match:
+        raise ValueError(f"Unsupported range: {a1_range}")
+    return int(match.group(2)), column_number(match.group(1))
+
+
+def _cell(value) -> str:
+    return "" if value is None else str(value)
+
+
+def diff_rows(
+    current: List[List[str]],
+    rows: Dict[int, List[str]],
+    origin_row: int = 1,
+    origin_col: int = 1
+) -> Tuple[List[Dict], int, int]:
+    """
+    Compare new row values against the current grid.
+
+    Changed cells of each row are grouped into runs of adjacent columns,
+    and identical runs on consecutive rows are merged into one block.
+
+    Args:
+        current (List[List[str]]): Current values, ``current[0][0]`` at ``(origin_row, origin_col)``
+        rows (Dict[int, List[str]]): New values keyed by 1-based row, starting at ``origin_col``
+        origin_row (int): Sheet row of ``current[0]``
+        origin_col (int): Sheet column of the first value in each row
+
+    Returns:
+        Tuple[List[Dict], int, int]: ``batch_update`` data, cells written, cells skipped
+    """
+    runs = []  # (row, first_col_idx, last_col_idx, values)
+    written = skipped = 0
+
+    for row in sorted(rows):
+        values = rows[row]
+        idx = row - origin_row
+        existing = current[idx] if 0 <= idx < len(current) else []
+
+        start = None
+        for col, value in enumerate(values):
+            old = existing[col] if col < len(existing) else ""
+            if _cell(value) != _cell(old):
+                written += 1
+                if start is None:
+                    start = col
+                continue
+            skipped += 1
+            if start is not None:
+                runs.append((row, start, col - 1, values[start:col]))
+                start = None
+        if start is not None:
+            runs.append((row, start, len(values) - 1, values[start:]))
+
+    blocks = []  # [first_row, last_row, first_col_idx, last_col_idx, values]
+    for row, first, last, values in sorted(runs, key=lambda r: (r[1], r[2], r[0])):
+        prev = blocks[-1] if blocks else None
+        if prev and prev[2] == first and prev[3] == last and prev[1] == row - 1:
+            prev[1] = row
+            prev[4].append(values)
+        else:
+            blocks.append([row, row, first, last, [values]])
+
+    batch_data = [
+        {
+            "range": (
+                f"{column_letter(origin_col + first)}{first_row}:"
+                f"{column_letter(origin_col + last)}{last_row}"
+            ),
+            "values": values
+        }
+        for first_row, last_row, first, last, values in sorted(blocks)
+    ]
+    return batch_data, written, skipped
+
+
+def diff_update(sheet, updates: List[Tuple[str, List[List[str]]]]) -> Tuple[int, int]:
+    """
+    Write only the cells of ``updates`` that differ from the sheet.
+
+    The current values of every target range are read in one
+    ``batch_get`` call, and nothing is written when all cells match.
+
+    Args:
+        sheet (gspread.Worksheet): Target worksheet
+        updates (List[Tuple[str, List[List[str]]]]): ``(A1 range, values)`` pairs
+
+    Returns:
+        Tuple[int, int]: Cells written and cells skipped
+    """
+    current = sheet_api.call("batch_get", sheet.batch_get, [a1_range for a1_range, _ in updates])
+
+    batch_data = []
+    written = skipped = 0
+    for (a1_range, values), existing in zip(updates, current):
+        origin_row, origin_col = range_origin(a1_range)
+        rows = {origin_row + i: row for i, row in enumerate(values)}
+        data, w, s = diff_rows(list(existing), rows, origin_row, origin_col)
+        batch_data.extend(data)
+        written += w
+        skipped += s
+
+    if batch_data:
+        sheet_api.call("batch_update", sheet.batch_update, batch_data)
+    print(f"📝 셀 기록 {written}개 / 변경 없음 {skipped}개")
+    return written, skipped
@@ -0,0 +1,179 @@
+"""
+Buffered Google Sheets writer.
+"""
+
+import time
+from typing import Dict, List, Tuple
+
+from . import sheet_api
+from .sheet_diff import column_number, diff_rows
+
+
+def merge_row_blocks(rows: Dict[int, List[str]]) -> List[Tuple[int, int, List[List[str]]]]:
+    """
+    Merge rows with consecutive row numbers into blocks.
+
+    Args:
+        rows (Dict[int, List[str]]): Row values keyed by 1-based row number
+
+    Returns:
+        List[Tuple[int, int, List[List[str]]]]: ``(first_row, last_row, values)`` blocks
+    """
+    blocks = []
+    for row in sorted(rows):
+        if blocks and blocks[-1][1] == row - 1:
+            first, _, values = blocks[-1]
+            values.append(rows[row])
+            blocks[-1] = (first, row, values)
+        else:
+            blocks.append((row, row, [rows[row]]))
+    return blocks
+
+
+class BatchSheetWriter:
+    """Write-behind buffer that flushes rows through ``batch_update``."""
+
+    def __init__(
+        self,
+        sheet,
+        first_col: str = "A",
+        last_col: str = "S",
+        chunk_size: int = 200,
+        flush_interval: float = 30.0,
+        max_retries: int = 3,
+        retry_delay: float = 2.0,
+        diff: bool = False
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            sheet (gspread.Worksheet): Target worksheet
+            first_col (str): First column of each written row
+            last_col (str): Last column of each written row
+            chunk_size (int): Buffered rows that trigger a flush
+            flush_interval (float): Seconds after which buffered rows are flushed
+            max_retries (int): Retries for a flush failing with 429/5xx
+            retry_delay (float): Backoff scale between retries (jittered, doubled each time)
+            diff (bool): Read the current grid once and write only changed cells
+        """
+        self.sheet = sheet
+        self.first_col = first_col
+        self.last_col = last_col
+        self.chunk_size = max(1, chunk_size)
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+        self._buffer: Dict[int, List[str]] = {}
+        self._last_flush = time.monotonic()
+        self.requests = 0
+        self.rows_written = 0
+        self.cells_written = 0
+        self.cells_skipped = 0
+
+        self.baseline = None
+        if diff:
+            grid = sheet_api.call("get", sheet.get, f"{first_col}:{last_col}", max_retries=max_retries)
+            self.baseline = [list(row) for row in grid]
+
+    def add(self, row: int, values: List[str]) -> None:
+        """
+        Buffer one row, flushing when the size or time threshold is reached.
+
+        Args:
+            row (int): 1-based sheet row
+            values (List[str]): Cell values from ``first_col`` to ``last_col``
+        """
+        self._buffer[row] = values
+        if (
+            len(self._buffer) >= self.chunk_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def pending(self) -> int:
+        """Number of rows waiting to be written."""
+        return len(self._buffer)
+
+    def due(self) -> bool:
+        """True when rows are buffered and ``flush_interval`` has passed."""
+        return bool(self._buffer) and time.monotonic() - self._last_flush >= self.flush_interval
+
+    def _batch_data(self, rows: Dict[int, List[str]]) -> Tuple[List[Dict], int, int]:
+        if self.baseline is not None:
+            return diff_rows(self.baseline, rows, 1, column_number(self.first_col))
+
+        batch_data = [
+            {
+                "range": f"{self.first_col}{first}:{self.last_col}{last}",
+                "values": values
+            }
+            for first, last, values in merge_row_blocks(rows)
+        ]
+        return batch_data, sum(len(values) for values in rows.values()), 0
+
+    def _remember(self, rows: Dict[int, List[str]]) -> None:
+        if self.baseline is None:
+            return
+        for row, values in rows.items():
+            while len(self.baseline) < row:
+                self.baseline.append([])
+            self.baseline[row - 1] = list(values)
+
+    def flush(self) -> bool:
+        """
+        Write all buffered rows in one ``batch_update`` call.
+
+        Rows stay buffered when every retry fails, so a later flush can
+        still write them.
+
+        Returns:
+            bool: True when the buffer is empty afterwards
+        """
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return True
+
+        rows = dict(self._buffer)
+        batch_data, written, skipped = self._batch_data(rows)
+
+        if batch_data:
+            try:
+                sheet_api.call(
+                    "batch_update",
+                    self.sheet.batch_update,
+                    batch_data,
+                    max_retries=self.max_retries,
+                    base_delay=self.retry_delay
+                )
+                self.requests += 1
+            except Exception as e:
+                print(f"❌ 시트 배치 업데이트 실패 ({len(rows)}행 보류): {e}")
+                return False
+
+        for row in rows:
+            if self._buffer.get(row) is rows[row]:
+                del self._buffer[row]
+        self._remember(rows)
+        self.rows_written += len(rows)
+        self.cells_written += written
+        self.cells_skipped += skipped
+        if batch_data:
+            print(f"✅ 배치 업데이트 완료: {len(rows)}행 / {len(batch_data)}개 범위")
+        else:
+            print(f"⏭️ 변경 없음: {len(rows)}행 쓰기 생략")
+        return True
+
+    def close(self) -> bool:
+        """Flush the remaining rows and report anything left unwritten."""
+        ok = self.flush()
+        if not ok:
+            print(f"❌ 기록하지 못한 행: {sorted(self._buffer)}")
+        return ok
+
+    def __enter__(self) -> "BatchSheetWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
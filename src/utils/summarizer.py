@@ -2,8 +2,7 @@
 Summarization utilities using Claude API.
 """
 
-import os
-from anthropic import Anthropic
+from .llm_pool import get_llm_executor
 
 def summarize_with_claude(text: str) -> str:
     """
@@ -16,8 +15,6 @@ def summarize_with_claude(text: str) -> str:
         str: Summarized text
     """
     try:
-        client = Anthropic(api_key=os.getenv("CLAUDE_API_KEY"))
-        
         prompt = (
             "역할: 너는 금융 뉴스 요약 전문가다.\n"
             "목표: 다음 뉴스의 핵심만 한 줄로 요약해줘.\n"
@@ -26,7 +23,7 @@ def summarize_with_claude(text: str) -> str:
             "요약:"
         )
         
-        message = client.messages.create(
+        message = get_llm_executor().create_message(
             model="claude-3-5-haiku-20241022",
             max_tokens=800,
             temperature=0.3,
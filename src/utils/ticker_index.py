@@ -0,0 +1,101 @@
+"""
+Ticker to sheet-row index utilities.
+"""
+
+import hashlib
+import json
+import os
+import unicodedata
+from typing import Dict, List, Tuple
+
+from ..config.env import CACHE_DIR
+
+
+def normalize_ticker(name: str) -> str:
+    """
+    Normalize a ticker name for lookups.
+
+    Args:
+        name (str): Raw ticker cell value
+
+    Returns:
+        str: NFKC-normalized, whitespace-collapsed, case-folded key
+    """
+    return " ".join(unicodedata.normalize("NFKC", name).split()).casefold()
+
+
+class TickerIndex:
+    """Ticker to 1-based sheet row index built from one column A read."""
+
+    def __init__(self, column: List[str], header_rows: int = 1):
+        """
+        Build the index.
+
+        Args:
+            column (List[str]): Column A values including header rows
+            header_rows (int): Number of leading header rows to skip
+        """
+        self.rows: Dict[str, int] = {}
+        self.duplicates: Dict[str, List[int]] = {}
+        self._entries: List[Tuple[str, int]] = []
+
+        for i, name in enumerate(column[header_rows:], start=header_rows + 1):
+            key = normalize_ticker(name or "")
+            if not key:
+                continue
+            if key in self.rows:
+                self.duplicates.setdefault(key, [self.rows[key]]).append(i)
+                continue
+            self.rows[key] = i
+            self._entries.append((name.strip(), i))
+
+        self.fingerprint = hashlib.sha1(
+            "\n".join(normalize_ticker(name or "") for name in column).encode("utf-8")
+        ).hexdigest()
+        self.changed = True
+
+    def entries(self) -> List[Tuple[str, int]]:
+        """Return ``(ticker, row)`` pairs in sheet order, first occurrence only."""
+        return list(self._entries)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @classmethod
+    def load(cls, column: List[str], name: str, header_rows: int = 1) -> "TickerIndex":
+        """
+        Build the index and compare it with the one saved by the previous run.
+
+        The saved fingerprint tells whether the sheet's ticker column changed
+        between runs; ``index.changed`` is ``False`` when it did not.
+
+        Args:
+            column (List[str]): Column A values including header rows
+            name (str): Worksheet name used for the on-disk state file
+            header_rows (int): Number of leading header rows to skip
+
+        Returns:
+            TickerIndex: Fresh index
+        """
+        index = cls(column, header_rows=header_rows)
+        path = os.path.join(CACHE_DIR, f"ticker_index_{name}.json")
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                index.changed = json.load(f).get("fingerprint") != index.fingerprint
+        except (OSError, ValueError):
+            index.changed = True
+
+        if index.changed:
+            print(f"🔄 '{name}' 종목 목록 변경 감지 → 행 인덱스 재생성 ({len(index)}개)")
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump({"fingerprint": index.fingerprint}, f)
+            except OSError as e:
+                print(f"⚠️ 행 인덱스 저장 실패: {e}")
+
+        for key, rows in index.duplicates.items():
+            print(f"⚠️ 중복 종목 '{key}': {rows}행 → {rows[0]}행만 사용")
+
+        return index
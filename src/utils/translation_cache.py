@@ -0,0 +1,231 @@
+"""
+Persistent translation cache backed by SQLite.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from ..config.env import CACHE_DIR
+from ..config.settings import Settings
+
+# 메모리 적중의 사용 시각을 모아서 기록할 건수
+TOUCH_BATCH = 100
+
+_HANGUL_RE = re.compile(r"[가-힣]")
+_LATIN_RE = re.compile(r"[A-Za-z]")
+
+
+def is_korean(text: str) -> bool:
+    """
+    Check whether text is already mostly Korean.
+
+    Args:
+        text (str): Text to check
+
+    Returns:
+        bool: True when Hangul syllables outnumber Latin letters
+    """
+    hangul = len(_HANGUL_RE.findall(text))
+    return hangul > 0 and hangul >= len(_LATIN_RE.findall(text))
+
+
+class TranslationCache:
+    """
+    Content-addressed translation cache.
+
+    Entries are keyed by a hash of the source text, prompt version and
+    model, expire after ``ttl`` seconds and are evicted least-recently-used
+    once the table exceeds ``max_entries``. An in-memory front map of at
+    most ``max_memory`` entries serves repeated lookups without touching
+    SQLite; their use times are written in batches so the LRU eviction
+    still sees them.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = 30 * 24 * 3600,
+        max_entries: int = 20000,
+        max_memory: int = 2000
+    ):
+        """
+        Initialize translation cache.
+
+        Args:
+            path (str, optional): SQLite database path
+            ttl (float): Entry lifetime in seconds
+            max_entries (int): Maximum number of stored entries
+            max_memory (int): Maximum number of entries kept in memory
+        """
+        self.path = path or os.path.join(CACHE_DIR, "translations.sqlite3")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_memory = max(1, max_memory)
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._touched: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._db = None
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_used_at ON translations(used_at)")
+            self._db.commit()
+        return self._db
+
+    @staticmethod
+    def make_key(text: str, model: str, prompt_version: str) -> str:
+        """Hash the source text together with the prompt version and model."""
+        return hashlib.sha256(f"{model}\0{prompt_version}\0{text}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, value: str, created_at: float) -> None:
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory:
+            self._memory.popitem(last=False)
+
+    def _write_touches(self, conn: sqlite3.Connection) -> None:
+        if self._touched:
+            conn.executemany(
+                "UPDATE translations SET used_at = ? WHERE key = ?",
+                [(used_at, key) for key, used_at in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _flush_touches(self) -> None:
+        if not self._touched:
+            return
+        try:
+            conn = self._conn()
+            self._write_touches(conn)
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"⚠️ 번역 캐시 기록 실패: {e}")
+
+    def flush(self) -> None:
+        """Write the pending use times of memory hits."""
+        with self._lock:
+            self._flush_touches()
+
+    def get(self, text: str, model: str, prompt_version: str) -> Optional[str]:
+        """
+        Look up a cached translation.
+
+        Args:
+            text (str): Source text
+            model (str): Model name
+            prompt_version (str): Prompt version
+
+        Returns:
+            Optional[str]: Cached translation or None
+        """
+        key = self.make_key(text, model, prompt_version)
+        now = time.time()
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached and now - cached[1] < self.ttl:
+                self.hits += 1
+                self._memory.move_to_end(key)
+                self._touched[key] = now
+                if len(self._touched) >= TOUCH_BATCH:
+                    self._flush_touches()
+                return cached[0]
+
+            try:
+                conn = self._conn()
+                row = conn.execute(
+                    "SELECT value, created_at FROM translations WHERE key = ?", (key,)
+                ).fetchone()
+                if row and now - row[1] < self.ttl:
+                    conn.execute("UPDATE translations SET used_at = ? WHERE key = ?", (now, key))
+                    conn.commit()
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                    return row[0]
+            except sqlite3.Error as e:
+                print(f"⚠️ 번역 캐시 조회 실패: {e}")
+
+            self.misses += 1
+            return None
+
+    def put(self, text: str, model: str, prompt_version: str, value: str) -> None:
+        """
+        Store a translation and evict the least recently used entries.
+
+        Args:
+            text (str): Source text
+            model (str): Model name
+            prompt_version (str): Prompt version
+            value (str): Translated text
+        """
+        key = self.make_key(text, model, prompt_version)
+        now = time.time()
+
+        with self._lock:
+            self._remember(key, value, now)
+            self._touched.pop(key, None)
+            try:
+                conn = self._conn()
+                # 메모리 적중의 사용 시각을 먼저 반영해야 최근 항목이 밀려나지 않음
+                self._write_touches(conn)
+                conn.execute(
+                    "INSERT OR REPLACE INTO translations (key, value, created_at, used_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, value, now, now)
+                )
+                conn.execute("DELETE FROM translations WHERE created_at < ?", (now - self.ttl,))
+                conn.execute(
+                    "DELETE FROM translations WHERE key IN ("
+                    "SELECT key FROM translations ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ 번역 캐시 저장 실패: {e}")
+
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def report(self) -> str:
+        """Format a one-line cache summary."""
+        return (
+            f"🈯 번역 캐시: 적중 {self.hits} / 미적중 {self.misses} "
+            f"({self.hit_rate():.0%}), 한국어 생략 {self.skipped}"
+        )
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_translation_cache() -> TranslationCache:
+    """Return the process-wide translation cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            settings = Settings().get_translation_cache_settings()
+            _cache = TranslationCache(
+                ttl=settings["ttl_days"] * 24 * 3600,
+                max_entries=settings["max_entries"],
+                max_memory=settings["memory_entries"]
+            )
+        return _cache
@@ -2,34 +2,67 @@
 Translation utilities using Claude API.
 """
 
+import json
 import os
-from anthropic import Anthropic
+import re
+from typing import Dict, List, Optional
+
+from . import deadline
+from .llm_pool import get_llm_executor
+from .translation_cache import get_translation_cache, is_korean
+
+TRANSLATION_MODEL = "claude-3-haiku-20240307"
+# 프롬프트를 바꾸면 버전을 올려 캐시된 번역을 무효화
+PROMPT_VERSION = "v1"
+# 배치 1회 요청에 담을 원문 토큰 예산
+BATCH_TOKEN_BUDGET = int(os.getenv("TRANSLATION_BATCH_TOKENS", "3000"))
+MAX_OUTPUT_TOKENS = 4096
+
+TRANSLATION_RULES = (
+    "번역 규칙:\n"
+    "1. 핵심 내용만 한 줄로 간단히 번역하세요.\n"
+    "2. 불필요한 설명이나 부가 정보는 제외하세요.\n"
+    "3. 번역문 앞뒤로 따옴표나 기호를 붙이지 마세요.\n"
+    "4. '~이다', '~하다' 등의 문장으로 끝나지 않도록 자연스럽게 마무리하세요.\n"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate used for batch sizing."""
+    return len(text) // 3 + 8
 
 
 def translate_with_claude(text: str) -> str:
     """
     Translate text from English to Korean using Claude API.
-    
+
+    Results are cached by source text, prompt version and model, and
+    text that is already Korean is returned as-is.
+
     Args:
         text (str): English text to translate
-        
+
     Returns:
         str: Translated Korean text
     """
+    cache = get_translation_cache()
+    if is_korean(text):
+        cache.skipped += 1
+        return text.strip()
+
+    cached = cache.get(text, TRANSLATION_MODEL, PROMPT_VERSION)
+    if cached is not None:
+        return cached
+
     try:
-        client = Anthropic(api_key=os.getenv("CLAUDE_API_KEY"))
         prompt = (
             "다음 영문 텍스트를 한국어로 번역해주세요.\n"
-            "번역 규칙:\n"
-            "1. 핵심 내용만 한 줄로 간단히 번역하세요.\n"
-            "2. 불필요한 설명이나 부가 정보는 제외하세요.\n"
-            "3. 번역문 앞뒤로 따옴표나 기호를 붙이지 마세요.\n"
-            "4. '~이다', '~하다' 등의 문장으로 끝나지 않도록 자연스럽게 마무리하세요.\n\n"
+            f"{TRANSLATION_RULES}\n"
             f"{text}"
         )
-        
-        message = client.messages.create(
-            model="claude-3-haiku-20240307",
+
+        message = get_llm_executor().create_message(
+            model=TRANSLATION_MODEL,
             max_tokens=800,
             temperature=0.3,
             messages=[{
@@ -37,8 +70,135 @@ def translate_with_claude(text: str) -> str:
                 "content": prompt
             }]
         )
-        
-        return message.content[0].text.strip()
+
+        translated = message.content[0].text.strip()
+        if translated:
+            cache.put(text, TRANSLATION_MODEL, PROMPT_VERSION, translated)
+        return translated
     except Exception as e:
         print(f"Error translating with Claude: {str(e)}")
-        return "" 
\ No newline at end of file
+        return ""
+
+
+def _parse_batch_output(output: str, count: int) -> Optional[List[str]]:
+    """Parse a JSON array of ``{"id", "translation"}`` objects back into index order."""
+    match = re.search(r"\[.*\]", output, re.DOTALL)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group(0))
+        by_id = {int(entry["id"]): str(entry["translation"]).strip() for entry in data}
+    except (ValueError, TypeError, KeyError):
+        return None
+
+    results = [by_id.get(i, "") for i in range(1, count + 1)]
+    if not all(results):
+        return None
+    return results
+
+
+def _translate_chunk(texts: List[str]) -> List[str]:
+    """Translate one chunk in a single request, splitting it when the output is malformed."""
+    if len(texts) == 1:
+        return [translate_with_claude(texts[0])]
+
+    payload = json.dumps(
+        [{"id": i, "text": text} for i, text in enumerate(texts, 1)],
+        ensure_ascii=False
+    )
+    prompt = (
+        "다음 JSON 배열의 각 영문 텍스트를 한국어로 번역해주세요.\n"
+        f"{TRANSLATION_RULES}"
+        '5. 출력은 [{"id": 번호, "translation": "번역문"}] 형식의 JSON 배열만 작성하세요.\n\n'
+        f"{payload}"
+    )
+    max_tokens = min(MAX_OUTPUT_TOKENS, sum(estimate_tokens(t) for t in texts) * 2 + 200)
+
+    try:
+        message = get_llm_executor().create_message(
+            model=TRANSLATION_MODEL,
+            max_tokens=max_tokens,
+            temperature=0.3,
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        )
+        output = message.content[0].text
+    except Exception as e:
+        # API 실패 (마감 초과 포함)는 나눠서 다시 요청하지 않고 번역 없이 반환
+        print(f"Error batch translating with Claude: {str(e)}")
+        return [""] * len(texts)
+
+    results = _parse_batch_output(output, len(texts))
+    if results is None:
+        # 응답 형식이 깨지면 절반씩 나눠 다시 요청
+        mid = len(texts) // 2
+        return _translate_chunk(texts[:mid]) + _translate_chunk(texts[mid:])
+    return results
+
+
+def translate_batch(texts: List[str], token_budget: Optional[int] = None) -> List[str]:
+    """
+    Translate many texts with as few requests as possible.
+
+    Cached and already-Korean texts are resolved locally; the rest are
+    deduplicated, grouped into chunks that fit ``token_budget`` and sent
+    as numbered JSON in one request per chunk; chunks run concurrently
+    on the shared LLM executor. Results come back in the order of
+    ``texts``. When the run deadline is low, uncached texts are left
+    untranslated ("") so the originals can still be written.
+
+    Args:
+        texts (List[str]): English texts to translate
+        token_budget (int, optional): Estimated source tokens per request
+
+    Returns:
+        List[str]: Translated Korean texts
+    """
+    cache = get_translation_cache()
+    budget = token_budget or BATCH_TOKEN_BUDGET
+    resolved: Dict[str, str] = {}
+    pending: List[str] = []
+
+    for text in texts:
+        if text in resolved or text in pending:
+            continue
+        if not text.strip():
+            resolved[text] = ""
+        elif is_korean(text):
+            cache.skipped += 1
+            resolved[text] = text.strip()
+        else:
+            cached = cache.get(text, TRANSLATION_MODEL, PROMPT_VERSION)
+            if cached is not None:
+                resolved[text] = cached
+            else:
+                pending.append(text)
+
+    if pending and deadline.low():
+        # 마감 임박: 캐시에 없는 텍스트는 번역 없이 두고 원문 기록을 우선
+        print(f"⏰ 마감 임박: 번역 {len(pending)}건 생략")
+        for text in pending:
+            resolved[text] = ""
+        pending = []
+
+    chunks: List[List[str]] = []
+    used = 0
+    for text in pending:
+        tokens = estimate_tokens(text)
+        if chunks and used + tokens <= budget:
+            chunks[-1].append(text)
+            used += tokens
+        else:
+            chunks.append([text])
+            used = tokens
+
+    for chunk, results in zip(chunks, get_llm_executor().map(_translate_chunk, chunks)):
+        for text, translated in zip(chunk, results):
+            resolved[text] = translated
+            if translated:
+                cache.put(text, TRANSLATION_MODEL, PROMPT_VERSION, translated)
+
+    cache.flush()
+    return [resolved[text] for text in texts]
@@ -0,0 +1,296 @@
+"""
+Shared HTTP transport for all collectors.
+
+Requests go through one pooled session. Each one first takes a token
+from its host's shared bucket. 429 and 5xx responses and connection
+errors are retried, honouring ``Retry-After`` and otherwise using
+jittered exponential backoff. Every attempt has connect and read
+timeouts clipped to the run deadline. Failures feed the host's circuit breaker,
+and hosts in ``HEDGE_HOSTS`` get a duplicate request when the first one
+runs past the host's latency percentile.
+"""
+
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from . import deadline, metrics, resilience
+from .ratelimit import RETRY_STATUSES, backoff_delay, get_host_limiter, parse_retry_after
+from .deadline import DeadlineExceeded
+from .resilience import CircuitOpenError, get_breaker, get_latency_window, hedge_delay
+from ..config.settings import Settings
+
+try:
+    import brotli  # noqa: F401  (urllib3 decodes br when available)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "16"))
+POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+
+_RETRY = Settings().get_rate_limit_settings()
+
+_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"requests": 0, "opened": 0, "bytes": 0, "retries": 0, "hedged": 0})
+_stats_lock = threading.Lock()
+
+
+def _count(host: str, key: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[host][key] += amount
+
+
+# 연결 객체가 재연결될 때도 connect()가 호출되므로 여기서 신규 연결을 센다
+class _CountingHTTPConnection(HTTPConnection):
+    def connect(self):
+        _count(self.host, "opened")
+        return super().connect()
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        _count(self.host, "opened")
+        return super().connect()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter with keep-alive pools that counts opened connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        host = urlsplit(request.url).hostname or ""
+        started = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            metrics.inc("http_requests_total", host=host, status="error")
+            raise
+        size = len(response.content)
+        _count(host, "requests")
+        _count(host, "bytes", size)
+        metrics.observe("http_request_seconds", time.perf_counter() - started, host=host)
+        metrics.inc("http_requests_total", host=host, status=f"{response.status_code // 100}xx")
+        metrics.inc("http_response_bytes_total", size, host=host)
+        return response
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session.
+
+    Returns:
+        requests.Session: Session with per-host keep-alive connection pools
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = PooledHTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+            _session = session
+        return _session
+
+
+_hedge_pool = None
+
+
+def _hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_pool
+    with _session_lock:
+        if _hedge_pool is None:
+            # 원 요청과 중복 요청이 함께 돌 수 있도록 연결 풀의 두 배
+            _hedge_pool = ThreadPoolExecutor(max_workers=POOL_MAXSIZE * 2, thread_name_prefix="hedge")
+        return _hedge_pool
+
+
+def _send(url: str, host: str, limiter, kwargs) -> requests.Response:
+    """Send once, duplicating the request when it outlasts the host's hedge delay."""
+    delay = hedge_delay(host)
+    if delay is None:
+        return get_session().get(url, **kwargs)
+
+    pool = _hedge_executor()
+    primary = pool.submit(get_session().get, url, **kwargs)
+    done, _ = wait([primary], timeout=delay)
+    # 토큰이 없으면 중복 요청 대신 원 요청을 기다림 (속도 제한 우선)
+    if done or (limiter and not limiter.try_acquire()):
+        return primary.result()
+
+    backup = pool.submit(get_session().get, url, **kwargs)
+    _count(host, "hedged")
+    pending = {primary, backup}
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                metrics.inc("http_hedges_total", host=host, winner="hedge" if future is backup else "primary")
+                return future.result()
+            error = future.exception()
+    metrics.inc("http_hedges_total", host=host, winner="none")
+    raise error
+
+
+def get(url: str, max_retries: Optional[int] = None, **kwargs) -> requests.Response:
+    """
+    Send a rate-limited GET request through the shared session.
+
+    A 429 with ``Retry-After`` pauses every caller of the host for that
+    long. Other retryable failures back off per caller. The last
+    response is returned even when its status is still retryable.
+    5xx responses and request errors count against the host's circuit
+    breaker; while it is open the call fails fast. Each attempt gets
+    (connect, read) timeouts clipped to the current deadline, and no
+    retry is waited for when it would end past the deadline.
+
+    Args:
+        url (str): Request URL
+        max_retries (int, optional): Retries, defaults to ``HTTP_MAX_RETRIES``
+        **kwargs: Passed to ``requests.Session.get`` (``timeout`` overrides
+            ``HTTP_CONNECT_TIMEOUT`` / ``HTTP_READ_TIMEOUT``)
+
+    Returns:
+        requests.Response: Response object
+
+    Raises:
+        CircuitOpenError: The host's circuit breaker is open
+        DeadlineExceeded: The deadline passed before or during the request
+    """
+    host = urlsplit(url).hostname or ""
+    limiter = get_host_limiter(host)
+    breaker = get_breaker(host)
+    retries = _RETRY["max_retries"] if max_retries is None else max_retries
+    requested_timeout = kwargs.pop("timeout", None)
+
+    for attempt in range(retries + 1):
+        if not breaker.allow():
+            raise CircuitOpenError(f"{host} 회로 차단 중")
+        try:
+            if limiter:
+                # 마감 전에 토큰을 받을 수 없으면 기다리지 않음
+                limiter.acquire(timeout=deadline.remaining())
+            kwargs["timeout"] = deadline.http_timeout(requested_timeout)
+        except TimeoutError as e:
+            breaker.cancel()
+            if isinstance(e, DeadlineExceeded):
+                raise
+            raise DeadlineExceeded(f"{host} 요청 마감 시간 초과") from e
+        paused = False
+        started = time.perf_counter()
+        try:
+            response = _send(url, host, limiter, kwargs)
+        except requests.RequestException as e:
+            if isinstance(e, requests.Timeout) and deadline.expired():
+                # 마감에 맞춰 줄인 시간 초과는 호스트 장애로 세지 않음
+                breaker.cancel()
+                raise DeadlineExceeded(f"{host} 요청 마감 시간 초과") from e
+            breaker.record_failure()
+            wait_for = backoff_delay(attempt, _RETRY["retry_base"], _RETRY["retry_max"])
+            retryable = isinstance(e, (requests.ConnectionError, requests.Timeout))
+            if attempt == retries or not retryable or not deadline.can_wait(wait_for):
+                raise
+            reason = type(e).__name__
+        else:
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+                if response.status_code < 400:
+                    get_latency_window(host).add(time.perf_counter() - started)
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return response
+            reason = str(response.status_code)
+            wait_for = parse_retry_after(response.headers.get("Retry-After"))
+            if wait_for is None:
+                wait_for = backoff_delay(attempt, _RETRY["retry_base"], _RETRY["retry_max"])
+            else:
+                # 제한기가 없는 호스트도 HTTP_RETRY_MAX보다 오래 기다리지 않음
+                wait_for = min(wait_for, _RETRY["retry_max"])
+                paused = limiter is not None
+            if not deadline.can_wait(wait_for):
+                return response
+            if paused:
+                # 서버가 지정한 시간 동안 같은 호스트의 모든 요청을 멈춤
+                limiter.pause(wait_for)
+
+        _count(host, "retries")
+        metrics.inc("http_retries_total", host=host, reason=reason)
+        print(f"⚠️ {host} 재시도 {attempt + 1}/{retries} ({wait_for:.1f}초 후): {reason}")
+        if not paused:
+            time.sleep(wait_for)
+
+
+def fetch(url: str, **kwargs) -> bytes:
+    """
+    Fetch a URL and return the decoded body, raising on HTTP errors.
+
+    Feed collectors hand the bytes to the RSS parser so that feeds
+    share the pooled connections too.
+
+    Args:
+        url (str): Request URL
+        **kwargs: Passed to ``requests.Session.get``
+
+    Returns:
+        bytes: Response body
+    """
+    response = get(url, **kwargs)
+    response.raise_for_status()
+    return response.content
+
+
+def stats() -> Dict[str, Dict[str, int]]:
+    """Per-host request, opened/reused connection and byte counters."""
+    with _stats_lock:
+        return {
+            host: dict(counts, reused=max(0, counts["requests"] - counts["opened"]))
+            for host, counts in _stats.items()
+        }
+
+
+def report() -> str:
+    """Format a per-host connection summary."""
+    lines = ["🔌 HTTP 연결 통계 (요청 / 신규 연결 / 재사용)"]
+    for host, counts in sorted(stats().items()):
+        retries = f", 재시도 {counts['retries']}회" if counts["retries"] else ""
+        hedged = f", 중복 요청 {counts['hedged']}회" if counts["hedged"] else ""
+        lines.append(
+            f"  {host}: {counts['requests']} / {counts['opened']} / {counts['reused']}"
+            f" ({counts['bytes'] / 1024:.0f}KB{retries}{hedged})"
+        )
+    breakers = resilience.report()
+    if breakers:
+        lines.append(breakers)
+    return "\n".join(lines)